@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
 from benedict.dicts import benedict
+from benedict.dicts.io.io_cache import (
+    clear_decode_cache, get_decode_cache_stats, set_decode_cache_options, )
+from benedict.dicts.io.io_util import set_url_options
+from benedict.dicts.keypath import compile_keypath
+from benedict.serializers import set_json_backend
 from benedict.metadata import (
     __author__, __copyright__, __description__,
     __license__, __title__, __version__,
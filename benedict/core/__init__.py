@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from benedict.core.clean import clean
-from benedict.core.clone import clone
+from benedict.core.clone import clone, empty_like
 from benedict.core.dump import dump
 from benedict.core.filter import filter
 from benedict.core.find import find
@@ -10,8 +10,8 @@ from benedict.core.groupby import groupby
 from benedict.core.invert import invert
 from benedict.core.items_sorted import (
     items_sorted_by_keys, items_sorted_by_values, )
-from benedict.core.keylists import keylists
-from benedict.core.keypaths import keypaths
+from benedict.core.keylists import iter_keylists, keylists
+from benedict.core.keypaths import iter_keypaths, keypaths
 from benedict.core.match import match
 from benedict.core.merge import merge
 from benedict.core.move import move
@@ -4,7 +4,17 @@ import copy
 
 
 def clone(obj, empty=False, memo=None):
-    d = copy.deepcopy(obj, memo)
     if empty:
-        d.clear()
+        return empty_like(obj)
+    return copy.deepcopy(obj, memo)
+
+
+def empty_like(obj):
+    if callable(getattr(obj, 'empty_like', None)):
+        return obj.empty_like()
+    if type(obj) in (dict, list, set, ):
+        return type(obj)()
+    # unknown types: shallow copy (to preserve instance settings) and clear.
+    d = copy.copy(obj)
+    d.clear()
     return d
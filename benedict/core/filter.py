@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from benedict.core import clone
+from benedict.core import empty_like
 
 
 def filter(d, predicate):
     if not callable(predicate):
         raise ValueError('predicate argument must be a callable.')
-    new_dict = clone(d, empty=True)
+    new_dict = empty_like(d)
     keys = list(d.keys())
     for key in keys:
         value = d.get(key, None)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from benedict.core import clone
+from benedict.core import empty_like
 from benedict.utils import type_util
 
 
@@ -32,7 +32,7 @@ def _flatten_item(d, base_dict, base_key, separator):
 
 
 def flatten(d, separator='_'):
-    new_dict = clone(d, empty=True)
+    new_dict = empty_like(d)
     return _flatten_item(d,
                          base_dict=new_dict,
                          base_key='',
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from benedict.core import clone
+from benedict.core import empty_like
 from benedict.utils import type_util
 
 
@@ -17,7 +17,7 @@ def _invert_list(d, key, value, flat):
 
 
 def invert(d, flat=False):
-    new_dict = clone(d, empty=True)
+    new_dict = empty_like(d)
     for key, value in d.items():
         if type_util.is_list_or_tuple(value):
             _invert_list(new_dict, key, value, flat)
@@ -3,32 +3,63 @@
 from benedict.utils import type_util
 
 
-def _get_keylist_for_dict(d, parent_keys, indexes):
-    keylist = []
-    for key, value in d.items():
-        keys = parent_keys + [key]
-        keylist += [keys]
-        keylist += _get_keylist_for_value(value, keys, indexes)
-    return keylist
-
-
-def _get_keylist_for_list(l, parent_keys, indexes):
-    keylist = []
-    for key, value in enumerate(l):
-        keys = list(parent_keys)
-        keys[-1] += '[{}]'.format(key)
-        keylist += [keys]
-        keylist += _get_keylist_for_value(value, keys, indexes)
-    return keylist
-
-
-def _get_keylist_for_value(value, parent_keys, indexes):
+def _iter_items(value, parent_path, indexes, join_key, join_index):
     if type_util.is_dict(value):
-        return _get_keylist_for_dict(value, parent_keys, indexes)
-    elif type_util.is_list(value) and indexes:
-        return _get_keylist_for_list(value, parent_keys, indexes)
-    return []
+        for key, item in value.items():
+            yield (join_key(parent_path, key), item, )
+    elif type_util.is_list(value) and indexes and parent_path is not None:
+        for index, item in enumerate(value):
+            yield (join_index(parent_path, index), item, )
+
+
+def _iter_paths(d, indexes, join_key, join_index):
+    # iterative depth-first traversal, each path is built only once
+    # by joining the parent path with the current key (or index).
+    stack = [_iter_items(d, None, indexes, join_key, join_index)]
+    while stack:
+        for path, value in stack[-1]:
+            yield (path, value, )
+            if type_util.is_dict(value) or \
+                    (type_util.is_list(value) and indexes):
+                stack.append(_iter_items(
+                    value, path, indexes, join_key, join_index))
+                break
+        else:
+            stack.pop()
+
+
+def _iter_list_items(value, parent_key):
+    for index, item in enumerate(value):
+        yield ('{}[{}]'.format(parent_key, index), item, )
+
+
+def _iter_keys(d, indexes):
+    # iterative depth-first traversal, the parent keys are shared in a
+    # single list (the current path) instead of being copied for each key,
+    # the yielded list is changed by the next step, it must be copied.
+    keys = []
+    stack = [(iter(d.items() if type_util.is_dict(d) else ()), 0, )]
+    while stack:
+        items, depth = stack[-1]
+        for key, value in items:
+            del keys[depth:]
+            keys.append(key)
+            yield keys
+            if type_util.is_dict(value):
+                # dict keys are appended to the current path.
+                stack.append((iter(value.items()), depth + 1, ))
+                break
+            elif type_util.is_list(value) and indexes:
+                # list indexes replace the last key of the current path.
+                stack.append((_iter_list_items(value, key), depth, ))
+                break
+        else:
+            stack.pop()
+
+
+def iter_keylists(d, indexes=False):
+    return (tuple(keys) for keys in _iter_keys(d, indexes))
 
 
 def keylists(d, indexes=False):
-    return _get_keylist_for_value(d, [], indexes)
+    return [list(keys) for keys in _iter_keys(d, indexes)]
@@ -1,14 +1,32 @@
 # -*- coding: utf-8 -*-
 
-from benedict.core.keylists import keylists
+from benedict.core.keylists import _iter_paths
 from benedict.utils import type_util
 
 
-def keypaths(d, separator='.', indexes=False):
+def _iter_keypaths_and_values(d, separator, indexes):
+
+    def join_key(parent_keypath, key):
+        if parent_keypath is None:
+            return '{}'.format(key)
+        return '{}{}{}'.format(parent_keypath, separator, key)
+
+    def join_index(parent_keypath, index):
+        return '{}[{}]'.format(parent_keypath, index)
+
+    return _iter_paths(d, indexes, join_key, join_index)
+
+
+def iter_keypaths(d, separator='.', indexes=False):
     separator = separator or '.'
     if not type_util.is_string(separator):
         raise ValueError('separator argument must be a (non-empty) string.')
-    kls = keylists(d, indexes=indexes)
-    kps = [separator.join(['{}'.format(key) for key in kl]) for kl in kls]
-    kps.sort()
+    return (keypath for keypath, _ in _iter_keypaths_and_values(
+        d, separator, indexes))
+
+
+def keypaths(d, separator='.', indexes=False, sort=True):
+    kps = list(iter_keypaths(d, separator=separator, indexes=indexes))
+    if sort:
+        kps.sort()
     return kps
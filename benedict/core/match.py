@@ -1,23 +1,140 @@
 # -*- coding: utf-8 -*-
 
-from benedict.core.keypaths import keypaths
+from benedict.core.keypaths import _iter_keypaths_and_values
 from benedict.utils import type_util
 
 import re
 
+# glob pattern tokens: keypath separator and '*' wildcard
+# (that matches any characters except the keypath separator and brackets).
+_SEPARATOR = object()
+_WILDCARD = object()
+_WILDCARD_EXCLUDED = frozenset(['[', ']', ])
 
-def match(d, pattern, separator='.', indexes=True):
+
+def _compile_pattern(pattern, separator):
+    tokens = []
+    for index, part in enumerate(pattern.split(separator)):
+        if index > 0:
+            tokens.append(_SEPARATOR)
+        for char in part:
+            tokens.append(_WILDCARD if char == '*' else char)
+    return tokens
+
+
+def _get_closure(tokens, states):
+    # wildcards can match an empty string too
+    closure = set()
+    count = len(tokens)
+    for state in states:
+        closure.add(state)
+        while state < count and tokens[state] is _WILDCARD:
+            state += 1
+            closure.add(state)
+    return frozenset(closure)
+
+
+def _get_next_states(tokens, states, symbol):
+    next_states = set()
+    count = len(tokens)
+    for state in states:
+        if state == count:
+            continue
+        token = tokens[state]
+        if token is _WILDCARD:
+            if symbol is not _SEPARATOR and \
+                    symbol not in _WILDCARD_EXCLUDED:
+                next_states.add(state)
+        elif token is symbol or token == symbol:
+            next_states.add(state + 1)
+    return _get_closure(tokens, next_states)
+
+
+def _match_glob(d, pattern, separator, indexes):
+    """
+    Match the whole keypath against the glob pattern: '*' matches any
+    characters within a key (or an index), but not the keypath separator.
+    Walk the dict once, feeding each key (or index) to the compiled pattern
+    and pruning items whose keypath prefix can't match the pattern anymore.
+    """
+    tokens = _compile_pattern(pattern, separator)
+    final_state = len(tokens)
+    cache = {}
+
+    def feed(states, text, is_child):
+        cache_key = (states, text, is_child, )
+        if cache_key in cache:
+            return cache[cache_key]
+        next_states = states
+        if is_child:
+            next_states = _get_next_states(tokens, next_states, _SEPARATOR)
+        for index, part in enumerate(text.split(separator)):
+            if index > 0:
+                next_states = _get_next_states(
+                    tokens, next_states, _SEPARATOR)
+            for char in part:
+                if not next_states:
+                    break
+                next_states = _get_next_states(tokens, next_states, char)
+        cache[cache_key] = next_states
+        return next_states
+
+    def iter_items(value, keypath, states):
+        if type_util.is_dict(value):
+            for key, item in value.items():
+                key = '{}'.format(key)
+                yield (key if keypath is None else separator.join(
+                    [keypath, key]), item, feed(states, key, keypath is not None))
+        elif type_util.is_list(value) and indexes and keypath is not None:
+            for index, item in enumerate(value):
+                key = '[{}]'.format(index)
+                yield (keypath + key, item, feed(states, key, False))
+
+    items = []
+    stack = [iter_items(d, None, _get_closure(tokens, [0]))]
+    while stack:
+        for keypath, value, states in stack[-1]:
+            if not states:
+                # prune: no keypath starting with this keypath can match.
+                continue
+            if final_state in states:
+                items.append((keypath, value, ))
+            if type_util.is_dict(value) or \
+                    (type_util.is_list(value) and indexes):
+                stack.append(iter_items(value, keypath, states))
+                break
+        else:
+            stack.pop()
+    return items
+
+
+def _compile_regex(pattern):
+    # all indexes wildcard support
+    pattern = re.sub(r'([\*]{1})', '(.)*', pattern)
+    # escape square brackets
+    pattern = re.sub(r'(\[([^\[\]]*)\])', '\\[\\g<2>\\]', pattern)
+    return re.compile(pattern, flags=re.DOTALL)
+
+
+def _match_regex(d, regex, separator, indexes):
+    return [(keypath, value, ) for keypath, value
+            in _iter_keypaths_and_values(d, separator, indexes)
+            if regex.match(keypath)]
+
+
+def match(d, pattern, separator='.', indexes=True, with_keypaths=False,
+          glob=False):
+    separator = separator or '.'
     if type_util.is_regex(pattern):
-        regex = pattern
+        items = _match_regex(d, pattern, separator, indexes)
+    elif type_util.is_string(pattern) and glob:
+        items = _match_glob(d, pattern, separator, indexes)
     elif type_util.is_string(pattern):
-        # all indexes wildcard support
-        pattern = re.sub(r'([\*]{1})', '(.)*', pattern)
-        # escape square brackets
-        pattern = re.sub(r'(\[([^\[\]]*)\])', '\\[\\g<2>\\]', pattern)
-        regex = re.compile(pattern, flags=re.DOTALL)
+        items = _match_regex(d, _compile_regex(pattern), separator, indexes)
     else:
         raise ValueError('Expected regex or string, found: {}'.format(
             type(pattern)))
-    kps = keypaths(d, separator=separator, indexes=indexes)
-    values = [d.get(kp) for kp in kps if regex.match(kp)]
-    return values
+    items.sort(key=lambda item: item[0])
+    if with_keypaths:
+        return items
+    return [value for _, value in items]
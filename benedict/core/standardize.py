@@ -4,13 +4,12 @@ from benedict.core.rename import rename
 from benedict.core.traverse import traverse
 from benedict.utils import type_util
 
-from slugify import slugify
-
 import re
 
 
 def _standardize_item(d, key, value):
     if type_util.is_string(key):
+        from slugify import slugify
         # https://stackoverflow.com/a/12867228/2096218
         norm_key = re.sub(
             r'((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))', r'_\1', key)
@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
-from benedict.core import clone
+from benedict.core import empty_like
 from benedict.utils import type_util
 
 
 def subset(d, keys, *args):
-    new_dict = clone(d, empty=True)
+    new_dict = empty_like(d)
     if type_util.is_string(keys):
         keys = [keys]
     keys += args
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from benedict.core import clone
+from benedict.core import empty_like
 from benedict.dicts.keylist import keylist_util
 from benedict.utils import type_util
 
@@ -13,7 +13,7 @@ def _unflatten_item(key, value, separator):
 
 
 def unflatten(d, separator='_'):
-    new_dict = clone(d, empty=True)
+    new_dict = empty_like(d)
     keys = list(d.keys())
     for key in keys:
         value = d.get(key, None)
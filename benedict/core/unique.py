@@ -1,12 +1,53 @@
 # -*- coding: utf-8 -*-
 
+from benedict.utils import type_util
 
-def unique(d):
+_DICT = object()
+_LIST = object()
+_TUPLE = object()
+
+
+def _get_fingerprint(value):
+    """
+    Return a hashable fingerprint of value: equal values have equal
+    fingerprints, unhashable collections are fingerprinted structurally.
+    Raise TypeError if value (or a nested value) is not hashable.
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+    if type_util.is_dict(value):
+        return (_DICT, frozenset(
+            (key, _get_fingerprint(item)) for key, item in value.items()), )
+    elif type_util.is_list(value):
+        return (_LIST, tuple(_get_fingerprint(item) for item in value), )
+    elif type_util.is_tuple(value):
+        return (_TUPLE, tuple(_get_fingerprint(item) for item in value), )
+    elif type_util.is_set(value):
+        return frozenset(value)
+    raise TypeError('unhashable type: {}'.format(type(value)))
+
+
+def unique(d, key=None):
+    fingerprints = set()
     values = []
     keys = list(d.keys())
-    for key in keys:
-        value = d.get(key, None)
-        if value in values:
-            d.pop(key, None)
+    for k in keys:
+        value = d.get(k, None)
+        if key is not None:
+            value = key(value)
+        try:
+            fingerprint = _get_fingerprint(value)
+        except TypeError:
+            # fallback to equality check for not hashable values
+            if value in values:
+                d.pop(k, None)
+                continue
+            values.append(value)
+            continue
+        if fingerprint in fingerprints:
+            d.pop(k, None)
             continue
-        values.append(value)
+        fingerprints.add(fingerprint)
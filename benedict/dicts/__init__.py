@@ -24,6 +24,7 @@ from benedict.core import swap as _swap
 from benedict.core import traverse as _traverse
 from benedict.core import unflatten as _unflatten
 from benedict.core import unique as _unique
+from benedict.dicts.base.base_dict import init_pointer_storage
 from benedict.dicts.io import IODict
 from benedict.dicts.keylist import KeylistDict
 from benedict.dicts.keypath import KeypathDict
@@ -32,6 +33,8 @@ from benedict.dicts.parse import ParseDict
 
 class benedict(KeypathDict, IODict, ParseDict):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Constructs a new instance.
@@ -39,18 +42,20 @@ class benedict(KeypathDict, IODict, ParseDict):
         if len(args) == 1 and isinstance(args[0], benedict):
             obj = args[0]
             kwargs.setdefault('keypath_separator', obj.keypath_separator)
+            kwargs.setdefault('validate', obj.validate)
             super(benedict, self).__init__(obj.dict(), **kwargs)
             return
         super(benedict, self).__init__(*args, **kwargs)
 
     def __deepcopy__(self, memo):
-        obj = benedict(keypath_separator=self._keypath_separator)
+        obj = benedict(keypath_separator=self._keypath_separator,
+                       validate=self._validate)
         for key, value in self.items():
             obj[key] = _clone(value, memo=memo)
         return obj
 
     def __getitem__(self, key):
-        return self._cast(
+        return self._cast_view(
             super(benedict, self).__getitem__(key))
 
     def _cast(self, value):
@@ -59,11 +64,34 @@ class benedict(KeypathDict, IODict, ParseDict):
         keeping the pointer to the original dict.
         """
         if isinstance(value, dict) and not isinstance(value, benedict):
-            return benedict(value,
-                            keypath_separator=self._keypath_separator,
-                            check_keys=False)
+            return self._new_view(value)
         return value
 
+    def _cast_view(self, value):
+        """
+        Cast a child dict instance to a benedict instance (view)
+        keeping the pointer to the original dict.
+        """
+        if not isinstance(value, dict) or isinstance(value, benedict):
+            return value
+        view = self._new_view(value)
+        # a sub-tree of a validated tree is validated too.
+        view._validated = self._validated
+        return view
+
+    def _new_view(self, value):
+        """
+        Create a new benedict instance pointing to the given dict,
+        skipping the __init__ chain: keys have already been validated.
+        """
+        view = benedict.__new__(benedict)
+        view._dict = value
+        view._pointer = True
+        view._keypath_separator = self._keypath_separator
+        view._validate = self._validate
+        init_pointer_storage(view)
+        return view
+
     def clean(self, strings=True, collections=True):
         """
         Clean the current dict instance removing all empty values: None, '', {}, [], ().
@@ -127,7 +155,7 @@ class benedict(KeypathDict, IODict, ParseDict):
         return _flatten(self, separator)
 
     def get(self, key, default=None):
-        return self._cast(
+        return self._cast_view(
             super(benedict, self).get(key, default))
 
     def get_dict(self, key, default=None):
@@ -168,22 +196,32 @@ class benedict(KeypathDict, IODict, ParseDict):
         """
         return _items_sorted_by_values(self, reverse=reverse)
 
-    def keypaths(self, indexes=False):
+    def keypaths(self, indexes=False, sort=True):
         """
         Return a list of all keypaths in the dict.
         If indexes is True, the output will include list values indexes.
+        If sort is False, keypaths will be returned in traversal order.
         """
         return _keypaths(
-            self, separator=self._keypath_separator, indexes=indexes)
+            self, separator=self._keypath_separator,
+            indexes=indexes, sort=sort)
 
-    def match(self, pattern, indexes=True):
+    def match(self, pattern, indexes=True, with_keypaths=False, glob=False):
         """
         Return a list of all values whose keypath matches the given pattern (a regex or string).
         If pattern is string, wildcard can be used (eg. [*] can be used to match all list indexes).
         If indexes is True, the pattern will be matched also against list values.
-        """
-        return _match(
-            self, pattern, separator=self._keypath_separator, indexes=indexes)
+        If with_keypaths is True, a list of (keypath, value) tuples will be returned.
+        If glob is True, the string pattern must match the whole keypath and the
+        wildcard doesn't match the keypath separator and brackets (not matching subtrees are skipped).
+        """
+        results = _match(
+            self, pattern, separator=self._keypath_separator,
+            indexes=indexes, with_keypaths=with_keypaths, glob=glob)
+        if with_keypaths:
+            return [(keypath, self._cast_view(value), )
+                    for keypath, value in results]
+        return [self._cast_view(value) for value in results]
 
     def merge(self, other, *args, **kwargs):
         """
@@ -221,7 +259,7 @@ class benedict(KeypathDict, IODict, ParseDict):
         _remove(self, keys, *args)
 
     def setdefault(self, key, default=None):
-        return self._cast(
+        return self._cast_view(
             super(benedict, self).setdefault(key, default))
 
     def rename(self, key, key_new):
@@ -272,21 +310,10 @@ class benedict(KeypathDict, IODict, ParseDict):
         """
         return _unflatten(self, separator)
 
-    def unique(self):
+    def unique(self, key=None):
         """
         Remove duplicated values from the current dict instance.
+        If key function is specified, values will be compared by key(value).
         """
-        _unique(self)
-
-
-# fix benedict json dumps support - #57 #59 #61
-from json import encoder
-
-encoder.c_make_encoder = None
-
-
-# fix benedict yaml representer - #43
-from yaml import SafeDumper
-from yaml.representer import SafeRepresenter
+        _unique(self, key=key)
 
-SafeDumper.yaml_representers[benedict] = SafeRepresenter.represent_dict
@@ -1,17 +1,37 @@
 # -*- coding: utf-8 -*-
 
 
+# when used as pointer, the pointed dict items are also kept in the
+# dict storage, because C-accelerated code (eg. the json C encoder or
+# third-party encoders) reads the storage directly instead of calling
+# the overridden methods; changes made directly to the pointed dict
+# are not mirrored in the storage.
+def init_pointer_storage(d):
+    dict.clear(d)
+    # the pointed dict storage is copied as it is, without calling
+    # overridden methods (eg. lazy dicts would decode all their values).
+    dict.update(d, d._dict if type(d._dict) is dict else dict.items(d._dict))
+
+
 class BaseDict(dict):
 
-    _dict = None
-    _pointer = False
+    # __dict__ is kept, so that custom attributes can be set on instances.
+    __slots__ = ('_dict', '_pointer', '__dict__', '__weakref__', )
+
+    def __new__(cls, *args, **kwargs):
+        # slots defaults, also used when unpickling (before __setstate__).
+        obj = super(BaseDict, cls).__new__(cls, *args, **kwargs)
+        obj._dict = None
+        obj._pointer = False
+        return obj
 
     def __init__(self, *args, **kwargs):
         if len(args) == 1 and isinstance(args[0], dict):
             self._dict = args[0].dict() if issubclass(
                 type(args[0]), BaseDict) else args[0]
             self._pointer = True
-            super(BaseDict, self).__init__(self._dict)
+            super(BaseDict, self).__init__()
+            init_pointer_storage(self)
             return
         self._dict = None
         self._pointer = False
@@ -30,14 +50,22 @@ class BaseDict(dict):
     def __delitem__(self, key):
         if self._pointer:
             del self._dict[key]
+            super(BaseDict, self).pop(key, None)
             return
         super(BaseDict, self).__delitem__(key)
 
     def __eq__(self, other):
+        if isinstance(other, BaseDict):
+            other = other.dict()
         if self._pointer:
             return self._dict == other
         return super(BaseDict, self).__eq__(other)
 
+    def __ior__(self, other):
+        # python >= 3.9
+        self.update(other)
+        return self
+
     def __getitem__(self, key):
         if self._pointer:
             return self._dict[key]
@@ -53,10 +81,29 @@ class BaseDict(dict):
             return len(self._dict)
         return super(BaseDict, self).__len__()
 
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
     def __nonzero__(self):
         # python 2
         return self.__bool__()
 
+    def __or__(self, other):
+        # python >= 3.9
+        if not isinstance(other, dict):
+            return NotImplemented
+        d = self.copy()
+        d.update(other)
+        return d
+
+    def __ror__(self, other):
+        # python >= 3.9
+        if not isinstance(other, dict):
+            return NotImplemented
+        d = dict(other)
+        d.update(self.dict())
+        return d
+
     def __repr__(self):
         if self._pointer:
             return repr(self._dict)
@@ -65,9 +112,34 @@ class BaseDict(dict):
     def __setitem__(self, key, value):
         if self._pointer:
             self._dict[key] = value
+            super(BaseDict, self).__setitem__(key, value)
             return
         super(BaseDict, self).__setitem__(key, value)
 
+    def __reversed__(self):
+        # python >= 3.8
+        if self._pointer:
+            return reversed(self._dict)
+        return super(BaseDict, self).__reversed__()
+
+    def __getstate__(self):
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name not in ('__dict__', '__weakref__', ) and \
+                        hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state.update(getattr(self, '__dict__', {}))
+        return state
+
+    def __setstate__(self, state):
+        # items are restored in the dict storage before the state,
+        # the pointed dict is restored with the state.
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self._pointer:
+            init_pointer_storage(self)
+
     def __str__(self):
         if self._pointer:
             return str(self._dict)
@@ -81,6 +153,7 @@ class BaseDict(dict):
     def clear(self):
         if self._pointer:
             self._dict.clear()
+            super(BaseDict, self).clear()
             return
         super(BaseDict, self).clear()
 
@@ -116,17 +189,30 @@ class BaseDict(dict):
 
     def pop(self, key, *args):
         if self._pointer:
+            super(BaseDict, self).pop(key, None)
             return self._dict.pop(key, *args)
         return super(BaseDict, self).pop(key, *args)
 
+    def popitem(self):
+        if self._pointer:
+            key, value = self._dict.popitem()
+            super(BaseDict, self).pop(key, None)
+            return (key, value, )
+        return super(BaseDict, self).popitem()
+
     def setdefault(self, key, default=None):
         if self._pointer:
-            return self._dict.setdefault(key, default)
+            value = self._dict.setdefault(key, default)
+            super(BaseDict, self).setdefault(key, value)
+            return value
         return super(BaseDict, self).setdefault(key, default)
 
     def update(self, other):
         if self._pointer:
+            if not isinstance(other, dict):
+                other = dict(other)
             self._dict.update(other)
+            super(BaseDict, self).update(other)
             return
         super(BaseDict, self).update(other)
 
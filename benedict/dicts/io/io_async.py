@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# coroutines used by IODict async methods (python 3 only),
+# blocking network and disk I/O runs in the default executor.
+
+from benedict.dicts.io import io_util
+
+import asyncio
+import functools
+
+
+async def _run(executor, func, *args, **kwargs):
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs))
+
+
+async def _decode(cls, content, format, executor, **kwargs):
+    if executor is None:
+        return cls(content, format=format, **kwargs)
+    return await _run(executor, cls, content, format=format, **kwargs)
+
+
+def _read_bytes(s):
+    # same reader used by from_file, compressed data is decompressed
+    # (according to the file extension) while reading it.
+    with io_util.read_file_stream(s, io_util.get_compression(s)) as f:
+        return f.read()
+
+
+async def from_url(cls, url, format=None, executor=None, **kwargs):
+    format = format or io_util.autodetect_format(url) or 'json'
+    try:
+        content = await _run(None, _read_bytes, url)
+    except Exception as e:
+        raise ValueError('Invalid url argument: {}\n{}'.format(url, e))
+    return await _decode(cls, content, format, executor, **kwargs)
+
+
+async def from_file(cls, filepath, format=None, executor=None, **kwargs):
+    format = format or io_util.autodetect_format(filepath) or 'json'
+    try:
+        content = await _run(None, _read_bytes, filepath)
+    except Exception as e:
+        raise ValueError(
+            'Invalid filepath argument: {}\n{}'.format(filepath, e))
+    return await _decode(cls, content, format, executor, **kwargs)
+
+
+async def to_file(d, filepath, format=None, executor=None, **kwargs):
+    # d -> IODict instance, encoded using its to_<format> method
+    # in the same way of the sync to_file.
+    _, encode_func = d._get_encode_func(filepath, format)
+    # write options are not passed to the encoder.
+    write_options = d._pop_write_options(kwargs)
+    try:
+        if executor is None:
+            content = encode_func(**kwargs)
+        else:
+            content = await _run(executor, encode_func, **kwargs)
+        await _run(
+            None, io_util.write_file, filepath, content, **write_options)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(
+            'Invalid filepath argument or data: {}\n{}'.format(filepath, e))
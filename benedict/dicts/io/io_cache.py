@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# process-wide cache of decoded files (disabled by default),
+# see set_decode_cache_options.
+
+from benedict.dicts.io import io_util
+from benedict.serializers import get_serializer_by_format
+
+from collections import OrderedDict
+from threading import Lock
+
+import os
+import pickle
+
+
+_options = {
+    'enabled': False,
+    'max_entries': 128,
+    'max_memory': 64 * 1024 * 1024,
+}
+_cache = OrderedDict()
+_cache_lock = Lock()
+_stats = {
+    'hits': 0,
+    'misses': 0,
+    'evictions': 0,
+    'memory': 0,
+}
+
+
+def get_key(s, format, options):
+    # s -> filepath (data and urls are not cached)
+    if not _options['enabled'] or io_util.is_data(s) or io_util.is_url(s):
+        return None
+    try:
+        filepath = os.path.realpath(s)
+        stat = os.stat(filepath)
+        # format aliases (eg. 'yml' and 'yaml') use the same serializer.
+        serializer = get_serializer_by_format(format) or format
+        key = (filepath, getattr(stat, 'st_mtime_ns', stat.st_mtime),
+               stat.st_size, serializer, tuple(sorted(options.items())), )
+        hash(key)
+    except (OSError, TypeError, ValueError):
+        # not a file or options not hashable (eg. a list of columns).
+        return None
+    return key
+
+
+def get_entry(key):
+    with _cache_lock:
+        entry = _cache.pop(key, None)
+        if entry is None:
+            _stats['misses'] += 1
+            return None
+        # re-insert the entry as the most recently used.
+        _cache[key] = entry
+        _stats['hits'] += 1
+    # each hit gets its own copy, so the cached data can't be modified.
+    return pickle.loads(entry)
+
+
+def set_entry(key, data):
+    try:
+        entry = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # not picklable (eg. objects created by custom yaml constructors).
+        return
+    size = len(entry)
+    with _cache_lock:
+        if key in _cache:
+            _stats['memory'] -= len(_cache.pop(key))
+        if size > _options['max_memory']:
+            return
+        _cache[key] = entry
+        _stats['memory'] += size
+        while len(_cache) > _options['max_entries'] or \
+                _stats['memory'] > _options['max_memory']:
+            _, evicted_entry = _cache.popitem(last=False)
+            _stats['memory'] -= len(evicted_entry)
+            _stats['evictions'] += 1
+
+
+def clear_decode_cache():
+    """
+    Clear the decode cache and reset its stats.
+    """
+    with _cache_lock:
+        _cache.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+def get_decode_cache_stats():
+    """
+    Return the decode cache stats: hits, misses, evictions,
+    entries (number of cached files) and memory (size in bytes).
+    """
+    with _cache_lock:
+        stats = dict(_stats)
+        stats['entries'] = len(_cache)
+    return stats
+
+
+def set_decode_cache_options(**options):
+    """
+    Set the options of the decode cache used when decoding files:
+    - enabled: if True, decoded files are cached (by realpath, modification
+      time, size, format and decoder options), default False.
+    - max_entries: max number of cached files, default 128.
+    - max_memory: max size in bytes of the cached data, default 64 MiB.
+    Least recently used files are evicted when limits are exceeded.
+    """
+    for key in options:
+        if key not in _options:
+            raise ValueError(
+                'Invalid decode cache option: \'{}\', '
+                'expected one of: {}.'.format(key, sorted(_options.keys())))
+    with _cache_lock:
+        _options.update(options)
+    if not _options['enabled']:
+        clear_decode_cache()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# compressed files support, zstd and lz4 require optional packages:
+# zstandard and lz4 (bz2 and xz are not available on python 2).
+
+import io
+
+
+_COMPRESSIONS_EXTENSIONS = {
+    'bz2': '.bz2',
+    'gzip': '.gz',
+    'lz4': '.lz4',
+    'xz': '.xz',
+    'zstd': '.zst',
+}
+
+_COMPRESSIONS_ALIASES = {
+    'gz': 'gzip',
+    'lzma': 'xz',
+    'zst': 'zstd',
+    'zstandard': 'zstd',
+}
+
+
+def get_compression(compression):
+    compression_key = (compression or '').lower().strip()
+    compression_key = _COMPRESSIONS_ALIASES.get(
+        compression_key, compression_key)
+    if compression_key not in _COMPRESSIONS_EXTENSIONS:
+        raise ValueError(
+            'Invalid compression: \'{}\', expected one of: {}.'.format(
+                compression, sorted(_COMPRESSIONS_EXTENSIONS.keys())))
+    return compression_key
+
+
+def get_compression_by_path(path):
+    path = path.lower()
+    for compression, extension in _COMPRESSIONS_EXTENSIONS.items():
+        if path.endswith(extension):
+            return compression
+    return None
+
+
+def strip_compression_extension(path):
+    compression = get_compression_by_path(path)
+    if compression:
+        return path[:-len(_COMPRESSIONS_EXTENSIONS[compression])]
+    return path
+
+
+def compress_stream(f, compression, level=None):
+    """
+    Wrap the given binary file object and return a writable binary stream
+    that compresses data written to it, closing it doesn't close f.
+    """
+    compression = get_compression(compression)
+    if compression == 'gzip':
+        import gzip
+        return gzip.GzipFile(
+            fileobj=f, mode='wb', compresslevel=_get_level(level, 9))
+    elif compression == 'bz2':
+        import bz2
+        return bz2.BZ2File(f, mode='wb', compresslevel=_get_level(level, 9))
+    elif compression == 'xz':
+        import lzma
+        return lzma.LZMAFile(f, mode='wb', preset=level)
+    elif compression == 'zstd':
+        zstd = _import_module('zstandard', compression)
+        compressor = zstd.ZstdCompressor(level=_get_level(level, 3))
+        return compressor.stream_writer(f, closefd=False)
+    elif compression == 'lz4':
+        lz4_frame = _import_module('lz4.frame', compression)
+        return lz4_frame.LZ4FrameFile(
+            f, mode='wb', compression_level=_get_level(level, 0))
+
+
+def decompress_stream(f, compression):
+    """
+    Wrap the given binary file object and return a readable binary stream
+    that decompresses data read from it, closing it doesn't close f.
+    Concatenated streams (eg. appended data) are read until the end.
+    """
+    compression = get_compression(compression)
+    if compression == 'gzip':
+        import gzip
+        return gzip.GzipFile(fileobj=f, mode='rb')
+    elif compression == 'bz2':
+        import bz2
+        return bz2.BZ2File(f, mode='rb')
+    elif compression == 'xz':
+        import lzma
+        return lzma.LZMAFile(f, mode='rb')
+    elif compression == 'zstd':
+        zstd = _import_module('zstandard', compression)
+        decompressor = zstd.ZstdDecompressor()
+        reader = decompressor.stream_reader(
+            f, read_across_frames=True, closefd=False)
+        # buffered, so that it can be used as any other binary file object.
+        return io.BufferedReader(reader)
+    elif compression == 'lz4':
+        lz4_frame = _import_module('lz4.frame', compression)
+        return lz4_frame.LZ4FrameFile(f, mode='rb')
+
+
+def get_compressions_extensions():
+    return list(_COMPRESSIONS_EXTENSIONS.values())
+
+
+def _get_level(level, default):
+    return default if level is None else level
+
+
+def _import_module(name, compression):
+    import importlib
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ValueError(
+            'Compression \'{}\' requires the \'{}\' package.'.format(
+                compression, name.split('.')[0]))
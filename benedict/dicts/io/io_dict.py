@@ -1,24 +1,45 @@
 # -*- coding: utf-8 -*-
 
+from benedict.core import merge as _merge
 from benedict.dicts.base import BaseDict
-from benedict.dicts.io import io_util
+from benedict.dicts.io import io_cache, io_compression, io_util
 from benedict.utils import type_util
 
+import functools
+
+
+# format aliases, used to get the to_* method of a format.
+_TO_FORMATS = {
+    'b64': 'base64',
+    'ndjson': 'jsonl',
+    'qs': 'query_string',
+    'querystring': 'query_string',
+    'yml': 'yaml',
+}
+
 
 class IODict(BaseDict):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Constructs a new instance.
         """
-        # if first argument is data-string, url or filepath try to decode it.
+        # if first argument is data-string, url, filepath, bytes
+        # or file object try to decode it.
         # use 'format' kwarg to specify the decoder to use, default 'json'.
-        if len(args) == 1 and type_util.is_string(args[0]):
+        if len(args) == 1 and IODict._is_decodable(args[0]):
             d = IODict._decode_init(args[0], **kwargs)
             super(IODict, self).__init__(d)
             return
         super(IODict, self).__init__(*args, **kwargs)
 
+    @staticmethod
+    def _is_decodable(s):
+        return type_util.is_string(s) or type_util.is_bytes(s) or \
+            io_util.is_stream(s)
+
     @staticmethod
     def _decode_init(s, **kwargs):
         autodetected_format = io_util.autodetect_format(s)
@@ -32,31 +53,117 @@ class IODict(BaseDict):
     @staticmethod
     def _decode(s, format, **kwargs):
         try:
-            content = io_util.read_content(s)
-            # decode content using the given format
-            data = io_util.decode(content, format, **kwargs)
-            if type_util.is_dict(data):
-                return data
-            elif type_util.is_list(data):
-                # force list to dict
-                return {'values': data}
+            if type_util.is_string(s):
+                cache_key = io_cache.get_key(s, format, kwargs)
+                data = io_cache.get_entry(cache_key) if cache_key else None
+                if data is not None:
+                    return IODict._get_dict(data)
+                data = IODict._decode_content(s, format, **kwargs)
+                if cache_key:
+                    io_cache.set_entry(cache_key, data)
+            elif io_util.is_stream(s):
+                # file object, let the serializer read it
+                data = io_util.decode_stream(s, format, **kwargs)
             else:
-                raise ValueError(
-                    'Invalid data type: {}, expected dict or list.'.format(
-                        type(data)))
+                # bytes, no need to convert them to text
+                data = io_util.decode_bytes(s, format, **kwargs)
+            return IODict._get_dict(data)
         except Exception as e:
+            if type_util.is_bytes(s):
+                # avoid including (potentially huge) data in the message.
+                s = '<{} of length {}>'.format(type(s).__name__, len(s))
             raise ValueError(
                 'Invalid data or url or filepath argument: {}\n{}'.format(
                     s, e))
 
+    @staticmethod
+    def _decode_content(s, format, **kwargs):
+        compression = io_util.get_compression(s)
+        if compression:
+            # decompress data on the fly while decoding it.
+            with io_util.read_file_stream(s, compression) as f:
+                return io_util.decode_stream(f, format, **kwargs)
+        content = io_util.read_content(
+            s, binary=io_util.is_binary_format(format))
+        # decode content using the given format
+        if type_util.is_bytes(content):
+            return io_util.decode_bytes(content, format, **kwargs)
+        return io_util.decode(content, format, **kwargs)
+
+    @staticmethod
+    def _get_dict(data):
+        if type_util.is_dict(data):
+            return data
+        elif type_util.is_list(data):
+            # force list to dict
+            return {'values': data}
+        raise ValueError(
+            'Invalid data type: {}, expected dict or list.'.format(
+                type(data)))
+
     @staticmethod
     def _encode(d, format, **kwargs):
+        stream = kwargs.pop('stream', None)
+        if stream is not None:
+            # write directly to the given file object.
+            io_util.encode_stream(d, stream, format, **kwargs)
+            return None
         filepath = kwargs.pop('filepath', None)
+        write_options = IODict._pop_write_options(kwargs)
         s = io_util.encode(d, format, **kwargs)
         if filepath:
-            io_util.write_file(filepath, s)
+            io_util.write_file(filepath, s, **write_options)
         return s
 
+    def _get_encode_func(self, filepath, format):
+        """
+        Get the format (autodetected by filepath extension if not specified)
+        and the to_<format> method used to encode the current instance.
+        """
+        format = (format or io_util.autodetect_format(filepath) or 'json')
+        format = _TO_FORMATS.get(format.lower(), format.lower())
+        encode_func = getattr(self, 'to_{}'.format(format), None)
+        if format == 'file' or not encode_func:
+            raise ValueError('Invalid format: {}.'.format(format))
+        return (format, encode_func, )
+
+    @staticmethod
+    def _pop_write_options(kwargs):
+        return {
+            'append': kwargs.pop('append', False),
+            'atomic': kwargs.pop('atomic', True),
+            'buffer_size': kwargs.pop('buffer_size', None),
+            'fsync': kwargs.pop('fsync', True),
+            'compression': kwargs.pop('compression', None),
+            'compression_level': kwargs.pop('compression_level', None),
+        }
+
+    @classmethod
+    def afrom_file(cls, filepath, format=None, executor=None, **kwargs):
+        """
+        Coroutine, load and decode data from filepath without blocking the event loop,
+        if format is not specified it is autodetected by file extension.
+        If executor is specified, data is decoded using it (eg. a process pool for big files),
+        otherwise it is decoded in the event loop thread.
+        Decoder specific options can be passed using kwargs.
+        Return a new dict instance. A ValueError is raised in case of failure.
+        """
+        from benedict.dicts.io import io_async
+        return io_async.from_file(cls, filepath, format, executor, **kwargs)
+
+    @classmethod
+    def afrom_url(cls, url, format=None, executor=None, **kwargs):
+        """
+        Coroutine, load and decode data from url without blocking the event loop,
+        if format is not specified it is autodetected by url extension.
+        If executor is specified, data is decoded using it (eg. a process pool for big payloads),
+        otherwise it is decoded in the event loop thread.
+        Decoder specific options can be passed using kwargs.
+        Return a new dict instance. A ValueError is raised in case of failure.
+        """
+        from benedict.dicts.io import io_async
+        return io_async.from_url(cls, url, format, executor, **kwargs)
+
     @classmethod
     def from_base64(cls, s, subformat='json', encoding='utf-8', **kwargs):
         """
@@ -69,6 +176,16 @@ class IODict(BaseDict):
         kwargs['encoding'] = encoding
         return cls(s, format='base64', **kwargs)
 
+    @classmethod
+    def from_cbor(cls, s, **kwargs):
+        """
+        Load and decode CBOR data from url, filepath or bytes.
+        Decoder specific options can be passed using kwargs:
+        https://cbor2.readthedocs.io/
+        Return a new dict instance. A ValueError is raised in case of failure.
+        """
+        return cls(s, format='cbor', **kwargs)
+
     @classmethod
     def from_csv(cls, s, columns=None, columns_row=True, **kwargs):
         """
@@ -81,6 +198,54 @@ class IODict(BaseDict):
         kwargs['columns_row'] = columns_row
         return cls(s, format='csv', **kwargs)
 
+    @classmethod
+    def iter_csv(cls, s, columns=None, columns_row=True, cast=False, **kwargs):
+        """
+        Read CSV data incrementally from filepath or file object
+        and yield rows one by one, without loading the whole file in memory.
+        If cast is True, each row will be yielded as a new dict instance.
+        Decoder specific options can be passed using kwargs:
+        https://docs.python.org/3/library/csv.html
+        """
+        kwargs['columns'] = columns
+        kwargs['columns_row'] = columns_row
+        rows = io_util.iter_decode(s, 'csv', **kwargs)
+        for row in rows:
+            yield (cls(row) if cast else row)
+
+    @classmethod
+    def from_bytes(cls, b, format='json', **kwargs):
+        """
+        Decode bytes data using the given format without converting
+        them to a string first (when supported by the decoder).
+        Decoder specific options can be passed using kwargs.
+        Return a new dict instance. A ValueError is raised in case of failure.
+        """
+        return cls(b, format=format, **kwargs)
+
+    @classmethod
+    def from_file(cls, filepath, format=None, **kwargs):
+        """
+        Load and decode data from filepath using the given format,
+        if format is not specified it is autodetected by file extension.
+        The file is opened in binary mode and passed to the decoder,
+        compressed files (eg. 'data.json.gz') are decompressed on the fly.
+        Decoder specific options can be passed using kwargs.
+        Return a new dict instance. A ValueError is raised in case of failure.
+        """
+        format = format or io_util.autodetect_format(filepath) or 'json'
+        try:
+            f = io_util.open_file(filepath, 'rb')
+        except (IOError, OSError) as e:
+            raise ValueError(
+                'Invalid filepath argument: {}\n{}'.format(filepath, e))
+        with f:
+            compression = io_compression.get_compression_by_path(filepath)
+            if compression:
+                with io_compression.decompress_stream(f, compression) as stream:
+                    return cls(stream, format=format, **kwargs)
+            return cls(f, format=format, **kwargs)
+
     @classmethod
     def from_ini(cls, s, **kwargs):
         """
@@ -92,20 +257,111 @@ class IODict(BaseDict):
         return cls(s, format='ini', **kwargs)
 
     @classmethod
-    def from_json(cls, s, **kwargs):
+    def from_json(cls, s, mmap=False, lazy=False, **kwargs):
         """
         Load and decode JSON data from url, filepath or data-string.
+        If mmap is True, s must be a filepath: the file is memory-mapped and decoded
+        from the mapped bytes (useful for very large files), only if the json backend
+        decodes bytes directly (orjson), otherwise the file is read as usual.
+        If lazy is True, values are decoded on first access (only first level
+        keys are validated), if it is an int nested objects up to that depth
+        are decoded lazily too; 'to_json' writes untouched values verbatim.
         Decoder specific options can be passed using kwargs:
         https://docs.python.org/3/library/json.html
         Return a new dict instance. A ValueError is raised in case of failure.
         """
+        if lazy:
+            kwargs['lazy'] = lazy
+        serializer = io_util.get_serializer_by_format('json')
+        if mmap and serializer.can_decode_bytes(**kwargs):
+            try:
+                with io_util.mmap_file(s) as b:
+                    return cls(b, format='json', **kwargs)
+            except (IOError, OSError) as e:
+                raise ValueError(
+                    'Invalid filepath argument: {}\n{}'.format(s, e))
         return cls(s, format='json', **kwargs)
 
     @classmethod
-    def from_pickle(cls, s, **kwargs):
+    def from_jsonl(cls, s, **kwargs):
+        """
+        Load and decode JSON Lines (NDJSON) data from url, filepath or data-string.
+        Decoded lines are stored as list at the 'values' key.
+        Decoder specific options can be passed using kwargs:
+        https://docs.python.org/3/library/json.html
+        Return a new dict instance. A ValueError is raised in case of failure.
+        """
+        return cls(s, format='jsonl', **kwargs)
+
+    @classmethod
+    def iter_jsonl(cls, s, cast=False, workers=None, chunk_size=None,
+                   **kwargs):
+        """
+        Read JSON Lines (NDJSON) data incrementally from filepath or file object
+        and yield decoded lines one by one, without loading the whole file in memory.
+        If cast is True, each decoded dict will be yielded as a new dict instance.
+        If workers is specified and s is a filepath, the file is split in chunks
+        of about chunk_size bytes decoded in parallel by workers processes.
+        Decoder specific options can be passed using kwargs:
+        https://docs.python.org/3/library/json.html
+        """
+        if workers and not io_util.is_stream(s):
+            items = io_util.iter_decode_parallel(
+                s, 'jsonl', workers, chunk_size=chunk_size, **kwargs)
+        else:
+            items = io_util.iter_decode(s, 'jsonl', **kwargs)
+        for item in items:
+            yield (cls(item) if cast and type_util.is_dict(item) else item)
+
+    @classmethod
+    def load_many(cls, paths, merge=True, workers=None, processes=False,
+                  overwrite=True, concat=False, **kwargs):
+        """
+        Load and decode data from many filepaths (or urls) concurrently,
+        the format of each file is autodetected by its extension.
+        If workers is specified, files are decoded by a pool of threads
+        (or processes if processes is True, useful for cpu-bound decoders).
+        If merge is True, decoded data is merged in the same order of paths
+        using overwrite and concat options (see 'merge') and a new dict
+        instance is returned, otherwise a list of dict instances is returned.
+        Decoder specific options can be passed using kwargs.
+        A ValueError is raised in case of failure.
         """
-        Load and decode a pickle encoded in Base64 format data from url, filepath or data-string.
+        paths = list(paths)
+        decode_func = functools.partial(IODict._decode_init, **kwargs)
+        if workers and workers > 1 and len(paths) > 1:
+            from concurrent.futures import (
+                ProcessPoolExecutor, ThreadPoolExecutor, )
+            executor_class = ProcessPoolExecutor if processes \
+                else ThreadPoolExecutor
+            with executor_class(max_workers=workers) as executor:
+                # results are returned in the same order of paths.
+                items = list(executor.map(decode_func, paths))
+        else:
+            items = [decode_func(path) for path in paths]
+        if not merge:
+            return [cls(item) for item in items]
+        d = {}
+        for item in items:
+            _merge(d, item, overwrite=overwrite, concat=concat)
+        return cls(d)
+
+    @classmethod
+    def from_msgpack(cls, s, **kwargs):
+        """
+        Load and decode MessagePack data from url, filepath or bytes.
         Decoder specific options can be passed using kwargs:
+        https://msgpack-python.readthedocs.io/
+        Return a new dict instance. A ValueError is raised in case of failure.
+        """
+        return cls(s, format='msgpack', **kwargs)
+
+    @classmethod
+    def from_pickle(cls, s, **kwargs):
+        """
+        Load and decode a pickle encoded in Base64 format data from url, filepath or data-string,
+        raw pickle data can be loaded from url, filepath, bytes or file object.
+        Decoder specific options can be passed using kwargs (eg. out-of-band 'buffers'):
         https://docs.python.org/3/library/pickle.html
         Return a new dict instance. A ValueError is raised in case of failure.
         """
@@ -129,6 +385,17 @@ class IODict(BaseDict):
         """
         return cls(s, format='query_string', **kwargs)
 
+    @classmethod
+    def from_stream(cls, f, format=None, **kwargs):
+        """
+        Read and decode data from a file object using the given format,
+        if format is not specified it is autodetected by the file name.
+        Decoder specific options can be passed using kwargs.
+        Return a new dict instance. A ValueError is raised in case of failure.
+        """
+        format = format or io_util.autodetect_format(f) or 'json'
+        return cls(f, format=format, **kwargs)
+
     @classmethod
     def from_toml(cls, s, **kwargs):
         """
@@ -149,6 +416,21 @@ class IODict(BaseDict):
         """
         return cls(s, format='xml', **kwargs)
 
+    @classmethod
+    def iter_xml(cls, s, item_path, cast=False, **kwargs):
+        """
+        Read XML data incrementally from filepath or file object and yield
+        the items at item_path (eg. 'feed.record') one by one, without loading
+        the whole document in memory.
+        If cast is True, each dict item will be yielded as a new dict instance.
+        Decoder specific options can be passed using kwargs:
+        https://github.com/martinblech/xmltodict
+        """
+        kwargs['item_path'] = item_path
+        items = io_util.iter_decode(s, 'xml', **kwargs)
+        for item in items:
+            yield (cls(item) if cast and type_util.is_dict(item) else item)
+
     @classmethod
     def from_yaml(cls, s, **kwargs):
         """
@@ -159,6 +441,68 @@ class IODict(BaseDict):
         """
         return cls(s, format='yaml', **kwargs)
 
+    @classmethod
+    def from_yaml_all(cls, s, **kwargs):
+        """
+        Load and decode a multi-document YAML stream from url, filepath,
+        data-string or file object and yield a new dict instance for each document,
+        documents are read one by one from filepath and file object.
+        Decoder specific options can be passed using kwargs:
+        https://pyyaml.org/wiki/PyYAMLDocumentation
+        A ValueError is raised in case of failure.
+        """
+        try:
+            for data in io_util.iter_decode(s, 'yaml', **kwargs):
+                if data is None:
+                    # empty document
+                    continue
+                yield cls(IODict._get_dict(data))
+        except Exception as e:
+            raise ValueError(
+                'Invalid data or url or filepath argument: {}\n{}'.format(
+                    s, e))
+
+    def ato_file(self, filepath, format=None, executor=None, **kwargs):
+        """
+        Coroutine, encode the current dict instance and save it at filepath
+        without blocking the event loop, if format is not specified
+        it is autodetected by file extension.
+        If executor is specified, data is encoded using it,
+        otherwise it is encoded in the event loop thread.
+        Write options (atomic, buffer_size, fsync, compression, compression_level)
+        are the same of to_file, encoder specific options can be passed using kwargs.
+        A ValueError is raised in case of failure.
+        """
+        from benedict.dicts.io import io_async
+        return io_async.to_file(
+            self, filepath, format, executor, **kwargs)
+
+    def to_file(self, filepath, format=None, atomic=True, buffer_size=None,
+                fsync=True, compression=None, compression_level=None,
+                **kwargs):
+        """
+        Encode the current dict instance and write it directly to filepath
+        (without building the whole encoded string in memory),
+        if format is not specified it is autodetected by file extension.
+        If atomic is True, data is written to a temporary file that replaces
+        filepath only when completely written, buffer_size is the size
+        of the file buffer and if fsync is False data is not flushed to disk
+        before returning (faster, eg. for temporary output).
+        If compression ('gzip', 'bz2', 'xz', 'zstd', 'lz4') is None it is
+        autodetected by file extension (eg. 'data.json.gz'), compression_level
+        defaults to the compression library default.
+        Encoder specific options can be passed using kwargs.
+        A ValueError is raised in case of failure.
+        """
+        format, encode_func = self._get_encode_func(filepath, format)
+        binary = io_util.is_binary_format(format)
+        with io_util.write_file_stream(
+                filepath, binary=binary, append=kwargs.pop('append', False),
+                atomic=atomic, buffer_size=buffer_size, fsync=fsync,
+                compression=compression,
+                compression_level=compression_level) as f:
+            encode_func(stream=f, **kwargs)
+
     def to_base64(self, subformat='json', encoding='utf-8', **kwargs):
         """
         Encode the current dict instance in Base64 format
@@ -171,12 +515,24 @@ class IODict(BaseDict):
         kwargs['encoding'] = encoding
         return self._encode(self.dict(), 'base64', **kwargs)
 
+    def to_cbor(self, **kwargs):
+        """
+        Encode the current dict instance in CBOR format.
+        Encoder specific options can be passed using kwargs:
+        https://cbor2.readthedocs.io/
+        Return the encoded bytes and optionally save them at 'filepath'.
+        A ValueError is raised in case of failure.
+        """
+        return self._encode(self.dict(), 'cbor', **kwargs)
+
     def to_csv(self, key='values', columns=None, columns_row=True, **kwargs):
         """
         Encode a list of dicts in the current dict instance in CSV format.
         Encoder specific options can be passed using kwargs:
         https://docs.python.org/3/library/csv.html
         Return the encoded string and optionally save it at 'filepath'.
+        If 'stream' file object is passed, rows are written to it one by one
+        (the value at key can be any iterable of dicts) and None is returned.
         A ValueError is raised in case of failure.
         """
         kwargs['columns'] = columns
@@ -203,15 +559,40 @@ class IODict(BaseDict):
         """
         return self._encode(self.dict(), 'json', **kwargs)
 
-    def to_pickle(self, **kwargs):
+    def to_jsonl(self, key='values', **kwargs):
+        """
+        Encode a list of values in the current dict instance in JSON Lines format.
+        Encoder specific options can be passed using kwargs:
+        https://docs.python.org/3/library/json.html
+        Return the encoded string and optionally save it at 'filepath',
+        if 'append' is True lines are appended to the existing file.
+        If 'stream' file object is passed, lines are written to it one by one
+        (the value at key can be any iterable) and None is returned.
+        A ValueError is raised in case of failure.
+        """
+        return self._encode(self.dict()[key], 'jsonl', **kwargs)
+
+    def to_msgpack(self, **kwargs):
         """
-        Encode the current dict instance as pickle (encoded in Base64).
-        The pickle protocol used by default is 2.
+        Encode the current dict instance in MessagePack format.
         Encoder specific options can be passed using kwargs:
+        https://msgpack-python.readthedocs.io/
+        Return the encoded bytes and optionally save them at 'filepath'.
+        A ValueError is raised in case of failure.
+        """
+        return self._encode(self.dict(), 'msgpack', **kwargs)
+
+    def to_pickle(self, raw=False, **kwargs):
+        """
+        Encode the current dict instance as pickle (encoded in Base64),
+        if raw is True the pickle bytes are returned without encoding them.
+        The pickle protocol used by default is the highest available (2 on python 2).
+        Encoder specific options can be passed using kwargs (eg. 'buffer_callback'):
         https://docs.python.org/3/library/pickle.html
-        Return the encoded string and optionally save it at 'filepath'.
+        Return the encoded string (or bytes) and optionally save it at 'filepath'.
         A ValueError is raised in case of failure.
         """
+        kwargs['raw'] = raw
         return self._encode(self.dict(), 'pickle', **kwargs)
 
     def to_plist(self, **kwargs):
@@ -248,6 +629,8 @@ class IODict(BaseDict):
         Encoder specific options can be passed using kwargs:
         https://github.com/martinblech/xmltodict
         Return the encoded string and optionally save it at 'filepath'.
+        If 'stream' file object is passed, data is written to it incrementally
+        (list values can be any iterable, eg. a generator) and None is returned.
         A ValueError is raised in case of failure.
         """
         return self._encode(self.dict(), 'xml', **kwargs)
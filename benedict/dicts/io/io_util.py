@@ -1,17 +1,65 @@
 # -*- coding: utf-8 -*-
 
+from benedict.dicts.io import io_compression
 from benedict.serializers import (
     get_format_by_path, get_serializer_by_format, get_serializers_extensions, )
+from benedict.utils import type_util
 
-import fsutil
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from six import StringIO
+from threading import Lock
+
+# fsutil (and requests) are imported only when file-system
+# or network operations are actually needed.
+
+
+# strings longer than this can't be an url or a filepath.
+PATH_MAX_LENGTH = 4096
+
+# options used to read urls, see set_url_options.
+_url_options = {
+    'cache': True,
+    'cache_dir': None,
+    'max_size': None,
+    'timeout': 30,
+}
+_url_cache = OrderedDict()
+_url_cache_lock = Lock()
+_url_cache_maxsize = 128
+# max total size in bytes of the contents kept in the in-memory url cache,
+# bigger contents are not kept in memory (only in cache_dir, if any).
+_url_cache_maxbytes = 32 * 1024 * 1024
+_url_cache_bytes = 0
+_url_session = None
 
 
 def autodetect_format(s):
+    if is_stream(s):
+        name = getattr(s, 'name', None)
+        if type_util.is_string(name):
+            return _get_format_by_path(name)
+        return None
+    if not type_util.is_string(s):
+        return None
     if is_url(s) or is_filepath(s):
-        return get_format_by_path(s)
+        return _get_format_by_path(s)
     return None
 
 
+def _get_format_by_path(path):
+    # compression extension is ignored, eg. 'data.json.gz' -> 'json'.
+    return get_format_by_path(
+        io_compression.strip_compression_extension(path))
+
+
+def get_compression(s):
+    # s -> filepath or url or data
+    if is_data(s) or not (is_url(s) or is_filepath(s)):
+        return None
+    return io_compression.get_compression_by_path(s)
+
+
 def decode(s, format, **kwargs):
     serializer = get_serializer_by_format(format)
     if not serializer:
@@ -21,6 +69,22 @@ def decode(s, format, **kwargs):
     return data
 
 
+def decode_bytes(b, format, **kwargs):
+    serializer = get_serializer_by_format(format)
+    if not serializer:
+        raise ValueError('Invalid format: {}.'.format(format))
+    data = serializer.decode_bytes(b, **kwargs)
+    return data
+
+
+def decode_stream(f, format, **kwargs):
+    serializer = get_serializer_by_format(format)
+    if not serializer:
+        raise ValueError('Invalid format: {}.'.format(format))
+    data = serializer.decode_stream(f, **kwargs)
+    return data
+
+
 def encode(d, format, **kwargs):
     serializer = get_serializer_by_format(format)
     if not serializer:
@@ -29,45 +93,437 @@ def encode(d, format, **kwargs):
     return s
 
 
+def encode_stream(d, f, format, **kwargs):
+    serializer = get_serializer_by_format(format)
+    if not serializer:
+        raise ValueError('Invalid format: {}.'.format(format))
+    serializer.encode_stream(d, f, **kwargs)
+
+
+def iter_decode(s, format, **kwargs):
+    # s -> filepath or file object or url or data
+    serializer = get_serializer_by_format(format)
+    if not hasattr(serializer, 'iter_decode'):
+        raise ValueError('Invalid format: {}.'.format(format))
+    # return a generator, errors above are raised immediately.
+    return _iter_decode(serializer, s, **kwargs)
+
+
+def iter_decode_parallel(filepath, format, workers, **kwargs):
+    # filepath -> split in chunks decoded by workers processes
+    serializer = get_serializer_by_format(format)
+    if not hasattr(serializer, 'iter_decode_file'):
+        raise ValueError('Invalid format: {}.'.format(format))
+    return serializer.iter_decode_file(filepath, workers=workers, **kwargs)
+
+
+def _iter_decode(serializer, s, **kwargs):
+    encoding = kwargs.pop('encoding', 'utf-8')
+    if hasattr(s, 'read'):
+        for item in serializer.iter_decode(s, **kwargs):
+            yield item
+        return
+    compression = get_compression(s)
+    if compression:
+        # decompressed data is decoded on the fly.
+        import io
+        with read_file_stream(s, compression) as f:
+            w = io.TextIOWrapper(f, encoding=encoding, newline='')
+            for item in serializer.iter_decode(w, **kwargs):
+                yield item
+        return
+    if is_data(s) or is_url(s) or not is_filepath(s):
+        # url or data, content is read in memory.
+        f = StringIO(read_content(s))
+        for item in serializer.iter_decode(f, **kwargs):
+            yield item
+        return
+    with open_file(s, 'r', encoding=encoding) as f:
+        for item in serializer.iter_decode(f, **kwargs):
+            yield item
+
+
+def is_binary_format(format):
+    serializer = get_serializer_by_format(format)
+    return bool(serializer and serializer.binary)
+
+
 def is_data(s):
+    if len(s) > PATH_MAX_LENGTH:
+        # too long to be an url or a filepath, avoid splitting it.
+        return True
     return (len(s.splitlines()) > 1)
 
 
 def is_filepath(s):
-    if any([s.endswith(ext) for ext in get_serializers_extensions()]):
+    path = io_compression.strip_compression_extension(s)
+    if path.endswith(tuple(get_serializers_extensions())):
         return True
+    import fsutil
     return fsutil.is_file(s)
 
 
+def is_stream(s):
+    return hasattr(s, 'read')
+
+
 def is_url(s):
-    return any([s.startswith(protocol)
-                for protocol in ['http://', 'https://']])
+    return s.startswith(('http://', 'https://', ))
+
+
+@contextmanager
+def mmap_file(filepath):
+    """
+    Memory-map the file at filepath (read-only) and yield a memoryview
+    of its content, the mapping is released when the context exits.
+    """
+    import mmap
+    import os
+    with open_file(filepath, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            # empty files can't be mapped.
+            yield memoryview(b'')
+            return
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            view = memoryview(m)
+            try:
+                yield view
+            finally:
+                view.release()
+        finally:
+            m.close()
 
 
-def read_content(s):
+def open_file(filepath, mode='r', encoding='utf-8'):
+    import io
+    if 'b' in mode:
+        return io.open(filepath, mode)
+    return io.open(filepath, mode, encoding=encoding, newline='')
+
+
+def read_content(s, binary=False):
     # s -> filepath or url or data
+    # if binary is True, url and filepath content is returned as bytes.
     if is_data(s):
         # data
         return s
     elif is_url(s):
         # url
-        return read_url(s)
+        return read_url_bytes(s) if binary else read_url(s)
     elif is_filepath(s):
         # filepath
-        return read_file(s)
+        return read_file_bytes(s) if binary else read_file(s)
     # one-line data?!
     return s
 
 
 def read_file(filepath, **options):
+    import fsutil
     if fsutil.is_file(filepath):
         return fsutil.read_file(filepath, **options)
     return None
 
 
+def read_file_bytes(filepath):
+    import fsutil
+    if fsutil.is_file(filepath):
+        with open_file(filepath, 'rb') as f:
+            return f.read()
+    return None
+
+
+@contextmanager
+def read_file_stream(s, compression=None):
+    """
+    Open the given filepath or url for reading and yield a binary
+    file object, if compression is specified data is decompressed
+    on the fly (url content is downloaded in memory first).
+    """
+    if is_url(s):
+        import io
+        f = io.BytesIO(read_url_bytes(s))
+    else:
+        f = open_file(s, 'rb')
+    with f:
+        if not compression:
+            yield f
+            return
+        with io_compression.decompress_stream(f, compression) as stream:
+            yield stream
+
+
 def read_url(url, **options):
-    return fsutil.read_file_from_url(url, **options)
+    content, encoding = _read_url(url, **options)
+    return content.decode(encoding)
+
+
+def read_url_bytes(url, **options):
+    content, encoding = _read_url(url, **options)
+    return content
+
+
+def _read_url(url, **options):
+    """
+    Read the content of the given url using the shared session and return
+    (content, encoding), unchanged content is read from the cache (304).
+    Options are passed to requests, except for the url options
+    (see set_url_options) that can be overridden for a single request.
+    """
+    cache = options.pop('cache', _url_options['cache'])
+    max_size = options.pop('max_size', _url_options['max_size'])
+    options.setdefault('timeout', _url_options['timeout'])
+    headers = dict(options.pop('headers', None) or {})
+    entry = _get_url_cache_entry(url) if cache else None
+    if entry:
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+    response = _get_url_session().get(
+        url, headers=headers, stream=True, **options)
+    with closing(response):
+        if entry and response.status_code == 304:
+            return (entry['content'], entry['encoding'], )
+        response.raise_for_status()
+        content = _read_url_response(response, max_size)
+    encoding = response.encoding or 'utf-8'
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if cache and (etag or last_modified):
+        _set_url_cache_entry(url, {
+            'content': content,
+            'encoding': encoding,
+            'etag': etag,
+            'last_modified': last_modified,
+        })
+    return (content, encoding, )
+
+
+def _read_url_response(response, max_size):
+    if max_size:
+        size = int(response.headers.get('Content-Length') or 0)
+        if size > max_size:
+            raise ValueError(
+                'Response size {} exceeds max size {}.'.format(size, max_size))
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(65536):
+        # size is checked while reading, content-length could be missing.
+        size += len(chunk)
+        if max_size and size > max_size:
+            raise ValueError(
+                'Response size exceeds max size {}.'.format(max_size))
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def _get_url_session():
+    global _url_session
+    if _url_session is None:
+        import requests
+        # connections are kept alive and reused between requests.
+        _url_session = requests.Session()
+    return _url_session
+
+
+def _get_url_cache_entry(url):
+    with _url_cache_lock:
+        entry = _url_cache.get(url)
+        if entry:
+            return entry
+    cache_dir = _url_options['cache_dir']
+    if not cache_dir:
+        return None
+    import json
+    filepath = _get_url_cache_filepath(url)
+    try:
+        with open_file('{}.json'.format(filepath), 'r') as f:
+            entry = json.load(f)
+        entry['content'] = read_file_bytes(filepath)
+    except (IOError, OSError, ValueError):
+        return None
+    if entry['content'] is None or entry.get('url') != url:
+        return None
+    _add_url_cache_entry(url, entry)
+    return entry
+
+
+def _add_url_cache_entry(url, entry):
+    # add the entry to the in-memory cache, evicting the oldest entries
+    # when the max number of entries or the max total size is exceeded.
+    global _url_cache_bytes
+    size = len(entry['content'])
+    with _url_cache_lock:
+        old_entry = _url_cache.pop(url, None)
+        if old_entry:
+            _url_cache_bytes -= len(old_entry['content'])
+        if size > _url_cache_maxbytes:
+            return
+        _url_cache[url] = entry
+        _url_cache_bytes += size
+        while len(_url_cache) > _url_cache_maxsize or \
+                _url_cache_bytes > _url_cache_maxbytes:
+            _, old_entry = _url_cache.popitem(last=False)
+            _url_cache_bytes -= len(old_entry['content'])
+
+
+def _set_url_cache_entry(url, entry):
+    _add_url_cache_entry(url, entry)
+    cache_dir = _url_options['cache_dir']
+    if not cache_dir:
+        return
+    import json
+    filepath = _get_url_cache_filepath(url)
+    metadata = dict(entry, url=url)
+    metadata.pop('content')
+    # content is written before metadata, entries without it are ignored.
+    write_file(filepath, entry['content'], fsync=False)
+    write_file('{}.json'.format(filepath), json.dumps(metadata), fsync=False)
+
+
+def _get_url_cache_filepath(url):
+    import hashlib
+    import os
+    filename = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(_url_options['cache_dir'], filename)
+
+
+def clear_url_cache():
+    """
+    Clear the in-memory url cache (the on-disk cache is not deleted).
+    """
+    global _url_cache_bytes
+    with _url_cache_lock:
+        _url_cache.clear()
+        _url_cache_bytes = 0
+
+
+def set_url_options(**options):
+    """
+    Set the options used to read urls:
+    - cache: if True (default), responses with ETag or Last-Modified headers
+      are cached and conditional requests are made to check if they changed.
+    - cache_dir: directory where cached responses are stored, default None
+      (responses are cached in memory only).
+    - max_size: max response size in bytes, default None (no limit).
+    - timeout: requests timeout in seconds, default 30.
+    """
+    for key in options:
+        if key not in _url_options:
+            raise ValueError(
+                'Invalid url option: \'{}\', expected one of: {}.'.format(
+                    key, sorted(_url_options.keys())))
+    _url_options.update(options)
 
 
 def write_file(filepath, content, **options):
-    fsutil.write_file(filepath, content, **options)
+    # options -> append, atomic, buffer_size, fsync,
+    # compression, compression_level (see write_file_stream)
+    binary = type_util.is_bytes(content)
+    with write_file_stream(filepath, binary=binary, **options) as f:
+        f.write(content)
+
+
+@contextmanager
+def write_file_stream(filepath, binary=False, append=False,
+                      atomic=True, buffer_size=None, fsync=True,
+                      compression=None, compression_level=None):
+    """
+    Open filepath for writing and yield the (buffered) file object.
+    If atomic is True, data is written to a temporary file in the same
+    directory that replaces filepath only when the context exits without
+    errors (appending is never atomic).
+    If fsync is True, data is flushed to disk before the file is closed.
+    If compression is None it is autodetected by file extension,
+    if it is False data is not compressed.
+    """
+    import fsutil
+    import os
+    filepath = os.path.realpath(filepath)
+    fsutil.make_dirs_for_file(filepath)
+    mode = '{}{}'.format('a' if append else 'w', 'b' if binary else '')
+    options = {
+        'buffering': -1 if buffer_size is None else buffer_size,
+        'fsync': fsync,
+        'compression': io_compression.get_compression_by_path(filepath)
+        if compression is None else compression,
+        'compression_level': compression_level,
+    }
+    if append or not atomic:
+        with _open_file_for_writing(filepath, mode, **options) as f:
+            yield f
+        return
+    import uuid
+    dirpath, filename = os.path.split(filepath)
+    temp_filepath = os.path.join(dirpath, '.{}.{}.tmp'.format(
+        filename, uuid.uuid4().hex))
+    # created like a regular file, so that umask is respected.
+    fd = os.open(temp_filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL |
+                 getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with _open_file_for_writing(fd, mode, **options) as f:
+            yield f
+        if os.path.exists(filepath):
+            import shutil
+            shutil.copymode(filepath, temp_filepath)
+        # os.replace is not available on python 2.
+        getattr(os, 'replace', os.rename)(temp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(temp_filepath):
+            os.remove(temp_filepath)
+        raise
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        # persist the rename too.
+        _fsync_dir(dirpath)
+
+
+@contextmanager
+def _open_file_for_writing(file, mode, buffering, fsync,
+                           compression, compression_level):
+    import io
+    if not compression:
+        with _open_file(file, mode, buffering) as f:
+            yield f
+            _flush_file(f, fsync)
+        return
+    with io.open(file, mode[0] + 'b', buffering=buffering) as f:
+        stream = io_compression.compress_stream(
+            f, compression, compression_level)
+        if 'b' not in mode:
+            stream = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+        with stream:
+            yield stream
+        # compressed data is completely written when the stream is closed.
+        _flush_file(f, fsync)
+
+
+def _open_file(file, mode, buffering):
+    import io
+    if 'b' in mode:
+        return io.open(file, mode, buffering=buffering)
+    return io.open(file, mode, buffering=buffering,
+                   encoding='utf-8', newline='')
+
+
+def _flush_file(f, fsync):
+    if not fsync:
+        return
+    import os
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _fsync_dir(dirpath):
+    import os
+    try:
+        fd = os.open(dirpath, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        # not supported by some file-systems.
+        pass
+    finally:
+        os.close(fd)
@@ -7,6 +7,8 @@ from benedict.utils import type_util
 
 class KeylistDict(BaseDict):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(KeylistDict, self).__init__(*args, **kwargs)
 
@@ -16,7 +18,7 @@ class KeylistDict(BaseDict):
         return super(KeylistDict, self).__contains__(key)
 
     def _contains_by_keys(self, keys):
-        parent, _, _ = keylist_util.get_item(self, keys)
+        parent, _, _ = keylist_util.get_item(self.dict(), keys)
         if type_util.is_dict_or_list_or_tuple(parent):
             return True
         return False
@@ -43,7 +45,7 @@ class KeylistDict(BaseDict):
         return super(KeylistDict, self).__getitem__(key)
 
     def _getitem_by_keys(self, keys):
-        parent, key, _ = keylist_util.get_item(self, keys)
+        parent, key, _ = keylist_util.get_item(self.dict(), keys)
         if type_util.is_dict_or_list_or_tuple(parent):
             return parent[key]
         raise KeyError('Invalid keys: "{}"'.format(keys))
@@ -63,7 +65,7 @@ class KeylistDict(BaseDict):
         return super(KeylistDict, self).get(key, default)
 
     def _get_by_keys(self, keys, default=None):
-        parent, key, _ = keylist_util.get_item(self, keys)
+        parent, key, _ = keylist_util.get_item(self.dict(), keys)
         if type_util.is_dict(parent):
             return parent.get(key, default)
         elif type_util.is_list_or_tuple(parent):
@@ -1,3 +1,5 @@
 # -*- coding: utf-8 -*-
 
 from benedict.dicts.keypath.keypath_dict import KeypathDict
+from benedict.dicts.keypath.keypath_util import (
+    CompiledKeypath, compile_keypath, )
@@ -6,14 +6,33 @@ from benedict.dicts.keypath import keypath_util
 
 class KeypathDict(KeylistDict):
 
-    _keypath_separator = None
+    __slots__ = ('_keypath_separator', '_validate', '_validated', )
+
+    def __new__(cls, *args, **kwargs):
+        obj = super(KeypathDict, cls).__new__(cls, *args, **kwargs)
+        obj._keypath_separator = None
+        obj._validate = keypath_util.VALIDATE_EAGER
+        # separator against which all the keys have been checked (or None).
+        obj._validated = None
+        return obj
 
     def __init__(self, *args, **kwargs):
         self._keypath_separator = kwargs.pop('keypath_separator', '.')
+        self._validate = kwargs.pop('validate', keypath_util.VALIDATE_EAGER)
+        if self._validate not in keypath_util.VALIDATE_MODES:
+            raise ValueError(
+                'Invalid validate mode: \'{}\', expected one of: {}.'.format(
+                    self._validate, keypath_util.VALIDATE_MODES))
         check_keys = kwargs.pop('check_keys', True)
         super(KeypathDict, self).__init__(*args, **kwargs)
-        if check_keys:
-            keypath_util.check_keys(self, self._keypath_separator)
+        self._validated = None
+        if check_keys and self._validate != keypath_util.VALIDATE_OFF:
+            checked = keypath_util.check_keys(
+                self, self._keypath_separator,
+                deep=(self._validate == keypath_util.VALIDATE_EAGER),
+                skip=self._is_validated)
+            if checked:
+                self._validated = self._keypath_separator
 
     @property
     def keypath_separator(self):
@@ -21,9 +40,42 @@ class KeypathDict(KeylistDict):
 
     @keypath_separator.setter
     def keypath_separator(self, value):
-        keypath_util.check_keys(self, value)
+        checked = False
+        if self._validate != keypath_util.VALIDATE_OFF:
+            checked = keypath_util.check_keys(self, value)
+        self._validated = value if checked else None
         self._keypath_separator = value
 
+    @property
+    def validate(self):
+        return self._validate
+
+    def _check_keys(self, value):
+        """
+        Check keys of the value being inserted according to the validate mode:
+        'eager' checks the whole value tree, skipping already validated subtrees,
+        'lazy' checks only first level keys and 'off' doesn't check anything.
+        """
+        if self._validate == keypath_util.VALIDATE_OFF or \
+                self._is_validated(value):
+            return
+        keypath_util.check_keys(
+            value, self._keypath_separator,
+            deep=(self._validate == keypath_util.VALIDATE_EAGER),
+            skip=self._is_validated)
+
+    def _is_validated(self, value):
+        """
+        Return True if value is an instance whose keys have all been
+        checked against the same keypath separator (the whole tree has been
+        walked) and are kept checked (eagerly) when inserting new values.
+        Changes made directly to the underlying dict are not tracked.
+        """
+        return isinstance(value, KeypathDict) and \
+            value._validate == keypath_util.VALIDATE_EAGER and \
+            value._validated is not None and \
+            value._validated == self._keypath_separator
+
     def __contains__(self, key):
         return super(KeypathDict, self).__contains__(
             self._parse_key(key))
@@ -37,12 +89,12 @@ class KeypathDict(KeylistDict):
             self._parse_key(key))
 
     def __setitem__(self, key, value):
-        keypath_util.check_keys(value, self._keypath_separator)
+        self._check_keys(value)
         super(KeypathDict, self).__setitem__(
             self._parse_key(key), value)
 
     def _parse_key(self, key):
-        keys = keypath_util.parse_keys(key, self._keypath_separator)
+        keys = keypath_util.parse_keys_cached(key, self._keypath_separator)
         keys_count = len(keys)
         if keys_count == 0:
             return None
@@ -50,6 +102,15 @@ class KeypathDict(KeylistDict):
             return keys[0]
         return keys
 
+    def empty_like(self):
+        """
+        Return a new empty instance of the same type using the same
+        keypath separator and validate mode of the current instance.
+        """
+        return self.__class__(
+            keypath_separator=self._keypath_separator,
+            validate=self._validate)
+
     @classmethod
     def fromkeys(cls, sequence, value=None):
         d = cls()
@@ -66,5 +127,5 @@ class KeypathDict(KeylistDict):
             self._parse_key(key), *args)
 
     def update(self, other):
-        keypath_util.check_keys(other, self._keypath_separator)
+        self._check_keys(other)
         super(KeypathDict, self).update(other)
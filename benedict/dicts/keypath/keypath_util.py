@@ -1,33 +1,160 @@
 # -*- coding: utf-8 -*-
 
-from benedict.core import traverse
 from benedict.utils import type_util
 
+from collections import OrderedDict
+from threading import Lock
+
 import re
 
 
 KEY_INDEX_RE = r'(?:\[[\'\"]*(\-?[\d]+)[\'\"]*\]){1}$'
+KEY_INDEX_PATTERN = re.compile(KEY_INDEX_RE)
+
+KEYPATH_CACHE_MAXSIZE = 1024
+
+VALIDATE_EAGER = 'eager'
+VALIDATE_LAZY = 'lazy'
+VALIDATE_OFF = 'off'
+VALIDATE_MODES = [VALIDATE_EAGER, VALIDATE_LAZY, VALIDATE_OFF]
+
+
+class CompiledKeypath(tuple):
+    """
+    Immutable tuple of keys parsed from a keypath,
+    it can be used wherever a keypath is accepted without being parsed again.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'CompiledKeypath({})'.format(list(self))
+
 
+class KeypathCache(object):
+    """
+    Bounded LRU cache of parsed keypaths (keypath -> keys tuple)
+    for a specific keypath separator.
+    """
+
+    def __init__(self, separator, maxsize=KEYPATH_CACHE_MAXSIZE):
+        super(KeypathCache, self).__init__()
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.separator = separator
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, keypath):
+        with self._lock:
+            keys = self._data.pop(keypath, None)
+            if keys is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                keys = tuple(_split_keys_and_indexes(keypath, self.separator))
+                while len(self._data) >= self.maxsize > 0:
+                    self._data.popitem(last=False)
+            if self.maxsize > 0:
+                self._data[keypath] = keys
+            return keys
 
-def check_keys(d, separator):
+    def info(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'maxsize': self.maxsize,
+            'size': len(self._data),
+        }
+
+
+_keypath_caches = {}
+
+
+def check_keys(d, separator, deep=True, skip=None):
     """
     Check if dict keys contain keypath separator.
+    If deep is False, only the first level keys will be checked.
+    Sub-dicts for which skip(value) returns True will not be checked.
+    Return True if all the keys of the whole tree have been checked.
     """
     if not type_util.is_dict(d) or not separator:
-        return
+        return False
+    return _check_keys_in_dict(d, separator, deep, skip)
+
 
-    def check_key(parent, key, value):
-        if key and type_util.is_string(key) and separator in key:
-            raise ValueError(
-                'keys should not contain keypath separator '
-                '\'{}\', found: \'{}\'.'.format(separator, key))
-    traverse(d, check_key)
+def _check_key(key, separator):
+    if key and type_util.is_string(key) and separator in key:
+        raise ValueError(
+            'keys should not contain keypath separator '
+            '\'{}\', found: \'{}\'.'.format(separator, key))
+
+
+def _check_keys_in_dict(d, separator, deep, skip):
+    items, checked = _get_items(d)
+    checked = checked and deep
+    for key, value in items:
+        _check_key(key, separator)
+        if deep:
+            checked = _check_keys_in_value(value, separator, skip) and checked
+    return checked
+
+
+def _get_items(d):
+    # dicts decoding values lazily (eg. lazy json) allow to peek items
+    # without decoding values, in this way keys validation doesn't force it,
+    # but the keys of the values not decoded yet are not checked.
+    if type(d) is not dict:
+        d = d.dict() if hasattr(d, 'dict') else d
+        if hasattr(d, 'peek_items'):
+            return (d.peek_items(), False, )
+    return (d.items(), True, )
+
+
+def _check_keys_in_value(value, separator, skip):
+    if type_util.is_dict(value):
+        if skip and skip(value):
+            return True
+        return _check_keys_in_dict(value, separator, True, skip)
+    elif type_util.is_list_or_tuple(value):
+        checked = True
+        for item in value:
+            checked = _check_keys_in_value(item, separator, skip) and checked
+        return checked
+    return True
+
+
+def compile_keypath(keypath, separator='.'):
+    """
+    Parse the given keypath (or keylist) once using the given separator
+    and return a CompiledKeypath that skips parsing when used as key.
+    """
+    return CompiledKeypath(parse_keys(keypath, separator))
+
+
+def get_keypath_cache(separator):
+    """
+    Get (or create) the parsed keypaths cache for the given separator.
+    """
+    cache = _keypath_caches.get(separator)
+    if cache is None:
+        cache = _keypath_caches.setdefault(separator, KeypathCache(separator))
+    return cache
 
 
 def parse_keys(keypath, separator):
     """
     Parse keys from keylist or keypath using the given separator.
     """
+    if isinstance(keypath, CompiledKeypath):
+        return list(keypath)
     if type_util.is_list_or_tuple(keypath):
         keys = []
         for key in keypath:
@@ -36,6 +163,19 @@ def parse_keys(keypath, separator):
     return _split_keys_and_indexes(keypath, separator)
 
 
+def parse_keys_cached(keypath, separator):
+    """
+    Parse keys from keylist or keypath using the given separator,
+    keypath strings are parsed once and then retrieved from the cache.
+    Return an immutable tuple of keys.
+    """
+    if isinstance(keypath, CompiledKeypath):
+        return keypath
+    if type_util.is_string(keypath):
+        return get_keypath_cache(separator).get(keypath)
+    return tuple(parse_keys(keypath, separator))
+
+
 def _split_key_indexes(key):
     """
     Splits key indexes:
@@ -44,10 +184,10 @@ def _split_key_indexes(key):
     if '[' in key and key.endswith(']'):
         keys = []
         while True:
-            matches = re.findall(KEY_INDEX_RE, key)
-            if matches:
-                key = re.sub(KEY_INDEX_RE, '', key)
-                index = int(matches[0])
+            match = KEY_INDEX_PATTERN.search(key)
+            if match:
+                key = key[:match.start()] + key[match.end():]
+                index = int(match.group(1))
                 keys.insert(0, index)
                 # keys.insert(0, { keylist_util.INDEX_KEY:index })
                 continue
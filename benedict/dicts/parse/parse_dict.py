@@ -9,6 +9,8 @@ from decimal import Decimal
 
 class ParseDict(BaseDict):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Constructs a new instance.
@@ -4,17 +4,14 @@ from benedict.serializers import JSONSerializer
 from benedict.utils import type_util
 
 from datetime import datetime
-from dateutil import parser as date_parser
 from decimal import Decimal, DecimalException
-from MailChecker import MailChecker
-from phonenumbers import phonenumberutil, PhoneNumberFormat
 from six import text_type
-from slugify import slugify
 
-import ftfy
-import phonenumbers
 import re
 
+# heavy third-party parsing libraries (dateutil, ftfy, MailChecker,
+# phonenumbers, slugify) are imported only when first needed.
+
 
 def _parse_with(val, type_checker, parser, **kwargs):
     if val is None:
@@ -55,6 +52,7 @@ def _parse_datetime_with_format(val, format):
 
 
 def _parse_datetime_without_format(val):
+    from dateutil import parser as date_parser
     try:
         return date_parser.parse(val)
     except Exception:
@@ -116,6 +114,7 @@ def parse_float(val):
 
 
 def _parse_email(val, check_blacklist=True):
+    from MailChecker import MailChecker
     val = val.lower()
     if check_blacklist:
         if not MailChecker.is_valid(val):
@@ -165,6 +164,8 @@ def parse_list(val, separator=None):
 
 
 def _parse_phonenumber(val, country_code=None):
+    import phonenumbers
+    from phonenumbers import phonenumberutil, PhoneNumberFormat
     try:
         phone_obj = phonenumbers.parse(val, country_code)
         if phonenumbers.is_valid_number(phone_obj):
@@ -196,6 +197,7 @@ def parse_phonenumber(val, country_code=None):
 
 
 def _parse_slug(val):
+    from slugify import slugify
     return slugify(val)
 
 
@@ -206,6 +208,7 @@ def parse_slug(val):
 
 def parse_str(val):
     if type_util.is_string(val):
+        import ftfy
         try:
             val = ftfy.fix_text(val)
         except UnicodeError:
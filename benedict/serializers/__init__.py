@@ -2,9 +2,14 @@
 
 from benedict.serializers.abstract import AbstractSerializer
 from benedict.serializers.base64 import Base64Serializer
+from benedict.serializers.cbor import CBORSerializer
 from benedict.serializers.csv import CSVSerializer
 from benedict.serializers.ini import INISerializer
 from benedict.serializers.json import JSONSerializer
+from benedict.serializers.json_backends import (
+    get_json_backend, set_json_backend, )
+from benedict.serializers.jsonl import JSONLSerializer
+from benedict.serializers.msgpack import MsgPackSerializer
 from benedict.serializers.pickle import PickleSerializer
 from benedict.serializers.plist import PListSerializer
 from benedict.serializers.query_string import QueryStringSerializer
@@ -16,9 +21,12 @@ import re
 
 
 _BASE64_SERIALIZER = Base64Serializer()
+_CBOR_SERIALIZER = CBORSerializer()
 _CSV_SERIALIZER = CSVSerializer()
 _INI_SERIALIZER = INISerializer()
 _JSON_SERIALIZER = JSONSerializer()
+_JSONL_SERIALIZER = JSONLSerializer()
+_MSGPACK_SERIALIZER = MsgPackSerializer()
 _PICKLE_SERIALIZER = PickleSerializer()
 _PLIST_SERIALIZER = PListSerializer()
 _QUERY_STRING_SERIALIZER = QueryStringSerializer()
@@ -29,9 +37,13 @@ _XML_SERIALIZER = XMLSerializer()
 _SERIALIZERS = {
     'b64': _BASE64_SERIALIZER,
     'base64': _BASE64_SERIALIZER,
+    'cbor': _CBOR_SERIALIZER,
     'csv': _CSV_SERIALIZER,
     'ini': _INI_SERIALIZER,
     'json': _JSON_SERIALIZER,
+    'jsonl': _JSONL_SERIALIZER,
+    'ndjson': _JSONL_SERIALIZER,
+    'msgpack': _MSGPACK_SERIALIZER,
     'pickle': _PICKLE_SERIALIZER,
     'plist': _PLIST_SERIALIZER,
     'qs': _QUERY_STRING_SERIALIZER,
@@ -42,8 +54,10 @@ _SERIALIZERS = {
     'xml': _XML_SERIALIZER,
 }
 
-_SERIALIZERS_EXTENSIONS = [
-    '.{}'.format(extension) for extension in _SERIALIZERS.keys()]
+# longest extensions first, so that '.ndjson' is not matched as '.json'.
+_SERIALIZERS_EXTENSIONS = sorted([
+    '.{}'.format(extension) for extension in _SERIALIZERS.keys()],
+    key=len, reverse=True)
 
 
 def get_format_by_path(path):
@@ -3,11 +3,26 @@
 
 class AbstractSerializer(object):
 
+    # url and filepath content is read as bytes for binary serializers.
+    binary = False
+
     def __init__(self):
         super(AbstractSerializer, self).__init__()
 
     def decode(self, s, **kwargs):
         raise NotImplementedError()
 
+    def decode_bytes(self, b, **kwargs):
+        return self.decode(b.decode('utf-8'), **kwargs)
+
+    def decode_stream(self, f, **kwargs):
+        s = f.read()
+        if isinstance(s, (bytes, bytearray, )):
+            return self.decode_bytes(s, **kwargs)
+        return self.decode(s, **kwargs)
+
     def encode(self, d, **kwargs):
         raise NotImplementedError()
+
+    def encode_stream(self, d, f, **kwargs):
+        f.write(self.encode(d, **kwargs))
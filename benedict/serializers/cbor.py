@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from benedict.serializers.abstract import AbstractSerializer
+from benedict.utils import type_util
+
+from datetime import datetime
+
+
+# semantic tags (not registered) used for values not supported natively.
+_TAG_NAIVE_DATETIME = 40100
+_TAG_TUPLE = 40101
+
+
+class CBORSerializer(AbstractSerializer):
+    """
+    CBOR: https://cbor.io/ (requires cbor2 >= 6)
+    Data is encoded to / decoded from bytes, Decimal, set and timezone-aware
+    datetime values use standard semantic tags, naive datetime and tuple
+    values are preserved using custom tags.
+    """
+
+    binary = True
+
+    def __init__(self):
+        super(CBORSerializer, self).__init__()
+
+    def decode(self, s, **kwargs):
+        raise ValueError('Invalid CBOR data, expected bytes.')
+
+    def decode_bytes(self, b, **kwargs):
+        import cbor2
+        kwargs.setdefault('tag_hook', self._decode_tag)
+        return cbor2.loads(b, **kwargs)
+
+    def decode_stream(self, f, **kwargs):
+        import cbor2
+        kwargs.setdefault('tag_hook', self._decode_tag)
+        return cbor2.load(f, **kwargs)
+
+    def _decode_tag(self, *args):
+        import cbor2
+        # the hook arguments order is not the same in all cbor2 versions.
+        tag = [arg for arg in args if isinstance(arg, cbor2.CBORTag)][0]
+        if tag.tag == _TAG_NAIVE_DATETIME:
+            from dateutil import parser as date_parser
+            return date_parser.isoparse(tag.value)
+        elif tag.tag == _TAG_TUPLE:
+            return tuple(tag.value)
+        return tag
+
+    def encode(self, d, **kwargs):
+        import cbor2
+        return cbor2.dumps(d, **self._get_encode_options(kwargs))
+
+    def encode_stream(self, d, f, **kwargs):
+        import cbor2
+        cbor2.dump(d, f, **self._get_encode_options(kwargs))
+
+    def _get_encode_options(self, options):
+        encoders = {
+            datetime: self._encode_datetime,
+            tuple: self._encode_tuple,
+        }
+        encoders.update(options.get('encoders') or {})
+        options['encoders'] = encoders
+        options.setdefault('default', self._encode_default)
+        return options
+
+    def _encode_datetime(self, encoder, obj):
+        if obj.tzinfo is None:
+            import cbor2
+            encoder.encode(cbor2.CBORTag(
+                _TAG_NAIVE_DATETIME, obj.isoformat()))
+            return
+        encoder.encode_datetime(obj)
+
+    def _encode_tuple(self, encoder, obj):
+        import cbor2
+        encoder.encode(cbor2.CBORTag(_TAG_TUPLE, list(obj)))
+
+    def _encode_default(self, encoder, obj):
+        if type_util.is_dict(obj):
+            encoder.encode(dict(obj.items()))
+            return
+        raise TypeError(
+            'Object of type {} is not CBOR serializable.'.format(
+                type(obj).__name__))
@@ -8,6 +8,8 @@ from benedict.utils import type_util
 from six import StringIO
 
 import csv
+import io
+import itertools
 
 
 class CSVSerializer(AbstractSerializer):
@@ -16,39 +18,68 @@ class CSVSerializer(AbstractSerializer):
         super(CSVSerializer, self).__init__()
 
     def decode(self, s, **kwargs):
+        f = StringIO(s)
+        data = list(self.iter_decode(f, **kwargs))
+        return data
+
+    def decode_stream(self, f, **kwargs):
+        if not isinstance(f, (io.RawIOBase, io.BufferedIOBase, )):
+            return list(self.iter_decode(f, **kwargs))
+        # binary stream, decode it on the fly without reading it all.
+        w = io.TextIOWrapper(f, encoding='utf-8', newline='')
+        try:
+            return list(self.iter_decode(w, **kwargs))
+        finally:
+            # leave the given stream open.
+            w.detach()
+
+    def iter_decode(self, f, **kwargs):
+        """
+        Read rows one by one from the given file object (or lines iterable)
+        and yield them as dicts, memory usage does not depend on rows count.
+        """
         # kwargs.setdefault('delimiter', ',')
         if kwargs.pop('quote', False):
             # TODO: add tests coverage
             kwargs.setdefault('quoting', csv.QUOTE_ALL)
         columns = kwargs.pop('columns', None)
         columns_row = kwargs.pop('columns_row', True)
-        f = StringIO(s)
         r = csv.reader(f, **kwargs)
-        ln = 0
-        data = []
+        if columns_row:
+            row = next(r, None)
+            if row is None:
+                return
+            if not columns:
+                columns = row
         for row in r:
-            if ln == 0 and columns_row:
-                if not columns:
-                    columns = row
-                ln += 1
-                continue
-            d = dict(zip(columns, row))
-            data.append(d)
-            ln += 1
-        return data
+            yield dict(zip(columns, row))
 
     def encode(self, d, **kwargs):
-        l = d
+        f = StringIO()
+        self.encode_stream(d, f, **kwargs)
+        data = f.getvalue()
+        return data
+
+    def encode_stream(self, d, f, **kwargs):
+        """
+        Write the given iterable of dicts (or rows) to the given file object
+        one row at a time, it can be a list or a generator.
+        """
+        l = iter(d)
         # kwargs.setdefault('delimiter', ',')
         if kwargs.pop('quote', False):
             kwargs.setdefault('quoting', csv.QUOTE_ALL)
         kwargs.setdefault('lineterminator', '\n')
         columns = kwargs.pop('columns', None)
         columns_row = kwargs.pop('columns_row', True)
-        if not columns and len(l) and type_util.is_dict(l[0]):
-            keys = [str(key) for key in l[0].keys()]
-            columns = list(sorted(keys))
-        f = StringIO()
+        if not columns:
+            # peek the first item to autodetect columns.
+            first = next(l, None)
+            if type_util.is_dict(first):
+                keys = [str(key) for key in first.keys()]
+                columns = list(sorted(keys))
+            if first is not None:
+                l = itertools.chain([first], l)
         w = csv.writer(f, **kwargs)
         if columns_row and columns:
             w.writerow(columns)
@@ -62,5 +93,3 @@ class CSVSerializer(AbstractSerializer):
                 # TODO: add tests coverage
                 row = [item]
             w.writerow(row)
-        data = f.getvalue()
-        return data
@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 
 from benedict.serializers.abstract import AbstractSerializer
+from benedict.serializers.json_backends import decode_text, get_json_backend
 from benedict.utils import type_util
 
 from six import text_type
@@ -10,18 +11,100 @@ from six import text_type
 import json
 
 
+def _unwrap_base_dicts(value):
+    # BaseDict instances (eg. benedict) are replaced by their pointed dicts,
+    # because C encoders may read their dict storage directly, which is not
+    # updated when the pointed dict is changed directly: containers are
+    # copied only if they contain BaseDict instances.
+    from benedict.dicts.base import BaseDict
+    if isinstance(value, BaseDict) and value.dict() is not value:
+        return _unwrap_base_dicts(value.dict())
+    elif type_util.is_dict(value):
+        items = [(key, item, _unwrap_base_dicts(item), )
+                 for key, item in value.items()]
+        if any(item is not unwrapped for _, item, unwrapped in items):
+            return dict((key, unwrapped, ) for key, _, unwrapped in items)
+    elif type_util.is_list_or_tuple(value):
+        items = [(item, _unwrap_base_dicts(item), ) for item in value]
+        if any(item is not unwrapped for item, unwrapped in items):
+            return [unwrapped for _, unwrapped in items]
+    return value
+
+
 class JSONSerializer(AbstractSerializer):
 
     def __init__(self):
         super(JSONSerializer, self).__init__()
 
+    @staticmethod
+    def _get_backend(name, encode, options):
+        """
+        Get the backend with the given name (or the default one),
+        fallback to the standard library backend if it doesn't support options.
+        """
+        backend = get_json_backend(name)
+        supported = backend.can_encode(**options) if encode \
+            else backend.can_decode(**options)
+        return backend if supported else get_json_backend('json')
+
     def decode(self, s, **kwargs):
-        data = json.loads(s, **kwargs)
+        lazy = kwargs.pop('lazy', False)
+        backend_name = kwargs.pop('backend', None)
+        if lazy:
+            from benedict.serializers.json_lazy import LazyJSONDict
+            decoder = json.JSONDecoder(**kwargs)
+            return LazyJSONDict.decode(s, depth=int(lazy), decoder=decoder)
+        backend = self._get_backend(backend_name, False, kwargs)
+        data = backend.decode(s, **kwargs)
+        return data
+
+    def can_decode_bytes(self, **kwargs):
+        """
+        Return True if bytes-like objects (eg. memory-mapped files) are
+        decoded directly, without creating an intermediate string,
+        using the backend and the options passed as kwargs.
+        """
+        options = kwargs.copy()
+        backend_name = options.pop('backend', None)
+        if options.pop('lazy', False):
+            return False
+        backend = self._get_backend(backend_name, False, options)
+        return backend.can_decode_bytes()
+
+    def decode_bytes(self, b, **kwargs):
+        if kwargs.get('lazy'):
+            # values positions are indexed on the decoded text.
+            return self.decode(decode_text(b), **kwargs)
+        backend_name = kwargs.pop('backend', None)
+        backend = self._get_backend(backend_name, False, kwargs)
+        data = backend.decode_bytes(b, **kwargs)
+        return data
+
+    def decode_stream(self, f, **kwargs):
+        backend = self._get_backend(kwargs.get('backend'), False, {})
+        if kwargs.get('lazy') or backend.name != 'json':
+            return super(JSONSerializer, self).decode_stream(f, **kwargs)
+        kwargs.pop('backend', None)
+        data = json.load(f, **kwargs)
         return data
 
     def encode(self, d, **kwargs):
+        backend_name = kwargs.pop('backend', None)
+        from benedict.dicts.base import BaseDict
+        if isinstance(d, BaseDict):
+            d = d.dict()
+        from benedict.serializers.json_lazy import LazyJSONDict
+        if isinstance(d, LazyJSONDict):
+            if not kwargs:
+                # write values not decoded yet back verbatim.
+                return d.encode(
+                    lambda value: self.encode(value, backend=backend_name))
+            d.load_all()
+        # encode plain dicts, so that the C encoders can be used safely.
+        d = _unwrap_base_dicts(d)
         kwargs.setdefault('default', self._encode_default)
-        data = json.dumps(d, **kwargs)
+        backend = self._get_backend(backend_name, True, kwargs)
+        data = backend.encode(d, **kwargs)
         return data
 
     def _encode_default(self, obj):
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from six import integer_types, text_type
+
+import importlib
+import json
+
+
+def decode_text(b):
+    """
+    Decode any bytes-like object (eg. a memory-mapped file) straight
+    to text, detecting the encoding in the same way json.loads does.
+    """
+    detect_encoding = getattr(json, 'detect_encoding', None)
+    encoding = detect_encoding(bytes(b[:4])) if detect_encoding else 'utf-8'
+    return text_type(b, encoding, 'surrogatepass')
+
+
+def _get_fallback_options(options, ensure_ascii):
+    """
+    Get the standard library backend options to get the same output of
+    other backends when falling back to it: compact and not ascii-escaped.
+    """
+    options = options.copy()
+    options['ensure_ascii'] = ensure_ascii
+    if not options.get('indent'):
+        options['separators'] = (',', ':', )
+    return options
+
+
+_PLAIN_TYPES = (bool, float, text_type, ) + integer_types
+
+
+def _to_plain(obj, default):
+    """
+    Convert the given value to plain json types, for encoders that read
+    the dict storage directly and serialize some types natively in a
+    different way than the standard library (eg. Decimal as number):
+    dict subclasses are converted using items(), other types using default.
+    """
+    if isinstance(obj, dict):
+        return dict((key, _to_plain(value, default), )
+                    for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, )):
+        return [_to_plain(item, default) for item in obj]
+    elif obj is None or type(obj) in _PLAIN_TYPES:
+        return obj
+    elif isinstance(obj, text_type):
+        return text_type(obj)
+    elif isinstance(obj, bool):
+        return bool(obj)
+    elif isinstance(obj, integer_types):
+        return int(obj)
+    elif isinstance(obj, float):
+        return float(obj)
+    if default:
+        return _to_plain(default(obj), default)
+    raise TypeError(
+        'Object of type {} is not JSON serializable.'.format(
+            type(obj).__name__))
+
+
+class JSONBackend(object):
+    """
+    Standard library json backend, it supports all the json module options
+    and it is used as fallback by other backends for unsupported options.
+    """
+
+    name = 'json'
+
+    def __init__(self):
+        super(JSONBackend, self).__init__()
+        self._available = None
+        self._module = None
+
+    def _import(self):
+        if self._module is None:
+            self._module = importlib.import_module(self.name)
+        return self._module
+
+    def is_available(self):
+        if self._available is None:
+            try:
+                self._import()
+                self._available = True
+            except ImportError:
+                self._available = False
+        return self._available
+
+    def can_decode(self, **kwargs):
+        return True
+
+    def can_decode_bytes(self):
+        # bytes are decoded to text before decoding them.
+        return False
+
+    def can_encode(self, **kwargs):
+        return True
+
+    def decode(self, s, **kwargs):
+        return json.loads(s, **kwargs)
+
+    def decode_bytes(self, b, **kwargs):
+        return self.decode(decode_text(b), **kwargs)
+
+    def encode(self, d, **kwargs):
+        return json.dumps(d, **kwargs)
+
+
+class ORJSONBackend(JSONBackend):
+    """
+    orjson backend: https://github.com/ijl/orjson
+    Output is compact (or indented by 2 spaces) and not ascii-escaped.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        super(ORJSONBackend, self).__init__()
+
+    def can_decode(self, **kwargs):
+        return not kwargs
+
+    def can_decode_bytes(self):
+        return True
+
+    def can_encode(self, **kwargs):
+        options = kwargs.copy()
+        options.pop('default', None)
+        options.pop('sort_keys', None)
+        if options.pop('indent', None) not in (None, 2, ):
+            return False
+        if options.pop('ensure_ascii', False):
+            return False
+        separators = options.pop('separators', None)
+        if separators and tuple(separators) != (',', ':', ):
+            return False
+        return not options
+
+    def decode(self, s, **kwargs):
+        return self._import().loads(s)
+
+    def decode_bytes(self, b, **kwargs):
+        # orjson decodes bytes-like objects (eg. memory-mapped files)
+        # directly, without creating an intermediate string.
+        return self._import().loads(b)
+
+    def encode(self, d, **kwargs):
+        orjson = self._import()
+        option = (orjson.OPT_NON_STR_KEYS |
+                  orjson.OPT_PASSTHROUGH_DATACLASS |
+                  orjson.OPT_PASSTHROUGH_SUBCLASS)
+        if kwargs.get('sort_keys'):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        default = self._get_encode_default(kwargs.get('default'))
+        try:
+            return orjson.dumps(
+                d, default=default, option=option).decode('utf-8')
+        except (orjson.JSONEncodeError, TypeError):
+            # unsupported values (eg. integers bigger than 64 bits),
+            # fallback to the standard library backend.
+            options = _get_fallback_options(kwargs, ensure_ascii=False)
+            return _JSON_BACKEND.encode(d, **options)
+
+    @staticmethod
+    def _get_encode_default(default):
+        # orjson reads the dict storage directly, subclasses are passed
+        # to default and converted, so that pointers (BaseDict) items are
+        # read from the pointed dict.
+        def encode_default(obj):
+            if isinstance(obj, dict):
+                return dict(obj.items())
+            elif isinstance(obj, (list, tuple, )):
+                return list(obj)
+            elif isinstance(obj, text_type):
+                return text_type(obj)
+            elif isinstance(obj, bool):
+                return bool(obj)
+            elif isinstance(obj, int):
+                return int(obj)
+            if default:
+                return default(obj)
+            raise TypeError(
+                'Object of type {} is not JSON serializable.'.format(
+                    type(obj).__name__))
+        return encode_default
+
+
+class UJSONBackend(JSONBackend):
+    """
+    ujson backend: https://github.com/ultrajson/ultrajson
+    Output is compact and not ascii-escaped unless ensure_ascii is True.
+    """
+
+    name = 'ujson'
+
+    def __init__(self):
+        super(UJSONBackend, self).__init__()
+
+    def can_decode(self, **kwargs):
+        return not kwargs
+
+    def can_encode(self, **kwargs):
+        options = kwargs.copy()
+        for key in ['default', 'ensure_ascii', 'indent', 'sort_keys', ]:
+            options.pop(key, None)
+        separators = options.pop('separators', None)
+        if separators and tuple(separators) != (',', ':', ):
+            return False
+        return not options
+
+    def decode(self, s, **kwargs):
+        return self._import().loads(s)
+
+    def encode(self, d, **kwargs):
+        options = {
+            'ensure_ascii': kwargs.get('ensure_ascii', False),
+            'escape_forward_slashes': False,
+            'indent': kwargs.get('indent') or 0,
+            'sort_keys': kwargs.get('sort_keys', False),
+        }
+        # ujson reads the dict storage directly and encodes some types
+        # natively (eg. Decimal as number): the data is converted to plain
+        # json types first, using default for the other types.
+        d = _to_plain(d, kwargs.get('default'))
+        try:
+            return self._import().dumps(d, **options)
+        except OverflowError:
+            # integers bigger than 64 bits are not supported,
+            # fallback to the standard library backend.
+            options = _get_fallback_options(
+                kwargs, ensure_ascii=kwargs.get('ensure_ascii', False))
+            return _JSON_BACKEND.encode(d, **options)
+
+
+_JSON_BACKEND = JSONBackend()
+
+_JSON_BACKENDS = {
+    'json': _JSON_BACKEND,
+    'orjson': ORJSONBackend(),
+    'ujson': UJSONBackend(),
+}
+
+# backends used by 'auto', in order of preference.
+_JSON_BACKENDS_AUTO = ['orjson', 'ujson', 'json']
+
+_json_backend_default = 'json'
+
+
+def get_json_backend(name=None):
+    """
+    Get the json backend with the given name (or the default one),
+    'auto' means the fastest installed backend. If the backend
+    is not installed, the standard library backend is returned.
+    A ValueError is raised if name is not a valid backend name.
+    """
+    name = (name or _json_backend_default).lower()
+    if name == 'auto':
+        for auto_name in _JSON_BACKENDS_AUTO:
+            backend = _JSON_BACKENDS[auto_name]
+            if backend.is_available():
+                return backend
+    backend = _JSON_BACKENDS.get(name)
+    if not backend:
+        raise ValueError(
+            'Invalid json backend: \'{}\', expected one of: {}.'.format(
+                name, ['auto'] + sorted(_JSON_BACKENDS.keys())))
+    if not backend.is_available():
+        return _JSON_BACKEND
+    return backend
+
+
+def set_json_backend(name):
+    """
+    Set the json backend used by default: 'auto', 'json', 'orjson', 'ujson'.
+    """
+    global _json_backend_default
+    get_json_backend(name)
+    _json_backend_default = name.lower()
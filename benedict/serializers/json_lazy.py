@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from benedict.utils import type_util
+
+from json.decoder import scanstring
+
+import json
+import re
+
+
+_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+_KEY_RE = re.compile(r'[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*:[ \t\n\r]*')
+_DELIMITER_RE = re.compile(r'[ \t\n\r]*([,}])')
+# NaN and Infinity are not valid json, but they are accepted by json.loads.
+_SCALAR_RE = re.compile(
+    r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?|'
+    r'true|false|null|NaN|-?Infinity')
+# strings and brackets inside arrays and objects, anything else is skipped.
+_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]', re.DOTALL)
+_BRACKETS = {'[': ']', '{': '}'}
+
+
+class _LazyValue(object):
+    """
+    Position of a not yet decoded value in the JSON text.
+    """
+
+    __slots__ = ('start', 'end', )
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+
+def _skip_whitespace(text, pos):
+    return _WHITESPACE_RE.match(text, pos).end()
+
+
+def _expect(text, pos, char):
+    pos = _skip_whitespace(text, pos)
+    if text[pos:pos + 1] != char:
+        raise ValueError(
+            'Expecting \'{}\' at position {}.'.format(char, pos))
+    return pos + 1
+
+
+def _skip_value(text, pos):
+    """
+    Return the position where the JSON value starting at pos ends without
+    decoding it: arrays and objects are skipped matching their brackets
+    (ignoring the ones in strings), their content is validated when decoded.
+    """
+    char = text[pos:pos + 1]
+    if char == '"':
+        return scanstring(text, pos + 1)[1]
+    elif char in _BRACKETS:
+        closing = []
+        for match in _TOKEN_RE.finditer(text, pos):
+            token = match.group()
+            if token in _BRACKETS:
+                closing.append(_BRACKETS[token])
+            elif token[0] != '"':
+                if not closing or closing.pop() != token:
+                    raise ValueError(
+                        'Unexpected \'{}\' at position {}.'.format(
+                            token, match.start()))
+                if not closing:
+                    return match.end()
+        raise ValueError(
+            'Unterminated value starting at position {}.'.format(pos))
+    match = _SCALAR_RE.match(text, pos)
+    if not match:
+        raise ValueError('Expecting value at position {}.'.format(pos))
+    return match.end()
+
+
+def _index_object(text, pos):
+    """
+    Scan the JSON object starting at pos and return the list of its
+    (key, start, end) items positions and the position where it ends.
+    Values are skipped without being decoded.
+    """
+    key_match = _KEY_RE.match
+    delimiter_match = _DELIMITER_RE.match
+    items = []
+    pos = _expect(text, pos, '{')
+    pos = _skip_whitespace(text, pos)
+    if text[pos:pos + 1] == '}':
+        return (items, pos + 1, )
+    while True:
+        match = key_match(text, pos)
+        if match:
+            # fast path, key without escape sequences.
+            key = match.group(1)
+            start = match.end()
+        else:
+            pos = _expect(text, pos, '"')
+            key, pos = scanstring(text, pos)
+            pos = _expect(text, pos, ':')
+            start = _skip_whitespace(text, pos)
+        end = _skip_value(text, start)
+        items.append((key, start, end, ))
+        match = delimiter_match(text, end)
+        if not match:
+            raise ValueError(
+                'Expecting \',\' delimiter at position {}.'.format(end))
+        pos = match.end()
+        if match.group(1) == '}':
+            return (items, pos, )
+
+
+class LazyJSONDict(dict):
+    """
+    Dict decoded from a JSON object text, values are decoded
+    on first access and then cached, untouched values are kept
+    as raw text and written back verbatim when encoded.
+    If depth is greater than 1, nested objects are decoded lazily too.
+    Without text, an empty dict is created (as dict() does).
+    """
+
+    def __init__(self, text=None, start=0, depth=1, decoder=None):
+        super(LazyJSONDict, self).__init__()
+        self._text = text
+        self._depth = depth
+        self._decoder = decoder or json.JSONDecoder()
+        self._end = start
+        if text is None:
+            return
+        items, self._end = _index_object(text, start)
+        dict.update(self, (
+            (key, _LazyValue(value_start, value_end), )
+            for key, value_start, value_end in items))
+
+    @classmethod
+    def decode(cls, text, depth=1, decoder=None):
+        """
+        Decode the given JSON text lazily, if it doesn't contain
+        an object it is decoded in the standard way.
+        """
+        decoder = decoder or json.JSONDecoder()
+        start = _skip_whitespace(text, 0)
+        if text[start:start + 1] != '{':
+            return decoder.decode(text)
+        d = cls(text, start, depth, decoder)
+        if _skip_whitespace(text, d._end) != len(text):
+            raise ValueError(
+                'Extra data at position {}.'.format(d._end))
+        return d
+
+    def _decode_value(self, value):
+        text = self._text
+        if self._depth > 1 and text[value.start] == '{':
+            return LazyJSONDict(
+                text, value.start, self._depth - 1, self._decoder)
+        return self._decoder.raw_decode(text, value.start)[0]
+
+    def _load(self, key, value):
+        if type(value) is not _LazyValue:
+            return value
+        value = self._decode_value(value)
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __eq__(self, other):
+        self.load_all()
+        return super(LazyJSONDict, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __getitem__(self, key):
+        return self._load(key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # overriding it, dict(d) and {**d} read values using __getitem__
+        # instead of reading the dict storage (values not decoded yet).
+        return super(LazyJSONDict, self).__iter__()
+
+    def __reduce__(self):
+        # pickle and (deep)copy as plain dict.
+        return (dict, (dict(self.items()), ))
+
+    def __repr__(self):
+        self.load_all()
+        return super(LazyJSONDict, self).__repr__()
+
+    def copy(self):
+        return dict(self.items())
+
+    def empty_like(self):
+        return {}
+
+    def encode(self, encode_value):
+        """
+        Encode the dict to JSON text, values not decoded yet are written
+        verbatim, decoded values are encoded using encode_value(value).
+        """
+        text = self._text
+        items = []
+        for key, value in dict.items(self):
+            if type(value) is _LazyValue:
+                s = text[value.start:value.end]
+            elif isinstance(value, LazyJSONDict):
+                s = value.encode(encode_value)
+            else:
+                s = encode_value(value)
+            items.append('{}: {}'.format(self._encode_key(key), s))
+        return '{{{}}}'.format(', '.join(items))
+
+    @staticmethod
+    def _encode_key(key):
+        if not type_util.is_string(key):
+            # convert the key as the json encoder does.
+            key = list(json.loads(json.dumps({key: None})).keys())[0]
+        return json.dumps(key)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return self[key]
+        return default
+
+    def items(self):
+        self.load_all()
+        return super(LazyJSONDict, self).items()
+
+    def load_all(self):
+        """
+        Decode all the values not decoded yet (including nested ones).
+        """
+        for key, value in list(dict.items(self)):
+            value = self._load(key, value)
+            if isinstance(value, LazyJSONDict):
+                value.load_all()
+
+    def peek_items(self):
+        """
+        Return the list of items without decoding values,
+        values not decoded yet are returned as None.
+        """
+        return [(key, (None if type(value) is _LazyValue else value), )
+                for key, value in dict.items(self)]
+
+    def pop(self, key, *args):
+        if dict.__contains__(self, key):
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return super(LazyJSONDict, self).pop(key, *args)
+
+    def popitem(self):
+        key, value = super(LazyJSONDict, self).popitem()
+        if type(value) is _LazyValue:
+            value = self._decode_value(value)
+        return (key, value, )
+
+    def setdefault(self, key, default=None):
+        if dict.__contains__(self, key):
+            return self[key]
+        return super(LazyJSONDict, self).setdefault(key, default)
+
+    def values(self):
+        self.load_all()
+        return super(LazyJSONDict, self).values()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from benedict.serializers.abstract import AbstractSerializer
+from benedict.serializers.json import JSONSerializer
+
+from collections import deque
+from six import StringIO
+
+import io
+import os
+
+
+def _decode_chunk(filepath, start, end, options):
+    """
+    Decode the lines in the [start, end) bytes range of the given file,
+    it runs in worker processes, so it must be a module level function.
+    """
+    serializer = JSONLSerializer()
+    with io.open(filepath, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return list(serializer.iter_decode(io.BytesIO(data), **options))
+
+
+def _get_chunks(filepath, chunk_size):
+    """
+    Split the given file in bytes ranges of about chunk_size bytes,
+    each range ends at the end of a line.
+    """
+    size = os.path.getsize(filepath)
+    chunks = []
+    with io.open(filepath, 'rb') as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()
+            end = min(f.tell(), size)
+            chunks.append((start, end, ))
+            start = end
+    return chunks
+
+
+class JSONLSerializer(AbstractSerializer):
+    """
+    JSON Lines / NDJSON: one json value per line.
+    http://jsonlines.org/
+    """
+
+    def __init__(self):
+        super(JSONLSerializer, self).__init__()
+        self._json_serializer = JSONSerializer()
+
+    def decode(self, s, **kwargs):
+        f = StringIO(s)
+        data = list(self.iter_decode(f, **kwargs))
+        return data
+
+    def iter_decode(self, f, **kwargs):
+        """
+        Read lines one by one from the given file object (text or binary)
+        and yield the decoded values, blank lines are skipped.
+        """
+        # resolve the json backend once, not for each line.
+        backend_name = kwargs.pop('backend', None)
+        backend = JSONSerializer._get_backend(backend_name, False, kwargs)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if isinstance(line, bytes):
+                yield backend.decode_bytes(line, **kwargs)
+            else:
+                yield backend.decode(line, **kwargs)
+
+    def iter_decode_file(self, filepath, workers=2, chunk_size=None,
+                         **kwargs):
+        """
+        Decode the file at filepath using multiple processes, each one
+        decodes a different bytes range, values are yielded in order.
+        At most 2 chunks per worker are kept in memory at the same time.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        chunk_size = chunk_size or (16 * 1024 * 1024)
+        chunks = _get_chunks(filepath, chunk_size)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for start, end in chunks:
+                pending.append(executor.submit(
+                    _decode_chunk, filepath, start, end, kwargs))
+                if len(pending) >= (workers * 2):
+                    for item in pending.popleft().result():
+                        yield item
+            while pending:
+                for item in pending.popleft().result():
+                    yield item
+
+    def encode(self, d, **kwargs):
+        f = StringIO()
+        self.encode_stream(d, f, **kwargs)
+        data = f.getvalue()
+        return data
+
+    def encode_stream(self, d, f, **kwargs):
+        """
+        Write each item of the given iterable to the given file object
+        as a json line, it can be a list or a generator.
+        """
+        # each value must be encoded in a single line.
+        kwargs.pop('indent', None)
+        serializer = self._json_serializer
+        for item in d:
+            f.write(serializer.encode(item, **kwargs))
+            f.write('\n')
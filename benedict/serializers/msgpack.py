@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from benedict.serializers.abstract import AbstractSerializer
+from benedict.utils import type_util
+
+from decimal import Decimal
+from six import text_type
+
+
+# extension types codes.
+_EXT_DATETIME = 1
+_EXT_DECIMAL = 2
+_EXT_SET = 3
+_EXT_TUPLE = 4
+
+
+class MsgPackSerializer(AbstractSerializer):
+    """
+    MessagePack: https://msgpack.org/
+    Data is encoded to / decoded from bytes, datetime, Decimal, set
+    and tuple values are preserved using extension types.
+    """
+
+    binary = True
+
+    def __init__(self):
+        super(MsgPackSerializer, self).__init__()
+
+    def decode(self, s, **kwargs):
+        raise ValueError('Invalid MessagePack data, expected bytes.')
+
+    def decode_bytes(self, b, **kwargs):
+        import msgpack
+        return msgpack.unpackb(b, **self._get_decode_options(kwargs))
+
+    def decode_stream(self, f, **kwargs):
+        import msgpack
+        return msgpack.unpack(f, **self._get_decode_options(kwargs))
+
+    def _get_decode_options(self, options):
+        options.setdefault('ext_hook', self._decode_ext)
+        options.setdefault('raw', False)
+        options.setdefault('strict_map_key', False)
+        return options
+
+    def _decode_ext(self, code, data):
+        if code == _EXT_DATETIME:
+            from dateutil import parser as date_parser
+            return date_parser.isoparse(data.decode('utf-8'))
+        elif code == _EXT_DECIMAL:
+            return Decimal(data.decode('utf-8'))
+        elif code == _EXT_SET:
+            return set(self.decode_bytes(data))
+        elif code == _EXT_TUPLE:
+            return tuple(self.decode_bytes(data))
+        import msgpack
+        return msgpack.ExtType(code, data)
+
+    def encode(self, d, **kwargs):
+        import msgpack
+        return msgpack.packb(d, **self._get_encode_options(kwargs))
+
+    def encode_stream(self, d, f, **kwargs):
+        import msgpack
+        msgpack.pack(d, f, **self._get_encode_options(kwargs))
+
+    def _get_encode_options(self, options):
+        options.setdefault('default', self._encode_default)
+        options.setdefault('use_bin_type', True)
+        # types subclasses (eg. tuple) are passed to default.
+        options.setdefault('strict_types', True)
+        return options
+
+    def _encode_default(self, obj):
+        import msgpack
+        if type_util.is_datetime(obj):
+            return msgpack.ExtType(
+                _EXT_DATETIME, obj.isoformat().encode('utf-8'))
+        elif type_util.is_decimal(obj):
+            return msgpack.ExtType(
+                _EXT_DECIMAL, text_type(obj).encode('utf-8'))
+        elif type_util.is_set(obj):
+            return msgpack.ExtType(_EXT_SET, self.encode(list(obj)))
+        elif type_util.is_tuple(obj):
+            return msgpack.ExtType(_EXT_TUPLE, self.encode(list(obj)))
+        elif type_util.is_dict(obj):
+            # dict subclasses, eg. benedict or OrderedDict.
+            return dict(obj.items())
+        elif type_util.is_list(obj):
+            return list(obj)
+        elif type_util.is_string(obj):
+            return text_type(obj)
+        raise TypeError(
+            'Object of type {} is not MessagePack serializable.'.format(
+                type(obj).__name__))
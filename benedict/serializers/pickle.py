@@ -5,21 +5,59 @@ from __future__ import absolute_import
 from benedict.serializers.abstract import AbstractSerializer
 
 import base64
+import io
 import pickle
+import re
+import six
+
+
+# first byte of base64 encoded data, raw pickles never start with it.
+_BASE64_START_RE = re.compile(b'^[A-Za-z0-9+/=\\s]')
 
 
 class PickleSerializer(AbstractSerializer):
 
+    # url and filepath content can be a raw (binary) pickle.
+    binary = True
+
     def __init__(self):
         super(PickleSerializer, self).__init__()
 
     def decode(self, s, **kwargs):
         encoding = kwargs.pop('encoding', 'utf-8')
+        kwargs.pop('raw', None)
         return pickle.loads(
             base64.b64decode(s.encode(encoding)), **kwargs)
 
+    def decode_bytes(self, b, **kwargs):
+        kwargs.pop('encoding', None)
+        raw = kwargs.pop('raw', None)
+        if raw is None:
+            raw = not _BASE64_START_RE.match(bytes(b[:1]))
+        if not raw:
+            b = base64.b64decode(bytes(b))
+        return pickle.loads(b, **kwargs)
+
     def encode(self, d, **kwargs):
         encoding = kwargs.pop('encoding', 'utf-8')
-        kwargs.setdefault('protocol', 2)
-        return base64.b64encode(
-            pickle.dumps(d, **kwargs)).decode(encoding)
+        raw = kwargs.pop('raw', False)
+        kwargs.setdefault(
+            'protocol', 2 if six.PY2 else pickle.HIGHEST_PROTOCOL)
+        data = pickle.dumps(d, **kwargs)
+        if raw:
+            return data
+        return base64.b64encode(data).decode(encoding)
+
+    def encode_stream(self, d, f, **kwargs):
+        if kwargs.get('raw', False):
+            kwargs.pop('encoding', None)
+            kwargs.pop('raw')
+            kwargs.setdefault(
+                'protocol', 2 if six.PY2 else pickle.HIGHEST_PROTOCOL)
+            pickle.dump(d, f, **kwargs)
+            return
+        s = self.encode(d, **kwargs)
+        if not isinstance(f, io.TextIOBase):
+            # base64 text written to a binary file.
+            s = s.encode('ascii')
+        f.write(s)
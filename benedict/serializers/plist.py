@@ -25,6 +25,13 @@ class PListSerializer(AbstractSerializer):
         encoding = kwargs.pop('encoding', 'utf-8')
         return plistlib.loads(s.encode(encoding), **kwargs)
 
+    def decode_bytes(self, b, **kwargs):
+        if six.PY2:
+            return plistlib.readPlistFromString(bytes(b))
+        kwargs.setdefault('fmt', plistlib.FMT_XML)
+        kwargs.pop('encoding', None)
+        return plistlib.loads(bytes(b), **kwargs)
+
     def encode(self, d, **kwargs):
         if six.PY2:
             return plistlib.writePlistToString(d)
@@ -4,8 +4,6 @@ from __future__ import absolute_import
 
 from benedict.serializers.abstract import AbstractSerializer
 
-import toml
-
 
 class TOMLSerializer(AbstractSerializer):
 
@@ -13,9 +11,11 @@ class TOMLSerializer(AbstractSerializer):
         super(TOMLSerializer, self).__init__()
 
     def decode(self, s, **kwargs):
+        import toml
         data = toml.loads(s, **kwargs)
         return data
 
     def encode(self, d, **kwargs):
+        import toml
         data = toml.dumps(d, **kwargs)
         return data
@@ -3,8 +3,44 @@
 from __future__ import absolute_import
 
 from benedict.serializers.abstract import AbstractSerializer
+from benedict.utils import type_util
 
-import xmltodict
+
+class _ExpatParserProxy(object):
+    """
+    Proxy of an expat parser: handlers are set on the real parser,
+    parsing is skipped because data is fed later chunk by chunk.
+    """
+
+    def __init__(self, parser):
+        object.__setattr__(self, '_parser', parser)
+
+    def __getattr__(self, name):
+        return getattr(self._parser, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._parser, name, value)
+
+    def Parse(self, data, isfinal=False):
+        pass
+
+    def ParseFile(self, f):
+        pass
+
+
+class _ExpatProxy(object):
+    """
+    Replacement of the expat module passed to xmltodict.parse,
+    it keeps a reference to the (configured) real parser.
+    """
+
+    def __init__(self):
+        self.parser = None
+
+    def ParserCreate(self, *args, **kwargs):
+        from xml.parsers import expat
+        self.parser = expat.ParserCreate(*args, **kwargs)
+        return _ExpatParserProxy(self.parser)
 
 
 class XMLSerializer(AbstractSerializer):
@@ -13,10 +49,61 @@ class XMLSerializer(AbstractSerializer):
         super(XMLSerializer, self).__init__()
 
     def decode(self, s, **kwargs):
+        import xmltodict
         kwargs.setdefault('dict_constructor', dict)
         data = xmltodict.parse(s, **kwargs)
         return data
 
+    def decode_bytes(self, b, **kwargs):
+        return self.decode(bytes(b), **kwargs)
+
+    def decode_stream(self, f, **kwargs):
+        # the expat parser consumes the stream in chunks.
+        return self.decode(f, **kwargs)
+
+    def iter_decode(self, f, item_path, chunk_size=65536, **kwargs):
+        """
+        Read the given file object chunk by chunk and yield the decoded
+        items at item_path (eg. 'feed.record'), items are not kept in memory.
+        """
+        import xmltodict
+        keys = item_path.split('.') if type_util.is_string(item_path) \
+            else list(item_path)
+        items = []
+
+        def item_callback(path, item):
+            if [name for name, attrs in path] == keys:
+                items.append(item)
+            return True
+
+        chunk = f.read(chunk_size)
+        if not type_util.is_bytes(chunk):
+            # text is fed to the parser as utf-8.
+            kwargs['encoding'] = 'utf-8'
+        kwargs.setdefault('dict_constructor', dict)
+        # let xmltodict create and configure the parser, then feed it here,
+        # so that items can be yielded while parsing.
+        expat = _ExpatProxy()
+        xmltodict.parse(
+            b'', expat=expat, item_depth=len(keys),
+            item_callback=item_callback, **kwargs)
+        parser = expat.parser
+        while chunk:
+            parser.Parse(chunk, False)
+            for item in items:
+                yield item
+            del items[:]
+            chunk = f.read(chunk_size)
+        parser.Parse(b'', True)
+        for item in items:
+            yield item
+
     def encode(self, d, **kwargs):
+        import xmltodict
         data = xmltodict.unparse(d, **kwargs)
         return data
+
+    def encode_stream(self, d, f, **kwargs):
+        # iterables (eg. generators) are consumed and written item by item.
+        import xmltodict
+        xmltodict.unparse(d, output=f, **kwargs)
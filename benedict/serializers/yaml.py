@@ -4,7 +4,84 @@ from __future__ import absolute_import
 
 from benedict.serializers.abstract import AbstractSerializer
 
-import yaml
+
+def get_yaml():
+    """
+    Import yaml (lazily), register benedict representers and return it.
+    """
+    import yaml
+    register_yaml_representers(yaml)
+    return yaml
+
+
+def __getattr__(name):
+    # yaml is imported lazily, when accessed as module attribute
+    # (eg. from benedict.serializers.yaml import yaml), python >= 3.7
+    if name == 'yaml':
+        return get_yaml()
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def register_yaml_representers(yaml):
+    # fix benedict yaml representer - #43
+    from benedict.dicts.base import BaseDict
+    from benedict.serializers.json_lazy import LazyJSONDict
+    # libyaml based dumpers are available only if pyyaml has been built with it.
+    dumpers = [
+        yaml.Dumper, getattr(yaml, 'CDumper', None),
+        yaml.SafeDumper, getattr(yaml, 'CSafeDumper', None),
+    ]
+    for dumper in filter(None, dumpers):
+        representers = dumper.__dict__.get('yaml_multi_representers', {})
+        for cls in [BaseDict, LazyJSONDict]:
+            if cls in representers:
+                continue
+            dumper.add_multi_representer(
+                cls, yaml.representer.SafeRepresenter.represent_dict)
+            representers = dumper.__dict__['yaml_multi_representers']
+
+
+# registries shared between pure python classes and libyaml based ones.
+_REGISTRIES = (
+    'yaml_constructors', 'yaml_multi_constructors',
+    'yaml_representers', 'yaml_multi_representers',
+    'yaml_implicit_resolvers', 'yaml_path_resolvers',
+)
+
+_c_classes = {}
+
+
+def _get_c_class(yaml, name):
+    """
+    Return the libyaml (C) based version of the given loader/dumper class,
+    sharing its registries so that constructors, representers and resolvers
+    added to it are used. If pyyaml has been built without libyaml,
+    the pure python class is returned.
+    """
+    cls = getattr(yaml, name)
+    c_cls = getattr(yaml, 'C{}'.format(name), None)
+    if c_cls is None:
+        return cls
+    registries = dict(
+        (attr, getattr(cls, attr), ) for attr in _REGISTRIES
+        if hasattr(cls, attr))
+    # registries are copied by pyyaml on first change in a subclass.
+    key = (name, tuple(sorted(
+        (attr, id(value), ) for attr, value in registries.items())), )
+    shared_cls = _c_classes.get(key)
+    if shared_cls is None:
+        shared_cls = type(c_cls.__name__, (c_cls, ), registries)
+        _c_classes[key] = shared_cls
+    return shared_cls
+
+
+def _get_loader(yaml):
+    return _get_c_class(yaml, 'SafeLoader')
+
+
+def _get_dumper(yaml):
+    return _get_c_class(yaml, 'Dumper')
 
 
 class YAMLSerializer(AbstractSerializer):
@@ -13,9 +90,31 @@ class YAMLSerializer(AbstractSerializer):
         super(YAMLSerializer, self).__init__()
 
     def decode(self, s, **kwargs):
-        data = yaml.safe_load(s, **kwargs)
+        yaml = get_yaml()
+        kwargs.setdefault('Loader', _get_loader(yaml))
+        data = yaml.load(s, **kwargs)
         return data
 
+    def decode_bytes(self, b, **kwargs):
+        return self.decode(bytes(b), **kwargs)
+
+    def decode_stream(self, f, **kwargs):
+        # the yaml reader consumes the stream in chunks.
+        return self.decode(f, **kwargs)
+
+    def iter_decode(self, f, **kwargs):
+        """
+        Read documents one by one from the given (multi-document)
+        yaml stream and yield the decoded values.
+        """
+        yaml = get_yaml()
+        kwargs.setdefault('Loader', _get_loader(yaml))
+        for data in yaml.load_all(f, **kwargs):
+            yield data
+
     def encode(self, d, **kwargs):
-        data = yaml.dump(dict(d.items()), **kwargs)
+        yaml = get_yaml()
+        kwargs.setdefault('Dumper', _get_dumper(yaml))
+        data = yaml.dump(d, **kwargs)
         return data
+
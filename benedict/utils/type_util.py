@@ -16,6 +16,10 @@ def is_bool(val):
     return isinstance(val, bool)
 
 
+def is_bytes(val):
+    return isinstance(val, (bytes, bytearray, memoryview, ))
+
+
 def is_collection(val):
     return isinstance(val, (dict, list, set, tuple, ))
 
@@ -59,6 +59,22 @@ setup(
         'toml',
         'xmltodict',
     ],
+    extras_require={
+        'cbor': ['cbor2; python_version >= "3.7"'],
+        'msgpack': ['msgpack'],
+        'orjson': ['orjson; python_version >= "3.6"'],
+        'ujson': ['ujson'],
+        'lz4': ['lz4'],
+        'zstd': ['zstandard'],
+        'all': [
+            'cbor2; python_version >= "3.7"',
+            'lz4',
+            'msgpack',
+            'orjson; python_version >= "3.6"',
+            'ujson',
+            'zstandard',
+        ],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Environment :: MacOS X',
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
+from benedict import benedict
 from benedict.core import clone as _clone
+from benedict.core import empty_like as _empty_like
+
+from collections import OrderedDict
 
 import unittest
 
@@ -34,3 +38,25 @@ class clone_test_case(unittest.TestCase):
         o = _clone(i, empty=True)
         self.assertEqual(type(i), type(o))
         self.assertEqual(o, {})
+
+    def test_clone_empty_with_benedict(self):
+        i = benedict({
+            'a': {
+                'b': 1,
+            },
+        }, keypath_separator='/', validate='lazy')
+        o = _clone(i, empty=True)
+        self.assertEqual(type(i), type(o))
+        self.assertEqual(o, {})
+        self.assertEqual(o.keypath_separator, '/')
+        self.assertEqual(o.validate, 'lazy')
+        self.assertEqual(i, {'a': {'b': 1}})
+
+    def test_empty_like(self):
+        self.assertEqual(_empty_like({'a': 1}), {})
+        self.assertEqual(_empty_like([1, 2]), [])
+        i = OrderedDict([('a', 1)])
+        o = _empty_like(i)
+        self.assertEqual(type(o), OrderedDict)
+        self.assertEqual(o, {})
+        self.assertEqual(i, {'a': 1})
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from benedict.core import iter_keylists as _iter_keylists
 from benedict.core import keylists as _keylists
 
 import unittest
@@ -205,3 +206,35 @@ class keylists_test_case(unittest.TestCase):
             ['b', 'e'],
         ]
         self.assertEqual(o, r)
+
+    def test_iter_keylists(self):
+        i = {
+            'a': 1,
+            'b': {
+                'c': [
+                    {
+                        'x': 2,
+                    },
+                ],
+            },
+        }
+        o = _iter_keylists(i, indexes=True)
+        self.assertFalse(isinstance(o, list))
+        r = [
+            ('a', ),
+            ('b', ),
+            ('b', 'c', ),
+            ('b', 'c[0]', ),
+            ('b', 'c[0]', 'x', ),
+        ]
+        self.assertEqual(list(o), r)
+
+    def test_keylists_with_deep_nesting(self):
+        i = {}
+        d = i
+        for _ in range(5000):
+            d['a'] = {}
+            d = d['a']
+        o = _keylists(i)
+        self.assertEqual(len(o), 5000)
+        self.assertEqual(len(o[-1]), 5000)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from benedict.core import iter_keypaths as _iter_keypaths
 from benedict.core import keypaths as _keypaths
 
 import unittest
@@ -273,3 +274,40 @@ class keypaths_test_case(unittest.TestCase):
             'a.b[2][0].y',
         ]
         self.assertEqual(o, r)
+
+    def test_keypaths_without_sort(self):
+        i = {
+            'b': {
+                'y': 1,
+                'x': [
+                    {
+                        'z': 2,
+                    },
+                ],
+            },
+            'a': 3,
+        }
+        o = _keypaths(i, indexes=True, sort=False)
+        r = [
+            'b',
+            'b.y',
+            'b.x',
+            'b.x[0]',
+            'b.x[0].z',
+            'a',
+        ]
+        self.assertEqual(o, r)
+
+    def test_iter_keypaths(self):
+        i = {
+            'a': {
+                'b': 1,
+            },
+        }
+        o = _iter_keypaths(i, separator='/')
+        self.assertEqual(next(o), 'a')
+        self.assertEqual(next(o), 'a/b')
+        with self.assertRaises(StopIteration):
+            next(o)
+        with self.assertRaises(ValueError):
+            _iter_keypaths(i, separator=True)
@@ -58,3 +58,111 @@ class match_test_case(unittest.TestCase):
         d = self._get_dict()
         with self.assertRaises(ValueError):
             values = _match(d, 100)
+
+    def test_match_with_string_pattern_and_nested_lists(self):
+        d = {
+            'servers': [
+                {
+                    'name': 'a',
+                    'ports': [80, 443],
+                },
+                {
+                    'name': 'b',
+                    'ports': [8080],
+                },
+            ],
+        }
+        values = _match(d, 'servers[*].ports[*]')
+        self.assertEqual(values, [80, 443, 8080])
+        values = _match(d, 'servers[1].*')
+        self.assertEqual(values, ['b', [8080], 8080])
+        values = _match(d, 'servers[*].name', indexes=False)
+        self.assertEqual(values, [])
+        values = _match(d, 'servers[*].ports')
+        self.assertEqual(values, [[80, 443], 80, 443, [8080], 8080])
+        values = _match(d, 'servers[*].ports', glob=True)
+        self.assertEqual(values, [[80, 443], [8080]])
+
+    def test_match_with_string_pattern_and_custom_separator(self):
+        d = {
+            'a': {
+                'b.c': {
+                    'd': 1,
+                },
+                'x': {
+                    'd': 2,
+                },
+            },
+        }
+        values = _match(d, 'a/*/d', separator='/')
+        self.assertEqual(values, [1, 2])
+
+    def test_match_with_string_pattern_as_regex_prefix(self):
+        d = {
+            'a': {
+                'b': {
+                    'c': 1,
+                },
+            },
+            'ab': 2,
+        }
+        # the wildcard matches the keypath separator too.
+        self.assertEqual(_match(d, '*.c'), [1])
+        self.assertEqual(_match(d, 'a.*'), [{'c': 1}, 1, 2])
+        # the pattern matches the start of the keypath.
+        self.assertEqual(_match(d, 'a'), [d['a'], d['a']['b'], 1, 2])
+        # the pattern is a regex.
+        self.assertEqual(_match(d, 'a.b$'), [{'c': 1}])
+        self.assertEqual(_match(d, 'a(b|x)'), [2])
+        self.assertEqual(_match(d, r'...\.c'), [1])
+
+    def test_match_with_glob_wildcard_does_not_match_separator(self):
+        d = {
+            'a': {
+                'b': {
+                    'c': 1,
+                },
+            },
+            'l': [{ 'c': 2 }],
+        }
+        values = _match(d, 'a.*', glob=True)
+        self.assertEqual(values, [{'c': 1}])
+        values = _match(d, '*.*.*', glob=True)
+        self.assertEqual(values, [1])
+        values = _match(d, '*.c', glob=True)
+        self.assertEqual(values, [])
+        values = _match(d, 'a', glob=True)
+        self.assertEqual(values, [{'b': {'c': 1}}])
+        # the wildcard doesn't match list indexes brackets.
+        values = _match(d, 'l*', glob=True)
+        self.assertEqual(values, [[{ 'c': 2 }]])
+        values = _match(d, 'l[*].c', glob=True)
+        self.assertEqual(values, [2])
+
+    def test_match_with_keypaths(self):
+        d = {
+            'a': {
+                'x': 1,
+                'y': 2,
+            },
+            'b': {
+                'x': 3,
+            },
+        }
+        items = _match(d, '*.x', with_keypaths=True)
+        self.assertEqual(items, [('a.x', 1), ('b.x', 3)])
+        items = _match(d, re.compile(r'^a\.'), with_keypaths=True)
+        self.assertEqual(items, [('a.x', 1), ('a.y', 2)])
+
+    def test_match_prunes_not_matching_subtrees(self):
+        class unreadable_dict(dict):
+            def items(self):
+                raise AssertionError('subtree should not be traversed.')
+        d = {
+            'a': {
+                'x': 1,
+            },
+            'b': unreadable_dict(x=2),
+        }
+        values = _match(d, 'a.x', glob=True)
+        self.assertEqual(values, [1])
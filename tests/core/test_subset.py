@@ -42,3 +42,15 @@ class subset_test_case(unittest.TestCase):
         }
         self.assertFalse(i is o)
         self.assertEqual(o, r)
+
+    def test_subset_does_not_deepcopy_input(self):
+        # values that cannot be deep-copied should not affect subset
+        i = {
+            'a': 1,
+            'b': (x for x in range(3)),
+        }
+        o = _subset(i, ['a'])
+        r = {
+            'a': 1,
+        }
+        self.assertEqual(o, r)
@@ -55,3 +55,46 @@ class unique_test_case(unittest.TestCase):
         ]
         self.assertEqual(len(d.keys()), len(rv))
         self.assertTrue(all([value in rv for value in d.values()]))
+
+    def test_unique_with_mixed_values(self):
+        d = {
+            'a': 1,
+            'b': [1, {'x': [2, 3]}],
+            'c': 'x',
+            'd': [1, {'x': [2, 3]}],
+            'e': (1, [2]),
+            'f': {1, 2},
+            'g': (1, [2]),
+            'h': {2, 1},
+            'i': 1,
+            'j': [1, {'x': [3, 2]}],
+        }
+        _unique(d)
+        self.assertEqual(list(d.keys()), ['a', 'b', 'c', 'e', 'f', 'j'])
+
+    def test_unique_with_unhashable_objects(self):
+        class unhashable(object):
+            __hash__ = None
+
+            def __init__(self, value):
+                self.value = value
+
+            def __eq__(self, other):
+                return self.value == other.value
+
+        d = {
+            'a': unhashable(1),
+            'b': unhashable(2),
+            'c': unhashable(1),
+        }
+        _unique(d)
+        self.assertEqual(list(d.keys()), ['a', 'b'])
+
+    def test_unique_with_key(self):
+        d = {
+            'a': {'id': 1, 'name': 'x'},
+            'b': {'id': 2, 'name': 'y'},
+            'c': {'id': 1, 'name': 'z'},
+        }
+        _unique(d, key=lambda value: value['id'])
+        self.assertEqual(list(d.keys()), ['a', 'b'])
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from benedict.dicts.base import BaseDict
+from benedict.serializers import JSONSerializer
 
 try:
     from collections.abc import Iterable
@@ -8,6 +9,8 @@ except ImportError:
     from collections import Iterable
 
 import copy
+import json
+import pickle
 import sys
 import unittest
 
@@ -174,6 +177,14 @@ class base_dict_test_case(unittest.TestCase):
         self.assertEqual(d['a'], 2)
         self.assertEqual(b, b.dict())
 
+    def test__setitem__with_pointer_to_empty_dict(self):
+        d = {}
+        b = BaseDict(d)
+        b['a'] = 1
+        self.assertEqual(d, { 'a':1 })
+        # dict storage is kept in sync for C-accelerated code
+        self.assertEqual(dict.__len__(b), 1)
+
     def test__str__(self):
         d = { 'a':1, 'b':2, 'c':3 }
         b = BaseDict({ 'a':1, 'b':2, 'c':3 })
@@ -268,6 +279,48 @@ class base_dict_test_case(unittest.TestCase):
         self.assertEqual(d, b)
         self.assertEqual(b, b.dict())
 
+    def test_dict_pointer_changed_directly(self):
+        d = { 'x': 0 }
+        b = BaseDict(d)
+        d['a'] = 1
+        d['b'] = { 'c': 2 }
+        self.assertEqual(json.dumps(b), '{"x": 0, "a": 1, "b": {"c": 2}}')
+        self.assertEqual(json.dumps({ 'y': b }), '{"y": {"x": 0, "a": 1, "b": {"c": 2}}}')
+        self.assertEqual(JSONSerializer().encode({ 'y': b }), '{"y": {"x": 0, "a": 1, "b": {"c": 2}}}')
+        self.assertEqual(dict(b), d)
+        self.assertEqual(dict(**b), d)
+        self.assertEqual(copy.copy(b), d)
+        self.assertEqual(pickle.loads(pickle.dumps(b)), d)
+        del d['a']
+        self.assertEqual(json.dumps(b), '{"x": 0, "b": {"c": 2}}')
+        d.clear()
+        self.assertEqual(json.dumps(b), '{}')
+        self.assertEqual(len(b), 0)
+
+    def test_dict_pointer_storage(self):
+        d = { 'a': 1, 'b': 2 }
+        b = BaseDict(d)
+        # the storage mirrors the pointed dict, without any private key.
+        self.assertEqual(dict.keys(b), { 'a', 'b' })
+        b['c'] = 3
+        b.update({ 'd': 4 })
+        b.setdefault('e', 5)
+        del b['a']
+        b.pop('b')
+        self.assertEqual(dict.items(b), { ('c', 3), ('d', 4), ('e', 5) })
+        b.popitem()
+        self.assertEqual(dict.items(b), { ('c', 3), ('d', 4) })
+        b.clear()
+        self.assertEqual(dict.__len__(b), 0)
+        self.assertEqual(d, {})
+        d['f'] = 6
+        # changes made directly to the pointed dict are encoded correctly
+        # by the serializers even if the storage is not updated.
+        self.assertEqual(JSONSerializer().encode(b), '{"f": 6}')
+        self.assertEqual(JSONSerializer().encode([b]), '[{"f": 6}]')
+        b = pickle.loads(pickle.dumps(b))
+        self.assertEqual(dict.items(b), { ('f', 6) })
+
     def test_get(self):
         b = BaseDict()
         b['a'] = 1
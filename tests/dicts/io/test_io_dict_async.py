@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+from benedict.dicts.io import IODict
+
+from .test_io_dict import io_dict_test_case
+
+import gzip
+import os
+import sys
+import threading
+import time
+import unittest
+
+try:
+    # python 3
+    from http.server import HTTPServer, SimpleHTTPRequestHandler
+except ImportError:
+    # python 2
+    from BaseHTTPServer import HTTPServer
+    from SimpleHTTPServer import SimpleHTTPRequestHandler
+
+
+class _RequestHandler(SimpleHTTPRequestHandler):
+
+    # seconds to wait before responding (to check that the loop is not blocked).
+    delay = 0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        return SimpleHTTPRequestHandler.do_GET(self)
+
+    def translate_path(self, path):
+        return io_dict_async_test_case.input_path(path.lstrip('/'))
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires python >= 3.7')
+class io_dict_async_test_case(io_dict_test_case):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), _RequestHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever)
+        cls.server_thread.daemon = True
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super(io_dict_async_test_case, cls).tearDownClass()
+
+    def tearDown(self):
+        _RequestHandler.delay = 0
+
+    def local_url(self, filepath):
+        return 'http://127.0.0.1:{}/{}'.format(
+            self.server.server_address[1], filepath)
+
+    @staticmethod
+    def run_async(coroutine):
+        import asyncio
+        return asyncio.run(coroutine)
+
+    def test_afrom_url(self):
+        d = self.run_async(IODict.afrom_url(self.local_url('valid-content.json')))
+        self.assertTrue(isinstance(d, IODict))
+        self.assertEqual(d, IODict.from_json(self.input_path('valid-content.json')))
+        d = self.run_async(IODict.afrom_url(self.local_url('valid-content.yml')))
+        self.assertEqual(d, IODict.from_yaml(self.input_path('valid-content.yml')))
+        # format
+        d = self.run_async(IODict.afrom_url(self.local_url('valid-content.json.txt'), format='json'))
+        self.assertEqual(d, IODict.from_json(self.input_path('valid-content.json')))
+
+    def test_afrom_url_with_invalid_url(self):
+        with self.assertRaises(ValueError):
+            self.run_async(IODict.afrom_url(self.local_url('invalid-file.json')))
+
+    def test_afrom_url_with_invalid_content(self):
+        with self.assertRaises(ValueError):
+            self.run_async(IODict.afrom_url(self.local_url('invalid-content.json')))
+
+    def test_afrom_url_does_not_block_event_loop(self):
+        import asyncio
+        _RequestHandler.delay = 0.3
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            task = asyncio.ensure_future(tick())
+            d = await IODict.afrom_url(self.local_url('valid-content.json'))
+            task.cancel()
+            return d
+
+        d = self.run_async(main())
+        self.assertTrue(isinstance(d, IODict))
+        self.assertTrue(len(ticks) > 10)
+
+    def test_afrom_url_with_executor(self):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        r = IODict.from_json(self.input_path('valid-content.json'))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            d = self.run_async(IODict.afrom_url(
+                self.local_url('valid-content.json'), executor=executor))
+        self.assertEqual(d, r)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            d = self.run_async(IODict.afrom_url(
+                self.local_url('valid-content.json'), executor=executor))
+        self.assertTrue(isinstance(d, IODict))
+        self.assertEqual(d, r)
+
+    def test_afrom_file(self):
+        filepath = self.input_path('valid-content.toml')
+        d = self.run_async(IODict.afrom_file(filepath))
+        self.assertTrue(isinstance(d, IODict))
+        self.assertEqual(d, IODict.from_toml(filepath))
+
+    def test_afrom_file_with_invalid_file(self):
+        with self.assertRaises(ValueError):
+            self.run_async(IODict.afrom_file(self.input_path('invalid-file.json')))
+
+    def test_ato_file(self):
+        from concurrent.futures import ThreadPoolExecutor
+        d = IODict({ 'a':1, 'b':{ 'c':[1, 2, 3], }, })
+        filepath = self.output_path('test_ato_file.yml')
+        r = self.run_async(d.ato_file(filepath))
+        self.assertEqual(r, None)
+        self.assertFileExists(filepath)
+        self.assertEqual(IODict.from_yaml(filepath), d)
+        # executor, format
+        filepath = self.output_path('test_ato_file.data')
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.run_async(d.ato_file(filepath, format='pickle', executor=executor))
+        self.assertFileExists(filepath)
+        self.assertEqual(IODict.from_file(filepath, format='pickle'), d)
+
+    def test_ato_file_with_write_options(self):
+        d = IODict({ 'a':1, 'b':{ 'c':[1, 2, 3], }, })
+        filepath = self.output_path('test_ato_file_with_write_options.json')
+        self.run_async(d.ato_file(
+            filepath, atomic=False, fsync=False, buffer_size=1024,
+            compression='gzip', compression_level=1, sort_keys=True))
+        self.assertFileExists(filepath)
+        with gzip.open(filepath, 'rb') as f:
+            self.assertEqual(f.read().decode('utf-8'), d.to_json(sort_keys=True))
+
+    def test_afrom_file_and_ato_file_with_compression(self):
+        d = IODict({ 'a':1, 'b':{ 'c':[1, 2, 3], }, })
+        for format in ['json', 'msgpack', 'yaml']:
+            filepath = self.output_path(
+                'test_afrom_file_with_compression.{}.gz'.format(format))
+            self.run_async(d.ato_file(filepath))
+            with gzip.open(filepath, 'rb') as f:
+                self.assertTrue(len(f.read()) > 0)
+            self.assertEqual(IODict.from_file(filepath), d)
+            r = self.run_async(IODict.afrom_file(filepath))
+            self.assertTrue(isinstance(r, IODict))
+            self.assertEqual(r, d)
+
+    def test_afrom_url_with_compression(self):
+        d = IODict({ 'a':1, 'b':{ 'c':[1, 2, 3], }, })
+        filepath = self.input_path('test_afrom_url_with_compression.json.gz')
+        d.to_file(filepath, fsync=False)
+        try:
+            r = self.run_async(IODict.afrom_url(
+                self.local_url('test_afrom_url_with_compression.json.gz')))
+            self.assertEqual(r, d)
+        finally:
+            os.remove(filepath)
+
+    def test_ato_file_with_formats_dispatch(self):
+        d = IODict({ 'values': [{ 'a': '1', 'b': '2' }, { 'a': '3', 'b': '4' }] })
+        for extension in ['csv', 'jsonl', 'b64', 'json', 'toml']:
+            filepath = self.output_path(
+                'test_ato_file_with_formats_dispatch.{}'.format(extension))
+            self.run_async(d.ato_file(filepath))
+            r = self.output_path(
+                'test_ato_file_with_formats_dispatch_sync.{}'.format(extension))
+            d.to_file(r)
+            with open(filepath, 'rb') as f, open(r, 'rb') as fr:
+                self.assertEqual(f.read(), fr.read())
+
+    def test_ato_file_with_invalid_data(self):
+        d = IODict({ 'a': object() })
+        filepath = self.output_path('test_ato_file_with_invalid_data.msgpack')
+        with self.assertRaises(ValueError):
+            self.run_async(d.ato_file(filepath))
+        # write error
+        filepath = self.output_path('test_ato_file_with_invalid_data.json')
+        IODict({ 'a': 1 }).to_file(filepath)
+        with self.assertRaises(ValueError):
+            self.run_async(IODict({ 'a': 1 }).ato_file(
+                os.path.join(filepath, 'test.json')))
+        with self.assertRaises(ValueError):
+            self.run_async(d.ato_file(
+                self.output_path('test_ato_file.data'), format='invalid'))
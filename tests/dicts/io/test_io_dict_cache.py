@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from benedict import (
+    benedict, clear_decode_cache, get_decode_cache_stats,
+    set_decode_cache_options, )
+
+from .test_io_dict import io_dict_test_case
+
+import os
+import time
+
+
+class io_dict_cache_test_case(io_dict_test_case):
+
+    def setUp(self):
+        set_decode_cache_options(
+            enabled=True, max_entries=128, max_memory=64 * 1024 * 1024)
+        clear_decode_cache()
+
+    def tearDown(self):
+        set_decode_cache_options(enabled=False)
+
+    def _write_file(self, filepath, content):
+        filepath = self.output_path(filepath)
+        benedict({}).to_json(filepath=filepath)
+        with open(filepath, 'w') as f:
+            f.write(content)
+        return filepath
+
+    def test_decode_cache_hit(self):
+        filepath = self.input_path('valid-content.yml')
+        d1 = benedict(filepath)
+        d2 = benedict.from_yaml(filepath)
+        self.assertEqual(d1, d2)
+        stats = get_decode_cache_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['entries'], 1)
+        self.assertTrue(stats['memory'] > 0)
+
+    def test_decode_cache_copy(self):
+        filepath = self._write_file(
+            'decode-cache-copy.json', '{"a": 1, "b": {"c": [2, 3]}}')
+        d1 = benedict(filepath)
+        d1['a'] = 0
+        d1['b.c'].append(4)
+        d2 = benedict(filepath)
+        self.assertEqual(d2, {'a': 1, 'b': {'c': [2, 3]}})
+        self.assertEqual(get_decode_cache_stats()['hits'], 1)
+
+    def test_decode_cache_with_different_options(self):
+        filepath = self.input_path('valid-content.json')
+        benedict(filepath)
+        benedict(filepath, parse_float=str)
+        d = benedict(filepath, format='json')
+        stats = get_decode_cache_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(d['a'], 1)
+
+    def test_decode_cache_with_modified_file(self):
+        filepath = self._write_file('decode-cache.json', '{"a": 1}')
+        self.assertEqual(benedict(filepath)['a'], 1)
+        self._write_file('decode-cache.json', '{"a": 22}')
+        # ensure mtime changes on file-systems with coarse resolution.
+        mtime = time.time() + 10
+        os.utime(filepath, (mtime, mtime, ))
+        self.assertEqual(benedict(filepath)['a'], 22)
+        stats = get_decode_cache_stats()
+        self.assertEqual(stats['hits'], 0)
+        self.assertEqual(stats['misses'], 2)
+
+    def test_decode_cache_max_entries(self):
+        set_decode_cache_options(max_entries=1)
+        filepath_json = self.input_path('valid-content.json')
+        filepath_yaml = self.input_path('valid-content.yml')
+        benedict(filepath_json)
+        benedict(filepath_yaml)
+        benedict(filepath_json)
+        stats = get_decode_cache_stats()
+        self.assertEqual(stats['hits'], 0)
+        self.assertEqual(stats['misses'], 3)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertEqual(stats['entries'], 1)
+
+    def test_decode_cache_max_memory(self):
+        set_decode_cache_options(max_memory=1)
+        filepath = self.input_path('valid-content.json')
+        benedict(filepath)
+        benedict(filepath)
+        stats = get_decode_cache_stats()
+        self.assertEqual(stats['hits'], 0)
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['memory'], 0)
+
+    def test_decode_cache_disabled(self):
+        set_decode_cache_options(enabled=False)
+        filepath = self.input_path('valid-content.json')
+        benedict(filepath)
+        benedict(filepath)
+        stats = get_decode_cache_stats()
+        self.assertEqual(stats['hits'], 0)
+        self.assertEqual(stats['misses'], 0)
+        self.assertEqual(stats['entries'], 0)
+
+    def test_decode_cache_ignores_data(self):
+        benedict('{"a": 1}')
+        benedict(b'{"a": 1}')
+        stats = get_decode_cache_stats()
+        self.assertEqual(stats['misses'], 0)
+        self.assertEqual(stats['entries'], 0)
+
+    def test_decode_cache_with_invalid_option(self):
+        with self.assertRaises(ValueError):
+            set_decode_cache_options(size=1)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from benedict.dicts.io import IODict
+
+from .test_io_dict import io_dict_test_case
+
+from decimal import Decimal
+
+import datetime as dt
+import io
+import unittest
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+@unittest.skipIf(cbor2 is None, 'requires cbor2')
+class io_dict_cbor_test_case(io_dict_test_case):
+
+    def test_from_cbor_with_valid_data(self):
+        d = IODict({ 'a':1, 'b':[1, 2, 3], 'c':{ 'd':'hello', }, 'e':None, })
+        b = d.to_cbor()
+        self.assertTrue(isinstance(b, bytes))
+        # static method
+        r = IODict.from_cbor(b)
+        self.assertTrue(isinstance(r, dict))
+        self.assertEqual(r, d)
+        # constructor
+        r = IODict(b, format='cbor')
+        self.assertTrue(isinstance(r, dict))
+        self.assertEqual(r, d)
+
+    def test_from_cbor_with_extension_types(self):
+        d = IODict({
+            'datetime': dt.datetime(2020, 1, 2, 3, 4, 5),
+            'decimal': Decimal('1.10'),
+            'set': set([1, 2, 3]),
+            'tuple': (1, (2, 'b'), ),
+            'bytes': b'\x00\x01',
+            'nested': { 'values': [(1, 2, ), set(['x'])], },
+        })
+        r = IODict.from_cbor(d.to_cbor())
+        self.assertEqual(r, d)
+        self.assertTrue(isinstance(r['decimal'], Decimal))
+        self.assertTrue(isinstance(r['tuple'], tuple))
+        self.assertTrue(isinstance(r['tuple'][1], tuple))
+        self.assertTrue(isinstance(r['nested']['values'][1], set))
+        self.assertEqual(r['datetime'].tzinfo, None)
+
+    def test_from_cbor_with_invalid_data(self):
+        # static method
+        with self.assertRaises(ValueError):
+            IODict.from_cbor(b'\xc1\xff invalid')
+        # data must be bytes
+        with self.assertRaises(ValueError):
+            IODict.from_cbor('{"a": 1}')
+
+    def test_from_cbor_with_valid_file_valid_content(self):
+        filepath = self.input_path('valid-content.cbor')
+        r = { 'a':1, 'b':[1, 2, 3], 'c':{ 'd':'hello', }, 'e':None, }
+        # static method
+        d = IODict.from_cbor(filepath)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d, r)
+        # constructor
+        d = IODict(filepath)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d, r)
+        # file object
+        d = IODict.from_file(filepath)
+        self.assertEqual(d, r)
+
+    def test_from_cbor_with_valid_file_invalid_content(self):
+        filepath = self.input_path('invalid-content.cbor')
+        # static method
+        with self.assertRaises(ValueError):
+            IODict.from_cbor(filepath)
+        # constructor
+        with self.assertRaises(ValueError):
+            IODict(filepath, format='cbor')
+
+    def test_from_cbor_with_invalid_file(self):
+        filepath = self.input_path('invalid-file.cbor')
+        # static method
+        with self.assertRaises(ValueError):
+            IODict.from_cbor(filepath)
+
+    def test_to_cbor_file(self):
+        d = IODict({ 'a':1, 'b':[1, 2, 3], 'c':dt.datetime(2020, 1, 1), })
+        filepath = self.output_path('test_to_cbor_file.cbor')
+        b = d.to_cbor(filepath=filepath)
+        self.assertFileExists(filepath)
+        with io.open(filepath, 'rb') as f:
+            self.assertEqual(f.read(), b)
+        self.assertEqual(IODict.from_cbor(filepath), d)
+
+    def test_to_cbor_stream(self):
+        d = IODict({ 'a':1, 'b':[1, 2, 3], })
+        f = io.BytesIO()
+        b = d.to_cbor(stream=f)
+        self.assertEqual(b, None)
+        f.seek(0)
+        self.assertEqual(IODict.from_stream(f, format='cbor'), d)
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+from benedict.dicts.io import IODict, io_compression, io_util
+
+from .test_io_dict import io_dict_test_case
+
+import gzip
+import io
+
+try:
+    import lz4
+except ImportError:
+    lz4 = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class io_dict_compression_test_case(io_dict_test_case):
+
+    def _get_compressions_extensions(self):
+        extensions = ['gz', 'bz2', 'xz']
+        if lz4:
+            extensions.append('lz4')
+        if zstandard:
+            extensions.append('zst')
+        return extensions
+
+    def test_autodetect_format_with_compression_extension(self):
+        self.assertEqual(
+            io_util.autodetect_format('data.json.gz'), 'json')
+        self.assertEqual(
+            io_util.autodetect_format('data.yaml.zst'), 'yaml')
+        self.assertEqual(
+            io_util.autodetect_format('https://localhost/data.xml.bz2'), 'xml')
+        self.assertEqual(io_util.get_compression('data.json.gz'), 'gzip')
+        self.assertEqual(io_util.get_compression('data.json.xz'), 'xz')
+        self.assertEqual(io_util.get_compression('data.json'), None)
+        self.assertEqual(io_util.get_compression('{"a": "b.gz"}'), None)
+
+    def test_from_file_with_compression(self):
+        d = IODict({ 'a': 1, 'b': { 'c': [1, 2, 3] } })
+        for extension in self._get_compressions_extensions():
+            for format in ['json', 'msgpack', 'toml', 'yaml']:
+                filepath = self.output_path(
+                    'test_from_file_with_compression.{}.{}'.format(
+                        format, extension))
+                d.to_file(filepath)
+                self.assertFileExists(filepath)
+                # constructor
+                self.assertEqual(IODict(filepath), d)
+                # static methods
+                self.assertEqual(IODict.from_file(filepath), d)
+                from_func = getattr(IODict, 'from_{}'.format(format))
+                self.assertEqual(from_func(filepath), d)
+
+    def test_from_file_with_gzip_data(self):
+        filepath = self.output_path('test_from_file_with_gzip_data.json.gz')
+        IODict({}).to_json(filepath=filepath)
+        with gzip.open(filepath, 'wb') as f:
+            f.write(b'{"a": 1, "b": 2}')
+        self.assertEqual(IODict(filepath), { 'a': 1, 'b': 2 })
+
+    def test_from_file_with_invalid_compressed_data(self):
+        filepath = self.output_path('test_from_file_with_invalid_data.json.gz')
+        IODict({ 'a': 1 }).to_json(filepath=filepath, compression=False)
+        with self.assertRaises(ValueError):
+            IODict(filepath)
+        with self.assertRaises(ValueError):
+            IODict.from_file(filepath)
+
+    def test_iter_jsonl_with_compression(self):
+        d = IODict({ 'values': [{ 'a': 1 }, { 'a': 2 }] })
+        for extension in self._get_compressions_extensions():
+            filepath = self.output_path(
+                'test_iter_jsonl_with_compression.jsonl.{}'.format(extension))
+            d.to_jsonl(filepath=filepath)
+            d.to_jsonl(filepath=filepath, append=True)
+            items = list(IODict.iter_jsonl(filepath))
+            self.assertEqual(items, d['values'] * 2)
+
+    def test_iter_csv_with_compression(self):
+        d = IODict({ 'values': [{ 'a': '1' }, { 'a': '2' }] })
+        filepath = self.output_path('test_iter_csv_with_compression.csv.gz')
+        d.to_file(filepath)
+        self.assertEqual(list(IODict.iter_csv(filepath)), d['values'])
+
+    def test_to_file_with_compression(self):
+        d = IODict({ 'a': 1, 'b': 'x' * 1000 })
+        filepath = self.output_path('test_to_file_with_compression.json')
+        d.to_file(filepath, compression='gzip', compression_level=1)
+        with gzip.open(filepath, 'rb') as f:
+            self.assertEqual(f.read().decode('utf-8'), d.to_json())
+        # compression is not autodetected without the extension.
+        with self.assertRaises(ValueError):
+            IODict(filepath, format='json')
+
+    def test_to_json_with_compression(self):
+        d = IODict({ 'a': 1, 'b': 'x' * 1000 })
+        filepath = self.output_path('test_to_json_with_compression.json.gz')
+        s = d.to_json(filepath=filepath, compression_level=9)
+        with gzip.open(filepath, 'rb') as f:
+            self.assertEqual(f.read().decode('utf-8'), s)
+        self.assertEqual(IODict(filepath), d)
+
+    def test_to_file_with_invalid_compression(self):
+        d = IODict({ 'a': 1 })
+        filepath = self.output_path('test_to_file_with_invalid_compression')
+        with self.assertRaises(ValueError):
+            d.to_file(filepath, format='json', compression='rar')
+
+    def test_compress_stream(self):
+        for extension in self._get_compressions_extensions():
+            compression = io_compression.get_compression(extension)
+            f = io.BytesIO()
+            with io_compression.compress_stream(f, compression) as c:
+                c.write(b'hello world')
+            self.assertFalse(f.closed)
+            self.assertNotEqual(f.getvalue(), b'hello world')
+            f.seek(0)
+            with io_compression.decompress_stream(f, compression) as c:
+                self.assertEqual(c.read(), b'hello world')
@@ -4,6 +4,8 @@ from benedict.dicts.io import IODict
 
 from .test_io_dict import io_dict_test_case
 
+from six import StringIO
+
 
 class io_dict_csv_test_case(io_dict_test_case):
 
@@ -209,3 +211,47 @@ class io_dict_csv_test_case(io_dict_test_case):
         d.to_csv(filepath=filepath)
         self.assertFileExists(filepath)
         self.assertEqual(d, IODict.from_csv(filepath))
+
+    def test_iter_csv_with_valid_file(self):
+        filepath = self.input_path('valid-content.csv')
+        rows = IODict.iter_csv(filepath)
+        self.assertFalse(isinstance(rows, list))
+        self.assertEqual(next(rows), { 'id':'1', 'name':'Alice', 'age':'20', 'height':'62', 'weight':'120.6', })
+        self.assertEqual(len(list(rows)), 3)
+
+    def test_iter_csv_with_file_object(self):
+        s = """id,name
+1,Alice
+2,Freddie
+"""
+        f = StringIO(s)
+        rows = list(IODict.iter_csv(f, cast=True))
+        r = [
+            { 'id':'1', 'name':'Alice', },
+            { 'id':'2', 'name':'Freddie', },
+        ]
+        self.assertEqual(rows, r)
+        self.assertTrue(all([isinstance(row, IODict) for row in rows]))
+
+    def test_iter_csv_with_custom_columns(self):
+        f = StringIO('1,Alice\n2,Freddie\n')
+        rows = list(IODict.iter_csv(f, columns=['id', 'name'], columns_row=False))
+        r = [
+            { 'id':'1', 'name':'Alice', },
+            { 'id':'2', 'name':'Freddie', },
+        ]
+        self.assertEqual(rows, r)
+
+    def test_to_csv_stream(self):
+        d = IODict({
+            'values': ({ 'id':str(i), 'name':'name-{}'.format(i), } for i in range(3)),
+        })
+        f = StringIO()
+        s = d.to_csv(stream=f)
+        self.assertEqual(s, None)
+        r = """id,name
+0,name-0
+1,name-1
+2,name-2
+"""
+        self.assertEqual(f.getvalue(), r)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+from benedict.dicts.io import IODict
+
+from .test_io_dict import io_dict_test_case
+
+import io
+import os
+
+
+class io_dict_file_test_case(io_dict_test_case):
+
+    def test_from_bytes(self):
+        d = IODict.from_bytes(b'{"a": 1, "b": {"c": 2}}')
+        self.assertEqual(d, { 'a': 1, 'b': { 'c': 2 } })
+        d = IODict.from_bytes(bytearray(b'a: 1\nb:\n  c: 2\n'), format='yaml')
+        self.assertEqual(d, { 'a': 1, 'b': { 'c': 2 } })
+        d = IODict.from_bytes(b'<root><a>1</a></root>', format='xml')
+        self.assertEqual(d, { 'root': { 'a': '1' } })
+        d = IODict.from_bytes(b'a = 1', format='toml')
+        self.assertEqual(d, { 'a': 1 })
+        # constructor
+        d = IODict(b'[1, 2, 3]')
+        self.assertEqual(d, { 'values': [1, 2, 3] })
+
+    def test_from_bytes_with_invalid_data(self):
+        with self.assertRaises(ValueError):
+            IODict.from_bytes(b'invalid json data')
+        with self.assertRaises(ValueError):
+            IODict.from_bytes(b'{}', format='xxx')
+
+    def test_from_file(self):
+        formats = ['csv', 'ini', 'json', 'plist', 'toml', 'xml', 'yml']
+        for format in formats:
+            filepath = self.input_path('valid-content.{}'.format(format))
+            d = IODict.from_file(filepath)
+            self.assertTrue(isinstance(d, IODict))
+            self.assertEqual(d, IODict(filepath, format=format))
+
+    def test_from_file_with_custom_format(self):
+        filepath = self.input_path('valid-content.json.txt')
+        d = IODict.from_file(filepath, format='json')
+        self.assertEqual(d, IODict.from_json(filepath))
+
+    def test_from_file_with_invalid_file(self):
+        with self.assertRaises(ValueError):
+            IODict.from_file(self.input_path('invalid-file.json'))
+        with self.assertRaises(ValueError):
+            IODict.from_file(self.input_path('invalid-content.json'))
+
+    def test_from_stream(self):
+        f = io.BytesIO(b'{"a": 1, "b": {"c": 2}}')
+        d = IODict.from_stream(f)
+        self.assertEqual(d, { 'a': 1, 'b': { 'c': 2 } })
+        f = io.StringIO(u'id,name\n1,Alice\n')
+        d = IODict.from_stream(f, format='csv')
+        self.assertEqual(d, { 'values': [{ 'id': '1', 'name': 'Alice' }] })
+        f = io.BytesIO(b'id,name\n1,Alice\n')
+        d = IODict.from_stream(f, format='csv')
+        self.assertEqual(d, { 'values': [{ 'id': '1', 'name': 'Alice' }] })
+        # the given stream is not closed
+        self.assertFalse(f.closed)
+
+    def test_from_stream_with_format_autodetected_by_name(self):
+        with open(self.input_path('valid-content.yml'), 'rb') as f:
+            d = IODict.from_stream(f)
+        self.assertEqual(d, IODict.from_yaml(self.input_path('valid-content.yml')))
+
+    def test_to_file(self):
+        d = IODict({ 'a': 1, 'b': { 'c': [1, 2, 3] } })
+        formats = ['cbor', 'json', 'msgpack', 'pickle', 'toml', 'yml']
+        for format in formats:
+            filepath = self.output_path('test_to_file.{}'.format(format))
+            self.assertEqual(d.to_file(filepath), None)
+            self.assertFileExists(filepath)
+            self.assertEqual(IODict(filepath, format=format), d)
+
+    def test_to_file_with_list_formats(self):
+        d = IODict({ 'values': [{ 'id': '1', 'name': 'Alice' }] })
+        for format in ['csv', 'jsonl', 'ndjson']:
+            filepath = self.output_path('test_to_file_list.{}'.format(format))
+            d.to_file(filepath)
+            self.assertEqual(IODict(filepath, format=format), d)
+
+    def test_to_file_with_options(self):
+        d = IODict({ 'a': 1, 'b': 2 })
+        filepath = self.output_path('test_to_file_with_options.txt')
+        d.to_file(filepath, format='json', sort_keys=True, indent=2,
+                  atomic=False, buffer_size=1, fsync=False)
+        with io.open(filepath, 'r') as f:
+            self.assertEqual(f.read(), d.to_json(sort_keys=True, indent=2))
+        d.to_file(filepath, format='pickle', raw=True)
+        self.assertEqual(IODict.from_pickle(filepath, raw=True), d)
+
+    def test_to_file_atomic(self):
+        filepath = self.output_path('test_to_file_atomic.msgpack')
+        IODict({ 'a': 1 }).to_file(filepath)
+        d = IODict({ 'a': 2, 'b': object() })
+        # the existing file is not replaced if encoding fails.
+        with self.assertRaises(Exception):
+            d.to_file(filepath)
+        self.assertEqual(IODict(filepath), { 'a': 1 })
+        dirpath = os.path.dirname(filepath)
+        self.assertEqual([filename for filename in os.listdir(dirpath)
+                          if filename.endswith('.tmp')], [])
+
+    def test_to_file_with_invalid_format(self):
+        d = IODict({ 'a': 1 })
+        with self.assertRaises(ValueError):
+            d.to_file(self.output_path('test_to_file.xxx'), format='xxx')
+        with self.assertRaises(ValueError):
+            d.to_file(self.output_path('test_to_file.xxx'), format='file')
+
+    def test_to_json_file_atomic(self):
+        d = IODict({ 'a': 1 })
+        filepath = self.output_path('test_to_json_file_atomic.json')
+        s = d.to_json(filepath=filepath, atomic=True, fsync=False)
+        with io.open(filepath, 'r') as f:
+            self.assertEqual(f.read(), s)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from benedict.dicts.io import IODict
+from benedict.dicts.io import IODict, io_util
+from benedict.serializers.json_backends import get_json_backend
 
 from .test_io_dict import io_dict_test_case
 
@@ -129,6 +130,70 @@ class io_dict_json_test_case(io_dict_test_case):
         with self.assertRaises(ValueError):
             IODict(filepath, format='json')
 
+    def test_from_json_with_lazy(self):
+        s = '{"a": {"b": 1}, "c": [ 1,2,3 ], "d": "x"}'
+        d = IODict.from_json(s, lazy=True)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d['a'], { 'b': 1 })
+        self.assertEqual(d, { 'a': { 'b': 1 }, 'c': [1, 2, 3], 'd': 'x' })
+        d = IODict.from_json(s, lazy=True)
+        d['d'] = 'y'
+        self.assertEqual(d.to_json(), '{"a": {"b": 1}, "c": [ 1,2,3 ], "d": "y"}')
+        self.assertEqual(d.to_json(sort_keys=True), '{"a": {"b": 1}, "c": [1, 2, 3], "d": "y"}')
+
+    def test_from_json_with_lazy_and_file(self):
+        filepath = self.input_path('valid-content.json')
+        d = IODict.from_json(filepath, lazy=True)
+        self.assertEqual(d, IODict.from_json(filepath))
+        d = IODict.from_json(filepath, lazy=True, mmap=True)
+        self.assertEqual(d, IODict.from_json(filepath))
+
+    def test_from_json_with_lazy_and_invalid_data(self):
+        with self.assertRaises(ValueError):
+            IODict.from_json('{"a": 1} x', lazy=True)
+
+    def test_from_json_with_mmap(self):
+        filepath = self.input_path('valid-content.json')
+        d = IODict.from_json(filepath, mmap=True)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d, IODict.from_json(filepath))
+
+    def test_from_json_with_mmap_only_with_bytes_backends(self):
+        filepath = self.input_path('valid-content.json')
+        r = IODict.from_json(filepath)
+        mmap_file = io_util.mmap_file
+        mapped = []
+        def mmap_file_spy(filepath):
+            mapped.append(filepath)
+            return mmap_file(filepath)
+        io_util.mmap_file = mmap_file_spy
+        try:
+            self.assertEqual(IODict.from_json(filepath, mmap=True), r)
+            self.assertEqual(IODict.from_json(filepath, mmap=True, lazy=True), r)
+            self.assertEqual(mapped, [])
+            d = IODict.from_json(filepath, mmap=True, backend='orjson')
+            self.assertEqual(d, r)
+        finally:
+            io_util.mmap_file = mmap_file
+        orjson_available = get_json_backend('orjson').name == 'orjson'
+        self.assertEqual(mapped, [filepath] if orjson_available else [])
+
+    def test_from_json_with_mmap_and_empty_file(self):
+        filepath = self.output_path('test_from_json_with_mmap_and_empty_file.json')
+        IODict({}).to_json(filepath=filepath)
+        with open(filepath, 'w'):
+            pass
+        with self.assertRaises(ValueError):
+            IODict.from_json(filepath, mmap=True)
+
+    def test_from_json_with_mmap_and_invalid_file(self):
+        filepath = self.input_path('invalid-file.json')
+        with self.assertRaises(ValueError):
+            IODict.from_json(filepath, mmap=True)
+        filepath = self.input_path('invalid-content.json')
+        with self.assertRaises(ValueError):
+            IODict.from_json(filepath, mmap=True)
+
     def test_from_json_with_valid_url_valid_content(self):
         url = self.input_url('valid-content.json')
         # static method
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from benedict.dicts.io import IODict
+
+from .test_io_dict import io_dict_test_case
+
+from six import StringIO
+
+import io
+
+
+class io_dict_jsonl_test_case(io_dict_test_case):
+
+    def test_from_jsonl_with_valid_data(self):
+        s = '{"a": 1, "b": 2}\n{"a": 3, "b": 4}\n\n[1, 2]\n'
+        r = {
+            'values': [
+                { 'a':1, 'b':2, },
+                { 'a':3, 'b':4, },
+                [1, 2],
+            ],
+        }
+        # static method
+        d = IODict.from_jsonl(s)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d, r)
+        # constructor
+        d = IODict(s, format='ndjson')
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d, r)
+
+    def test_from_jsonl_with_invalid_data(self):
+        s = '{"a": 1, "b": 2}\n{"a": 3, "b":\n'
+        # static method
+        with self.assertRaises(ValueError):
+            IODict.from_jsonl(s)
+        # constructor
+        with self.assertRaises(ValueError):
+            IODict(s, format='jsonl')
+
+    def test_from_jsonl_with_valid_file_valid_content(self):
+        filepath = self.input_path('valid-content.jsonl')
+        # static method
+        d = IODict.from_jsonl(filepath)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(len(d['values']), 3)
+        # constructor
+        d = IODict(filepath)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d['values'][2], { 'id':3, 'name':'Bob', })
+
+    def test_iter_jsonl_with_valid_file(self):
+        filepath = self.input_path('valid-content.jsonl')
+        items = IODict.iter_jsonl(filepath)
+        self.assertFalse(isinstance(items, list))
+        self.assertEqual(next(items), { 'id':1, 'name':'Alice', })
+        self.assertEqual(len(list(items)), 2)
+
+    def test_iter_jsonl_with_file_object(self):
+        f = StringIO('{"id": 1}\n\n{"id": 2}\n')
+        items = list(IODict.iter_jsonl(f, cast=True))
+        self.assertEqual(items, [{ 'id':1, }, { 'id':2, }])
+        self.assertTrue(all([isinstance(item, IODict) for item in items]))
+        # binary file object
+        f = io.BytesIO(b'{"id": 1}\r\n{"id": 2}\r\n')
+        items = list(IODict.iter_jsonl(f))
+        self.assertEqual(items, [{ 'id':1, }, { 'id':2, }])
+
+    def test_iter_jsonl_with_workers(self):
+        filepath = self.output_path('test_iter_jsonl_with_workers.jsonl')
+        d = IODict({
+            'values': [{ 'id':i, 'name':'name-{}'.format(i), } for i in range(100)],
+        })
+        d.to_jsonl(filepath=filepath)
+        items = list(IODict.iter_jsonl(filepath, workers=2, chunk_size=64))
+        self.assertEqual(items, d['values'])
+
+    def test_to_jsonl(self):
+        d = IODict({
+            'values': [
+                { 'a':1, 'b':[1, 2], },
+                { 'a':2, 'b':[3, 4], },
+            ],
+        })
+        s = d.to_jsonl(indent=4)
+        r = '{"a": 1, "b": [1, 2]}\n{"a": 2, "b": [3, 4]}\n'
+        self.assertEqual(s, r)
+        self.assertEqual(IODict.from_jsonl(s), d)
+
+    def test_to_jsonl_file_append(self):
+        filepath = self.output_path('test_to_jsonl_file_append.jsonl')
+        d = IODict({ 'values': [{ 'id':1, }, { 'id':2, }], })
+        d.to_jsonl(filepath=filepath)
+        d = IODict({ 'values': [{ 'id':3, }], })
+        d.to_jsonl(filepath=filepath, append=True)
+        self.assertFileExists(filepath)
+        items = list(IODict.iter_jsonl(filepath))
+        self.assertEqual(items, [{ 'id':1, }, { 'id':2, }, { 'id':3, }])
+
+    def test_to_jsonl_stream(self):
+        d = IODict({
+            'values': ({ 'id':i, } for i in range(3)),
+        })
+        f = StringIO()
+        s = d.to_jsonl(stream=f)
+        self.assertEqual(s, None)
+        self.assertEqual(f.getvalue(), '{"id": 0}\n{"id": 1}\n{"id": 2}\n')
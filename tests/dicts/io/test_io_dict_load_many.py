@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+from benedict import benedict
+from benedict.dicts.io import IODict
+
+from .test_io_dict import io_dict_test_case
+
+
+class io_dict_load_many_test_case(io_dict_test_case):
+
+    def _get_paths(self):
+        paths = [
+            ('test_load_many_1.json', { 'a': 1, 'b': { 'c': 1, 'l': [1] } }),
+            ('test_load_many_2.yml', { 'b': { 'd': 2, 'l': [2] } }),
+            ('test_load_many_3.toml', { 'a': 3, 'b': { 'l': [3] } }),
+        ]
+        filepaths = []
+        for filename, data in paths:
+            filepath = self.output_path(filename)
+            IODict(data).to_file(filepath, fsync=False)
+            filepaths.append(filepath)
+        return filepaths
+
+    def test_load_many(self):
+        paths = self._get_paths()
+        for workers in [None, 1, 2]:
+            d = benedict.load_many(paths, workers=workers)
+            self.assertTrue(isinstance(d, benedict))
+            self.assertEqual(d, { 'a': 3, 'b': { 'c': 1, 'd': 2, 'l': [3] } })
+            self.assertEqual(d['b.d'], 2)
+
+    def test_load_many_with_processes(self):
+        paths = self._get_paths()
+        d = IODict.load_many(paths, workers=2, processes=True)
+        self.assertTrue(isinstance(d, IODict))
+        self.assertEqual(d, { 'a': 3, 'b': { 'c': 1, 'd': 2, 'l': [3] } })
+
+    def test_load_many_with_merge_options(self):
+        paths = self._get_paths()
+        d = IODict.load_many(paths, workers=2, overwrite=False, concat=True)
+        self.assertEqual(d, { 'a': 1, 'b': { 'c': 1, 'd': 2, 'l': [1, 2, 3] } })
+        # order of paths is respected
+        d = IODict.load_many(reversed(paths), workers=2, concat=True)
+        self.assertEqual(d, { 'a': 1, 'b': { 'c': 1, 'd': 2, 'l': [3, 2, 1] } })
+
+    def test_load_many_without_merge(self):
+        paths = self._get_paths()
+        items = IODict.load_many(paths, merge=False, workers=2)
+        self.assertEqual(len(items), 3)
+        self.assertTrue(all([isinstance(item, IODict) for item in items]))
+        self.assertEqual(items[1], { 'b': { 'd': 2, 'l': [2] } })
+
+    def test_load_many_with_empty_paths(self):
+        self.assertEqual(IODict.load_many([]), {})
+        self.assertEqual(IODict.load_many([], merge=False), [])
+
+    def test_load_many_with_invalid_file(self):
+        paths = self._get_paths()
+        paths.append(self.input_path('invalid-content.json'))
+        with self.assertRaises(ValueError):
+            IODict.load_many(paths, workers=2)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from benedict.dicts.io import IODict
+
+from .test_io_dict import io_dict_test_case
+
+from decimal import Decimal
+
+import datetime as dt
+import io
+import unittest
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+@unittest.skipIf(msgpack is None, 'requires msgpack')
+class io_dict_msgpack_test_case(io_dict_test_case):
+
+    def test_from_msgpack_with_valid_data(self):
+        d = IODict({ 'a':1, 'b':[1, 2, 3], 'c':{ 'd':'hello', }, 'e':None, })
+        b = d.to_msgpack()
+        self.assertTrue(isinstance(b, bytes))
+        # static method
+        r = IODict.from_msgpack(b)
+        self.assertTrue(isinstance(r, dict))
+        self.assertEqual(r, d)
+        # constructor
+        r = IODict(b, format='msgpack')
+        self.assertTrue(isinstance(r, dict))
+        self.assertEqual(r, d)
+
+    def test_from_msgpack_with_extension_types(self):
+        d = IODict({
+            'datetime': dt.datetime(2020, 1, 2, 3, 4, 5),
+            'decimal': Decimal('1.10'),
+            'set': set([1, 2, 3]),
+            'tuple': (1, (2, 'b'), ),
+            'bytes': b'\x00\x01',
+            'nested': { 'values': [(1, 2, ), set(['x'])], },
+        })
+        r = IODict.from_msgpack(d.to_msgpack())
+        self.assertEqual(r, d)
+        self.assertTrue(isinstance(r['decimal'], Decimal))
+        self.assertTrue(isinstance(r['tuple'], tuple))
+        self.assertTrue(isinstance(r['tuple'][1], tuple))
+        self.assertTrue(isinstance(r['nested']['values'][1], set))
+        self.assertEqual(r['datetime'].tzinfo, None)
+
+    def test_from_msgpack_with_invalid_data(self):
+        # static method
+        with self.assertRaises(ValueError):
+            IODict.from_msgpack(b'\xc1\xff invalid')
+        # data must be bytes
+        with self.assertRaises(ValueError):
+            IODict.from_msgpack('{"a": 1}')
+
+    def test_from_msgpack_with_valid_file_valid_content(self):
+        filepath = self.input_path('valid-content.msgpack')
+        r = { 'a':1, 'b':[1, 2, 3], 'c':{ 'd':'hello', }, 'e':None, }
+        # static method
+        d = IODict.from_msgpack(filepath)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d, r)
+        # constructor
+        d = IODict(filepath)
+        self.assertTrue(isinstance(d, dict))
+        self.assertEqual(d, r)
+        # file object
+        d = IODict.from_file(filepath)
+        self.assertEqual(d, r)
+
+    def test_from_msgpack_with_valid_file_invalid_content(self):
+        filepath = self.input_path('invalid-content.msgpack')
+        # static method
+        with self.assertRaises(ValueError):
+            IODict.from_msgpack(filepath)
+        # constructor
+        with self.assertRaises(ValueError):
+            IODict(filepath, format='msgpack')
+
+    def test_from_msgpack_with_invalid_file(self):
+        filepath = self.input_path('invalid-file.msgpack')
+        # static method
+        with self.assertRaises(ValueError):
+            IODict.from_msgpack(filepath)
+
+    def test_to_msgpack_file(self):
+        d = IODict({ 'a':1, 'b':[1, 2, 3], 'c':dt.datetime(2020, 1, 1), })
+        filepath = self.output_path('test_to_msgpack_file.msgpack')
+        b = d.to_msgpack(filepath=filepath)
+        self.assertFileExists(filepath)
+        with io.open(filepath, 'rb') as f:
+            self.assertEqual(f.read(), b)
+        self.assertEqual(IODict.from_msgpack(filepath), d)
+
+    def test_to_msgpack_stream(self):
+        d = IODict({ 'a':1, 'b':[1, 2, 3], })
+        f = io.BytesIO()
+        b = d.to_msgpack(stream=f)
+        self.assertEqual(b, None)
+        f.seek(0)
+        self.assertEqual(IODict.from_stream(f, format='msgpack'), d)
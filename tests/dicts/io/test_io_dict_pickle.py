@@ -5,6 +5,11 @@ from benedict.dicts.io import IODict
 from .test_io_dict import io_dict_test_case
 
 import datetime as dt
+import io
+import pickle
+import six
+import sys
+import unittest
 
 
 class io_dict_pickle_test_case(io_dict_test_case):
@@ -130,3 +135,48 @@ class io_dict_pickle_test_case(io_dict_test_case):
         d.to_pickle(filepath=filepath)
         self.assertFileExists(filepath)
         self.assertEqual(d, IODict.from_pickle(filepath))
+
+    def test_to_pickle_with_default_protocol(self):
+        d = IODict(self._get_pickle_decoded())
+        b = d.to_pickle(raw=True)
+        protocol = 2 if six.PY2 else pickle.HIGHEST_PROTOCOL
+        self.assertEqual(b[:2], b'\x80' + bytes(bytearray([protocol])))
+
+    def test_to_pickle_raw(self):
+        d = IODict(self._get_pickle_decoded())
+        b = d.to_pickle(raw=True)
+        self.assertTrue(isinstance(b, bytes))
+        self.assertTrue(len(b) < len(d.to_pickle()))
+        # static method
+        self.assertEqual(IODict.from_pickle(b), self._get_pickle_decoded())
+        # constructor
+        self.assertEqual(IODict(b, format='pickle'), self._get_pickle_decoded())
+        # file object
+        f = io.BytesIO(b)
+        self.assertEqual(IODict.from_pickle(f), self._get_pickle_decoded())
+
+    def test_to_pickle_raw_with_protocol_0(self):
+        d = IODict(self._get_pickle_decoded())
+        b = d.to_pickle(raw=True, protocol=0)
+        self.assertEqual(IODict.from_pickle(b), self._get_pickle_decoded())
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'requires pickle protocol 5')
+    def test_to_pickle_raw_with_out_of_band_buffers(self):
+        data = bytearray(b'x' * 1024)
+        d = IODict({ 'data': pickle.PickleBuffer(data), })
+        buffers = []
+        b = d.to_pickle(raw=True, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertTrue(len(b) < len(data))
+        r = IODict.from_pickle(b, buffers=buffers)
+        self.assertEqual(bytes(r['data']), bytes(data))
+
+    def test_to_pickle_raw_file(self):
+        d = IODict({
+            'date': self._get_pickle_decoded(),
+        })
+        filepath = self.output_path('test_to_pickle_raw_file.pickle')
+        d.to_pickle(raw=True, filepath=filepath)
+        self.assertFileExists(filepath)
+        self.assertEqual(d, IODict.from_pickle(filepath))
+        self.assertEqual(d, IODict.from_file(filepath))
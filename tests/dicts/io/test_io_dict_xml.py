@@ -4,6 +4,10 @@ from benedict.dicts.io import IODict
 
 from .test_io_dict import io_dict_test_case
 
+from xml.parsers.expat import ExpatError
+
+import io
+
 
 class io_dict_xml_test_case(io_dict_test_case):
 
@@ -142,3 +146,47 @@ class io_dict_xml_test_case(io_dict_test_case):
         d.to_xml(filepath=filepath)
         self.assertFileExists(filepath)
         self.assertEqual(d, IODict.from_xml(filepath))
+
+    def test_iter_xml_with_valid_file(self):
+        filepath = self.input_path('valid-content-feed.xml')
+        items = IODict.iter_xml(filepath, 'feed.record')
+        self.assertFalse(isinstance(items, list))
+        self.assertEqual(next(items), { '@id':'1', 'name':'Alice', })
+        self.assertEqual(list(items), [
+            { '@id':'2', 'name':'Freddie', },
+            { '@id':'3', 'name':'François', },
+        ])
+
+    def test_iter_xml_with_file_object(self):
+        filepath = self.input_path('valid-content-feed.xml')
+        with io.open(filepath, 'rb') as f:
+            items = list(IODict.iter_xml(f, 'feed.record', cast=True, chunk_size=16))
+        self.assertEqual(len(items), 3)
+        self.assertTrue(all([isinstance(item, IODict) for item in items]))
+        self.assertEqual(items[2]['name'], 'François')
+        # items at other paths
+        with io.open(filepath, 'r', encoding='utf-8') as f:
+            items = list(IODict.iter_xml(f, ['feed', 'header']))
+        self.assertEqual(items, [{ 'title':'Lorem ipsum', }])
+
+    def test_iter_xml_with_invalid_data(self):
+        f = io.BytesIO(b'<feed><record>1</record><record>2</feed>')
+        items = IODict.iter_xml(f, 'feed.record')
+        with self.assertRaises(ExpatError):
+            list(items)
+
+    def test_to_xml_stream(self):
+        d = IODict({
+            'feed': {
+                'record': ({ '@id':str(i), 'name':'name-{}'.format(i), } for i in range(3)),
+            },
+        })
+        f = io.StringIO()
+        s = d.to_xml(stream=f)
+        self.assertEqual(s, None)
+        items = list(IODict.iter_xml(io.StringIO(f.getvalue()), 'feed.record'))
+        self.assertEqual(items, [
+            { '@id':'0', 'name':'name-0', },
+            { '@id':'1', 'name':'name-1', },
+            { '@id':'2', 'name':'name-2', },
+        ])
@@ -4,6 +4,8 @@ from benedict.dicts.io import IODict
 
 from .test_io_dict import io_dict_test_case
 
+import io
+
 
 class io_dict_yaml_test_case(io_dict_test_case):
 
@@ -134,3 +136,52 @@ b:
         d.to_yaml(filepath=filepath)
         self.assertFileExists(filepath)
         self.assertEqual(d, IODict.from_yaml(filepath))
+
+    def test_from_yaml_all_with_valid_data(self):
+        s = 'a: 1\n---\nb: 2\n---\n---\n- 3\n'
+        docs = IODict.from_yaml_all(s)
+        self.assertFalse(isinstance(docs, list))
+        docs = list(docs)
+        self.assertEqual(docs, [{ 'a':1, }, { 'b':2, }, { 'values':[3], }])
+        self.assertTrue(all([isinstance(doc, IODict) for doc in docs]))
+
+    def test_from_yaml_all_with_invalid_data(self):
+        s = 'a: 1\n---\nb: [2\n'
+        docs = IODict.from_yaml_all(s)
+        self.assertEqual(next(docs), { 'a':1, })
+        with self.assertRaises(ValueError):
+            next(docs)
+
+    def test_from_yaml_all_with_valid_file_valid_content(self):
+        filepath = self.input_path('valid-content-multi.yml')
+        docs = list(IODict.from_yaml_all(filepath))
+        self.assertEqual(len(docs), 3)
+        self.assertEqual(docs[1]['kind'], 'Deployment')
+        self.assertEqual(docs[2], { 'values':['a', 'b'], })
+        # file object
+        with io.open(filepath, 'rb') as f:
+            docs = list(IODict.from_yaml_all(f))
+        self.assertEqual(len(docs), 3)
+
+    def test_from_yaml_all_with_invalid_file(self):
+        filepath = self.input_path('invalid-file.yml')
+        with self.assertRaises(ValueError):
+            list(IODict.from_yaml_all(filepath))
+
+    def test_from_yaml_with_custom_constructor(self):
+        # constructors added to SafeLoader are used by the libyaml loader too.
+        import yaml
+        class Tagged(yaml.YAMLObject):
+            yaml_loader = yaml.SafeLoader
+            yaml_tag = '!Tagged'
+
+            def __init__(self, value):
+                self.value = value
+
+            @classmethod
+            def from_yaml(cls, loader, node):
+                return cls(node.value)
+
+        d = IODict.from_yaml('a: !Tagged b\n')
+        self.assertTrue(isinstance(d['a'], Tagged))
+        self.assertEqual(d['a'].value, 'b')
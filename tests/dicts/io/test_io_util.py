@@ -2,6 +2,7 @@
 
 from benedict.dicts.io import io_util
 
+import io
 import unittest
 
 
@@ -19,6 +20,11 @@ class io_util_test_case(unittest.TestCase):
         s = 'path-to/data.xml'
         self.assertEqual(io_util.autodetect_format(s), 'xml')
 
+    def test_autodetect_format_by_path_with_similar_extensions(self):
+        self.assertEqual(io_util.autodetect_format('path-to/data.json'), 'json')
+        self.assertEqual(io_util.autodetect_format('path-to/data.jsonl'), 'jsonl')
+        self.assertEqual(io_util.autodetect_format('path-to/data.ndjson'), 'ndjson')
+
     def test_autodetect_format_by_path_with_unsupported_format(self):
         s = 'path-to/data.jpg'
         self.assertEqual(io_util.autodetect_format(s), None)
@@ -31,6 +37,13 @@ class io_util_test_case(unittest.TestCase):
         s = 'https://github.com/fabiocaccamo/python-benedict.jpg'
         self.assertEqual(io_util.autodetect_format(s), None)
 
+    def test_is_binary_format(self):
+        self.assertTrue(io_util.is_binary_format('msgpack'))
+        self.assertTrue(io_util.is_binary_format('cbor'))
+        self.assertFalse(io_util.is_binary_format('json'))
+        self.assertTrue(io_util.is_binary_format('pickle'))
+        self.assertFalse(io_util.is_binary_format('xxx'))
+
     def test_decode_with_invalid_format(self):
         with self.assertRaises(ValueError):
             io_util.decode('', format='xxx')
@@ -44,13 +57,35 @@ class io_util_test_case(unittest.TestCase):
             io_util.encode({}, format='xxx')
 
     def test_is_data(self):
-        # TODO
-        pass
+        self.assertTrue(io_util.is_data('a: 1\nb: 2'))
+        self.assertFalse(io_util.is_data('path-to/data.json'))
+        # long strings are data, even without line breaks.
+        self.assertTrue(io_util.is_data('a' * (io_util.PATH_MAX_LENGTH + 1)))
 
     def test_is_filepath(self):
         # TODO
         pass
 
+    def test_is_stream(self):
+        self.assertTrue(io_util.is_stream(io.BytesIO(b'{}')))
+        self.assertTrue(io_util.is_stream(io.StringIO(u'{}')))
+        self.assertFalse(io_util.is_stream('{}'))
+        self.assertFalse(io_util.is_stream(b'{}'))
+
+    def test_autodetect_format_by_stream_name(self):
+        f = io.BytesIO(b'')
+        self.assertEqual(io_util.autodetect_format(f), None)
+        f.name = 'path-to/data.yml'
+        self.assertEqual(io_util.autodetect_format(f), 'yml')
+
+    def test_decode_bytes_with_invalid_format(self):
+        with self.assertRaises(ValueError):
+            io_util.decode_bytes(b'', format='xxx')
+
+    def test_decode_stream_with_invalid_format(self):
+        with self.assertRaises(ValueError):
+            io_util.decode_stream(io.BytesIO(b''), format='xxx')
+
     def test_is_url(self):
         # TODO
         pass
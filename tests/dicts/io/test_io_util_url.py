@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+from benedict import benedict, set_url_options
+from benedict.dicts.io import io_util
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+try:
+    # python 3
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    # python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+
+    # path -> (content, headers)
+    responses = {}
+    requests = []
+    delay = 0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        self.requests.append((self.path, dict(self.headers), ))
+        if self.path not in self.responses:
+            self.send_response(404)
+            self.end_headers()
+            return
+        content, headers = self.responses[self.path]
+        etag = headers.get('ETag')
+        if etag and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class io_util_url_test_case(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), _RequestHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever)
+        cls.server_thread.daemon = True
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        io_util.clear_url_cache()
+        _RequestHandler.responses = {
+            '/data.json': (b'{"a": 1, "b": "\xc3\xa8"}', {
+                'Content-Type': 'application/json',
+                'ETag': '"v1"',
+            }),
+            '/no-cache.json': (b'{"a": 1}', {
+                'Content-Type': 'application/json',
+            }),
+        }
+        _RequestHandler.requests = []
+        _RequestHandler.delay = 0
+        self._url_options = io_util._url_options.copy()
+
+    def tearDown(self):
+        io_util._url_options.update(self._url_options)
+        io_util.clear_url_cache()
+
+    def local_url(self, path):
+        return 'http://127.0.0.1:{}/{}'.format(
+            self.server.server_address[1], path)
+
+    def test_read_url(self):
+        s = io_util.read_url(self.local_url('data.json'))
+        self.assertEqual(s, u'{"a": 1, "b": "\xe8"}')
+        b = io_util.read_url_bytes(self.local_url('data.json'))
+        self.assertEqual(b, b'{"a": 1, "b": "\xc3\xa8"}')
+
+    def test_read_url_with_invalid_url(self):
+        with self.assertRaises(Exception):
+            io_util.read_url(self.local_url('invalid.json'))
+        with self.assertRaises(ValueError):
+            benedict(self.local_url('invalid.json'))
+
+    def test_read_url_with_etag(self):
+        url = self.local_url('data.json')
+        d = benedict(url)
+        self.assertEqual(d, { 'a':1, 'b':u'\xe8', })
+        d = benedict(url)
+        self.assertEqual(d, { 'a':1, 'b':u'\xe8', })
+        requests = _RequestHandler.requests
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[0][1].get('If-None-Match'), None)
+        self.assertEqual(requests[1][1].get('If-None-Match'), '"v1"')
+        # content changed
+        _RequestHandler.responses['/data.json'] = (b'{"a": 2}', { 'ETag': '"v2"', })
+        d = benedict(url)
+        self.assertEqual(d, { 'a':2, })
+
+    def test_read_url_without_validators(self):
+        url = self.local_url('no-cache.json')
+        benedict(url)
+        benedict(url)
+        requests = _RequestHandler.requests
+        self.assertEqual(requests[1][1].get('If-None-Match'), None)
+        self.assertEqual(len(io_util._url_cache), 0)
+
+    def test_read_url_with_cache_disabled(self):
+        url = self.local_url('data.json')
+        io_util.read_url(url, cache=False)
+        io_util.read_url(url, cache=False)
+        requests = _RequestHandler.requests
+        self.assertEqual(requests[1][1].get('If-None-Match'), None)
+        set_url_options(cache=False)
+        benedict(url)
+        self.assertEqual(len(io_util._url_cache), 0)
+
+    def test_read_url_with_cache_dir(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            io_util.set_url_options(cache_dir=cache_dir)
+            url = self.local_url('data.json')
+            benedict(url)
+            # simulate a new process.
+            io_util.clear_url_cache()
+            d = benedict(url)
+            self.assertEqual(d, { 'a':1, 'b':u'\xe8', })
+            requests = _RequestHandler.requests
+            self.assertEqual(requests[1][1].get('If-None-Match'), '"v1"')
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def test_read_url_cache_max_bytes(self):
+        maxbytes = io_util._url_cache_maxbytes
+        _RequestHandler.responses['/big.json'] = (b'{"a": "' + b'x' * 30 + b'"}', {
+            'ETag': '"v1"',
+        })
+        try:
+            io_util._url_cache_maxbytes = 30
+            # bigger contents are not kept in memory.
+            benedict(self.local_url('big.json'))
+            self.assertEqual(len(io_util._url_cache), 0)
+            self.assertEqual(io_util._url_cache_bytes, 0)
+            # oldest entries are evicted when the total size is exceeded.
+            io_util._url_cache_maxbytes = 50
+            benedict(self.local_url('data.json'))
+            self.assertEqual(len(io_util._url_cache), 1)
+            benedict(self.local_url('big.json'))
+            self.assertEqual(list(io_util._url_cache.keys()), [self.local_url('big.json')])
+            self.assertEqual(io_util._url_cache_bytes, 39)
+            d = benedict(self.local_url('big.json'))
+            self.assertEqual(d, { 'a':'x' * 30 })
+            self.assertEqual(_RequestHandler.requests[-1][1].get('If-None-Match'), '"v1"')
+        finally:
+            io_util._url_cache_maxbytes = maxbytes
+
+    def test_read_url_with_max_size(self):
+        url = self.local_url('data.json')
+        with self.assertRaises(ValueError):
+            io_util.read_url(url, max_size=10)
+        io_util.set_url_options(max_size=10)
+        with self.assertRaises(ValueError):
+            benedict(url)
+        io_util.set_url_options(max_size=1024)
+        self.assertEqual(benedict(url), { 'a':1, 'b':u'\xe8', })
+
+    def test_iter_decode_with_url(self):
+        _RequestHandler.responses['/data.jsonl'] = (b'{"a": 1}\n{"a": 2}\n', {})
+        _RequestHandler.responses['/data.csv'] = (b'a,b\n1,2\n3,4\n', {})
+        _RequestHandler.responses['/data.yml'] = (b'a: 1\n---\na: 2\n', {})
+        items = list(benedict.iter_jsonl(self.local_url('data.jsonl')))
+        self.assertEqual(items, [{ 'a':1 }, { 'a':2 }])
+        items = list(benedict.iter_csv(self.local_url('data.csv')))
+        self.assertEqual(items, [{ 'a':'1', 'b':'2' }, { 'a':'3', 'b':'4' }])
+        items = list(benedict.from_yaml_all(self.local_url('data.yml')))
+        self.assertEqual(items, [{ 'a':1 }, { 'a':2 }])
+
+    def test_read_url_with_timeout(self):
+        _RequestHandler.delay = 0.5
+        io_util.set_url_options(timeout=0.1)
+        with self.assertRaises(ValueError):
+            benedict(self.local_url('data.json'))
+
+    def test_read_url_uses_shared_session(self):
+        io_util.read_url(self.local_url('data.json'))
+        session = io_util._url_session
+        self.assertTrue(session is not None)
+        io_util.read_url(self.local_url('no-cache.json'))
+        self.assertTrue(io_util._url_session is session)
+
+    def test_set_url_options_with_invalid_option(self):
+        with self.assertRaises(ValueError):
+            io_util.set_url_options(invalid=True)
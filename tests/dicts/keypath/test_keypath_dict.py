@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from benedict.dicts.keypath import KeypathDict
+from benedict.dicts.keypath import KeypathDict, compile_keypath
+from benedict.serializers.json_lazy import LazyJSONDict
 
 import unittest
 
@@ -893,3 +894,95 @@ class keypath_dict_test_case(unittest.TestCase):
         self.assertEqual(b['y.z.b'], 0)
         self.assertEqual(b['y.z.c'], 1)
         self.assertEqual(b['y.z.d'], 2)
+
+    def test_compiled_keypath(self):
+        d = {
+            'a': {
+                'b': [
+                    {
+                        'c': 1,
+                    },
+                ],
+            },
+        }
+        b = KeypathDict(d)
+        kp = compile_keypath('a.b[0].c')
+        self.assertEqual(b[kp], 1)
+        self.assertEqual(b.get(kp), 1)
+        self.assertTrue(kp in b)
+        b[kp] = 2
+        self.assertEqual(b['a.b[0].c'], 2)
+        self.assertEqual(b.pop(kp), 2)
+        self.assertFalse(kp in b)
+
+    def test_compiled_keypath_with_custom_separator(self):
+        d = {
+            'a.b': {
+                'c.d': 1,
+            },
+        }
+        b = KeypathDict(d, keypath_separator='/')
+        kp = compile_keypath('a.b/c.d', separator='/')
+        self.assertEqual(b[kp], 1)
+
+    def test_init_with_invalid_validate_mode(self):
+        with self.assertRaises(ValueError):
+            KeypathDict({}, validate='invalid')
+
+    def test_validate_eager(self):
+        b = KeypathDict()
+        self.assertEqual(b.validate, 'eager')
+        with self.assertRaises(ValueError):
+            b['a'] = {'b': {'c.d': 1}}
+        with self.assertRaises(ValueError):
+            b['a'] = {'b': [{'c.d': 1}]}
+        with self.assertRaises(ValueError):
+            KeypathDict({'a': {'b.c': 1}})
+
+    def test_validate_eager_skips_validated_subtrees(self):
+        b = KeypathDict()
+        c = KeypathDict({'x': {'y': 1}})
+        self.assertTrue(b._is_validated(c))
+        b['a'] = c
+        self.assertEqual(b['a.x.y'], 1)
+        # subtrees validated with a different separator are checked again
+        c = KeypathDict({'x': {'y.z': 1}}, keypath_separator='/')
+        self.assertFalse(b._is_validated(c))
+        with self.assertRaises(ValueError):
+            b['a'] = c
+
+    def test_validate_eager_checks_not_validated_subtrees(self):
+        b = KeypathDict()
+        # keys not checked on init
+        c = KeypathDict({'x': {'y.z': 1}}, check_keys=False)
+        with self.assertRaises(ValueError):
+            b['a'] = c
+        # nested keys not checked on init
+        c = KeypathDict({'x': {'y.z': 1}}, validate='lazy')
+        with self.assertRaises(ValueError):
+            b['a'] = c
+        # nested values not decoded yet, so not checked on init
+        c = KeypathDict(LazyJSONDict.decode('{"x": {"y.z": 1}}'))
+        c.dict().load_all()
+        with self.assertRaises(ValueError):
+            b['a'] = c
+
+    def test_validate_lazy(self):
+        b = KeypathDict({'a': {'b.c': 1}}, validate='lazy')
+        self.assertEqual(b.validate, 'lazy')
+        b['x'] = {'y': {'z.w': 1}}
+        b.update({'k': {'j.i': 2}})
+        with self.assertRaises(ValueError):
+            b['x'] = {'y.z': 1}
+        with self.assertRaises(ValueError):
+            b.update({'k.j': 2})
+        with self.assertRaises(ValueError):
+            KeypathDict({'a.b': 1}, validate='lazy')
+
+    def test_validate_off(self):
+        b = KeypathDict({'a.b': 1}, validate='off')
+        self.assertEqual(b.validate, 'off')
+        b['x'] = {'y.z': 1}
+        b.update({'k.j': 2})
+        b.keypath_separator = '.'
+        self.assertEqual(b['x'], {'y.z': 1})
@@ -44,3 +44,40 @@ class keypath_util_test_case(unittest.TestCase):
         self.assertEqual(f('item[-1]1][-1]1]'), ['item[-1]1][-1]1]'])
         self.assertEqual(f('item[-1]][-1]]'), ['item[-1]][-1]]'])
         self.assertEqual(f('item[[-1]][[-1]]'), ['item[[-1]][[-1]]'])
+
+    def test_compile_keypath(self):
+        f = keypath_util.compile_keypath
+        keys = f('a.b[0].c')
+        self.assertTrue(isinstance(keys, keypath_util.CompiledKeypath))
+        self.assertEqual(list(keys), ['a', 'b', 0, 'c'])
+        self.assertEqual(list(f('a/b[-1]', separator='/')), ['a', 'b', -1])
+        self.assertEqual(list(f(['a.b', 'c'])), ['a', 'b', 'c'])
+        # compiled keypath is not parsed again
+        self.assertEqual(keypath_util.parse_keys(keys, '/'), ['a', 'b', 0, 'c'])
+
+    def test_parse_keys_cached(self):
+        cache = keypath_util.get_keypath_cache('|')
+        cache.clear()
+        f = keypath_util.parse_keys_cached
+        self.assertEqual(f('a|b[1]', '|'), ('a', 'b', 1, ))
+        self.assertEqual(f('a|b[1]', '|'), ('a', 'b', 1, ))
+        self.assertEqual(f(['a|b', 'c'], '|'), ('a', 'b', 'c', ))
+        self.assertEqual(cache.info(), {
+            'hits': 1,
+            'misses': 1,
+            'maxsize': keypath_util.KEYPATH_CACHE_MAXSIZE,
+            'size': 1,
+        })
+
+    def test_keypath_cache_maxsize(self):
+        cache = keypath_util.KeypathCache('.', maxsize=2)
+        cache.get('a.b')
+        cache.get('c.d')
+        cache.get('a.b')
+        cache.get('e.f')
+        # 'c.d' is the least recently used keypath
+        self.assertEqual(cache.info()['size'], 2)
+        cache.get('a.b')
+        self.assertEqual(cache.hits, 2)
+        cache.get('c.d')
+        self.assertEqual(cache.misses, 4)
@@ -4,6 +4,7 @@ from benedict import benedict
 from datetime import datetime
 from decimal import Decimal
 
+import pickle
 import re
 import unittest
 
@@ -102,6 +103,18 @@ class benedict_test_case(unittest.TestCase):
         c = b.copy()
         self.assertEqual(c.keypath_separator, '/')
 
+    def test_custom_attributes(self):
+        b = benedict({ 'a': { 'b': 1 } })
+        b.foo = 1
+        self.assertEqual(b.foo, 1)
+        self.assertEqual(b, { 'a': { 'b': 1 } })
+        c = pickle.loads(pickle.dumps(b))
+        self.assertEqual(c.foo, 1)
+        self.assertEqual(c, b)
+        v = b['a']
+        v.bar = 2
+        self.assertEqual(v.bar, 2)
+
     def test_deepcopy(self):
         d = {
             'a': {
@@ -595,6 +608,20 @@ class benedict_test_case(unittest.TestCase):
         self.assertTrue(isinstance(d, benedict))
         self.assertEqual(d, { 'a': 1, 'b': 2, 'c': 3, })
 
+    def test_from_json_with_lazy(self):
+        j = '{"a": {"b": {"c": 1}}, "x": [ 1,2 ], "y.z": 1}'
+        with self.assertRaises(ValueError):
+            d = benedict.from_json(j, lazy=True)
+        j = '{"a": {"b": {"c": 1}}, "x": [ 1,2 ]}'
+        d = benedict.from_json(j, lazy=True)
+        self.assertTrue(isinstance(d, benedict))
+        self.assertEqual(d['a.b.c'], 1)
+        d['a.b.d'] = 2
+        self.assertEqual(d.to_json(), '{"a": {"b": {"c": 1, "d": 2}}, "x": [ 1,2 ]}')
+        d = benedict.from_json(j, lazy=2)
+        d['a.b.c'] = 3
+        self.assertEqual(d.to_json(), '{"a": {"b": {"c": 3}}, "x": [ 1,2 ]}')
+
     def test_from_query_string_with_valid_data(self):
         s = 'ok=1&test=2&page=3&lib=python%20benedict&author=Fabio+Caccamo&author=Fabio%20Caccamo'
         r = { 'ok': '1', 'test': '2', 'page': '3', 'lib':'python benedict', 'author':'Fabio Caccamo' }
@@ -1150,6 +1177,26 @@ b:
         m = b.match('results[*]/props[2]')
         self.assertEqual(m, [3, 6, 9])
 
+    def test_match_returns_benedict_instances(self):
+        d = {
+            'a': {
+                'b': { 'c': 1 },
+                'd': [{ 'e': 2 }],
+            },
+        }
+        b = benedict(d, keypath_separator='/')
+        m = b.match('a/*')
+        self.assertEqual(m, [{ 'c': 1 }, 1, [{ 'e': 2 }], { 'e': 2 }, 2])
+        self.assertTrue(isinstance(m[0], benedict))
+        self.assertTrue(isinstance(m[3], benedict))
+        self.assertEqual(m[0].keypath_separator, '/')
+        m = b.match('a/b', with_keypaths=True, glob=True)
+        self.assertEqual(m, [('a/b', { 'c': 1 }, )])
+        self.assertTrue(isinstance(m[0][1], benedict))
+        # values are pointers to the original dict.
+        m[0][1]['c'] = 3
+        self.assertEqual(d['a']['b']['c'], 3)
+
     def test_merge_with_single_dict(self):
         d = {
             'a': 1,
@@ -2,7 +2,12 @@
 
 from benedict import benedict
 
+import copy
+import gc
+import json
+import pickle
 import unittest
+import weakref
 
 
 class benedict_casting_test_case(unittest.TestCase):
@@ -158,3 +163,64 @@ class benedict_casting_test_case(unittest.TestCase):
         self.assertEqual(type(c), benedict)
         with self.assertRaises(KeyError):
             d['b']['c']
+
+    def test_view(self):
+        d = {
+            'a': {
+                'b': {
+                    'c': 1,
+                },
+            },
+        }
+        b = benedict(d, keypath_separator='/', validate='lazy')
+        v = b['a']
+        self.assertTrue(v.dict() is d['a'])
+        self.assertTrue(b.get('a').dict() is d['a'])
+        self.assertEqual(v.keypath_separator, '/')
+        self.assertEqual(v.validate, 'lazy')
+        self.assertTrue(v['b'].dict() is d['a']['b'])
+        b.keypath_separator = '.'
+        self.assertEqual(b['a'].keypath_separator, '.')
+
+    def test_view_of_not_validated_dict(self):
+        b = benedict()
+        c = benedict({'x': {'y': {'z.w': 1}}}, validate='lazy')
+        with self.assertRaises(ValueError):
+            b['a'] = c['x']
+        c = benedict({'x': {'y': {'z': 1}}})
+        # views of validated dicts are validated too
+        self.assertTrue(b._is_validated(c['x']))
+        b['a'] = c['x']
+        self.assertEqual(b['a.y.z'], 1)
+
+    def test_view_of_popped_child_is_freed(self):
+        b = benedict({'a': {'b': {'c': 1}}})
+        v = b['a']
+        child = b.pop('a')
+        self.assertTrue(v.dict() is child.dict())
+        child_ref = weakref.ref(v)
+        del v, child
+        gc.collect()
+        self.assertTrue(child_ref() is None)
+        self.assertEqual(b, {})
+
+    def test_view_with_child_changed(self):
+        d = {
+            'a': {},
+        }
+        b = benedict(d)
+        v = b['a']
+        d['a']['x'] = 1
+        b['a.y'] = 2
+        v = b['a']
+        self.assertEqual(v, {'x': 1, 'y': 2})
+        self.assertEqual(json.dumps(v, sort_keys=True), '{"x": 1, "y": 2}')
+
+    def test_view_not_pickled(self):
+        b = benedict({'a': {'b': 1}})
+        b['a']
+        c = pickle.loads(pickle.dumps(b))
+        self.assertEqual(c, b)
+        self.assertEqual(c['a'], {'b': 1})
+        c = copy.copy(b)
+        self.assertEqual(c['a'], {'b': 1})
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+from benedict import benedict
+from benedict.serializers import (
+    JSONSerializer, get_json_backend, set_json_backend, )
+
+from datetime import datetime
+from decimal import Decimal
+
+import unittest
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _is_available(name):
+    return get_json_backend(name).name == name
+
+
+class json_backends_test_case(unittest.TestCase):
+
+    def tearDown(self):
+        set_json_backend('json')
+
+    def test_get_json_backend(self):
+        self.assertEqual(get_json_backend().name, 'json')
+        self.assertEqual(get_json_backend('json').name, 'json')
+        self.assertTrue(get_json_backend('auto').name in ['json', 'orjson', 'ujson'])
+        with self.assertRaises(ValueError):
+            get_json_backend('xxx')
+
+    def test_get_json_backend_not_installed_fallback(self):
+        for name in ['orjson', 'ujson']:
+            backend = get_json_backend(name)
+            if not _is_available(name):
+                self.assertEqual(backend.name, 'json')
+
+    def test_set_json_backend(self):
+        set_json_backend('auto')
+        self.assertEqual(get_json_backend().name, get_json_backend('auto').name)
+        with self.assertRaises(ValueError):
+            set_json_backend('xxx')
+        self.assertEqual(get_json_backend().name, get_json_backend('auto').name)
+
+    def test_decode_with_backends(self):
+        s = '{"a": 1, "b": {"c": [1, 2.5, "x", null, true]}}'
+        r = { 'a': 1, 'b': { 'c': [1, 2.5, 'x', None, True] } }
+        serializer = JSONSerializer()
+        for name in ['auto', 'json', 'orjson', 'ujson']:
+            self.assertEqual(serializer.decode(s, backend=name), r)
+            self.assertEqual(serializer.decode_bytes(s.encode('utf-8'), backend=name), r)
+
+    def test_decode_with_unsupported_options_fallback(self):
+        s = '{"a": 1.5}'
+        serializer = JSONSerializer()
+        for name in ['auto', 'orjson', 'ujson']:
+            d = serializer.decode(s, backend=name, parse_float=Decimal)
+            self.assertEqual(d, { 'a': Decimal('1.5') })
+
+    def test_encode_with_backends(self):
+        d = benedict({
+            'a': {
+                'b': set([1]),
+                'c': datetime(2020, 1, 2, 3, 4, 5),
+                'd': Decimal('1.10'),
+                'e': benedict({ 'f': 1 }),
+            },
+            1: None,
+        })
+        r = { 'a': { 'b': [1], 'c': '2020-01-02T03:04:05', 'd': '1.10', 'e': { 'f': 1 } }, '1': None }
+        serializer = JSONSerializer()
+        for name in ['auto', 'json', 'orjson', 'ujson']:
+            s = serializer.encode(d, backend=name)
+            self.assertEqual(serializer.decode(s), r)
+            s = serializer.encode(d['a'], backend=name, sort_keys=True, indent=2)
+            self.assertEqual(s, serializer.encode(d['a'], backend='json', sort_keys=True, indent=2))
+
+    def test_encode_with_unsupported_values_fallback(self):
+        d = { 'a': 2 ** 70, 'b': [1, u'è'] }
+        serializer = JSONSerializer()
+        for name in ['auto', 'json', 'orjson', 'ujson']:
+            s = serializer.encode(d, backend=name)
+            self.assertEqual(serializer.decode(s), d)
+        s = serializer.encode(d, backend='orjson')
+        self.assertEqual(s, u'{"a":1180591620717411303424,"b":[1,"è"]}')
+
+    def test_encode_with_unsupported_options_fallback(self):
+        d = { 'a': 1, 'b': [1, 2] }
+        serializer = JSONSerializer()
+        for name in ['auto', 'orjson', 'ujson']:
+            s = serializer.encode(d, backend=name, indent=4, sort_keys=True)
+            self.assertEqual(s, '{\n    "a": 1,\n    "b": [\n        1,\n        2\n    ]\n}')
+            s = serializer.encode(d, backend=name, separators=(', ', ': '))
+            self.assertEqual(s, '{"a": 1, "b": [1, 2]}')
+
+    def test_io_dict_with_backends(self):
+        for name in ['auto', 'json', 'orjson', 'ujson']:
+            set_json_backend(name)
+            d = benedict.from_json('{"a": {"b": 1}}')
+            self.assertEqual(d['a.b'], 1)
+            self.assertEqual(benedict.from_json(d.to_json()), d)
+            self.assertEqual(d.dump(), '{\n    "a": {\n        "b": 1\n    }\n}')
+            self.assertEqual(benedict({ 'x': '{"y": 1}' }).get_dict('x'), { 'y': 1 })
+            self.assertEqual(benedict({ 'x': '[1, 2]' }).get_list('x'), [1, 2])
+
+    @unittest.skipIf(ujson is None, 'ujson not installed')
+    def test_encode_with_ujson(self):
+        r = { 'a': { 'b': 1 } }
+        d = benedict(r)
+        d['c'] = (Decimal('1.5'), datetime(2020, 1, 2), set([2]))
+        d['e'] = benedict({ 'f': { 'g': 1 } })['f']
+        r['a']['b'] = 2
+        serializer = JSONSerializer()
+        s = serializer.encode(d, backend='ujson', sort_keys=True)
+        self.assertEqual(s, '{"a":{"b":2},"c":["1.5","2020-01-02T00:00:00",[2]],"e":{"g":1}}')
+        self.assertEqual(s, serializer.encode(d, backend='json', sort_keys=True, separators=(',', ':')))
+        s = serializer.encode({ 'x': d['a'] }, backend='ujson')
+        self.assertEqual(s, '{"x":{"b":2}}')
+        s = get_json_backend('ujson').encode(benedict({ 'a': { 'b': Decimal('1.5') } })['a'], default=str)
+        self.assertEqual(s, '{"b":"1.5"}')
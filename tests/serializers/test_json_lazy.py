@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+from benedict import benedict
+from benedict.core import clone
+from benedict.serializers.json_lazy import LazyJSONDict
+
+import copy
+import json
+import pickle
+import unittest
+
+
+class json_lazy_test_case(unittest.TestCase):
+
+    def _encode(self, d):
+        return json.dumps(d)
+
+    def test_decode(self):
+        s = '{"a": {"b": 1}, "c": [1, 2, 3], "d": "x", "e": null, "f": 1.5}'
+        d = LazyJSONDict.decode(s)
+        self.assertTrue(isinstance(d, LazyJSONDict))
+        self.assertEqual(d.peek_items(), [
+            ('a', None), ('c', None), ('d', None), ('e', None), ('f', None), ])
+        self.assertEqual(d['a'], { 'b': 1 })
+        self.assertEqual(d.peek_items()[0], ('a', { 'b': 1 }))
+        self.assertEqual(d.peek_items()[1], ('c', None))
+        self.assertEqual(d, json.loads(s))
+
+    def test_decode_with_escaped_keys_and_whitespace(self):
+        s = '\n { "a\\"b" :\t1 ,\n "\\u00e8" : [ ] }\n'
+        d = LazyJSONDict.decode(s)
+        self.assertEqual(d, { 'a"b': 1, u'è': [] })
+
+    def test_decode_with_empty_object(self):
+        d = LazyJSONDict.decode('{ }')
+        self.assertEqual(d, {})
+        self.assertEqual(d.encode(self._encode), '{}')
+
+    def test_decode_with_non_object(self):
+        self.assertEqual(LazyJSONDict.decode('[1, 2]'), [1, 2])
+        self.assertEqual(LazyJSONDict.decode('1'), 1)
+
+    def test_decode_with_invalid_data(self):
+        with self.assertRaises(ValueError):
+            LazyJSONDict.decode('{"a": 1')
+        with self.assertRaises(ValueError):
+            LazyJSONDict.decode('{"a": 1} x')
+        with self.assertRaises(ValueError):
+            LazyJSONDict.decode('{"a": tru}')
+        with self.assertRaises(ValueError):
+            LazyJSONDict.decode('{"a" 1}')
+        with self.assertRaises(ValueError):
+            LazyJSONDict.decode('{"a": 1 "b": 2}')
+
+    def test_decode_skips_values_without_decoding(self):
+        s = '{"a": [1, "]", {"b": "}"}], "c": {"d": [[]]}, "e": -1.5e3, "f": true}'
+        d = LazyJSONDict.decode(s)
+        self.assertEqual(d.peek_items(), [
+            ('a', None), ('c', None), ('e', None), ('f', None), ])
+        self.assertEqual(d, json.loads(s))
+        with self.assertRaises(ValueError):
+            LazyJSONDict.decode('{"a": [1, 2}')
+        with self.assertRaises(ValueError):
+            LazyJSONDict.decode('{"a": [1, 2')
+
+    def test_decode_with_nan_and_infinity(self):
+        # accepted by json.loads, lazy and eager results must be the same.
+        s = '{"a": NaN, "b": Infinity, "c": -Infinity, "d": [NaN, 1]}'
+        d = LazyJSONDict.decode(s)
+        self.assertEqual(d.peek_items(), [
+            ('a', None), ('b', None), ('c', None), ('d', None), ])
+        # NaN != NaN, results are compared using their repr.
+        self.assertEqual(repr(d), repr(json.loads(s)))
+        self.assertEqual(
+            repr(benedict.from_json(s, lazy=True)),
+            repr(benedict.from_json(s)))
+        self.assertEqual(LazyJSONDict.decode(s).encode(self._encode), s)
+
+    def test_decode_with_depth(self):
+        s = '{"a": {"b": {"c": 1}, "d": [1]}}'
+        d = LazyJSONDict.decode(s, depth=2)
+        a = d['a']
+        self.assertTrue(isinstance(a, LazyJSONDict))
+        self.assertEqual(a.peek_items(), [('b', None), ('d', None), ])
+        self.assertEqual(a['b'], { 'c': 1 })
+        self.assertFalse(isinstance(a['b'], LazyJSONDict))
+
+    def test_dict_methods(self):
+        s = '{"a": 1, "b": 2, "c": 3}'
+        d = LazyJSONDict.decode(s)
+        self.assertEqual(d.get('a'), 1)
+        self.assertEqual(d.get('x', 0), 0)
+        self.assertEqual(d.setdefault('b', 0), 2)
+        self.assertEqual(d.pop('c'), 3)
+        self.assertEqual(d.pop('c', None), None)
+        self.assertEqual(d.popitem(), ('b', 2, ))
+        self.assertEqual(list(d.items()), [('a', 1, )])
+        self.assertEqual(list(d.values()), [1])
+        self.assertEqual(repr(LazyJSONDict.decode(s)), repr(json.loads(s)))
+        self.assertEqual(LazyJSONDict.decode(s).copy(), json.loads(s))
+        self.assertTrue(LazyJSONDict.decode(s) != {})
+
+    def test_dict_conversion(self):
+        s = '{"a": {"b": 1}, "c": [1, 2]}'
+        r = { 'a': { 'b': 1 }, 'c': [1, 2] }
+        self.assertEqual(type(dict(LazyJSONDict.decode(s))['a']), dict)
+        self.assertEqual(dict(LazyJSONDict.decode(s)), r)
+        self.assertEqual(dict(**LazyJSONDict.decode(s)), r)
+        self.assertEqual(dict(benedict(LazyJSONDict.decode(s)).dict()), r)
+        d = {}
+        d.update(LazyJSONDict.decode(s))
+        self.assertEqual(d, r)
+        self.assertEqual(clone(LazyJSONDict.decode(s), empty=True), {})
+        self.assertEqual(LazyJSONDict(), {})
+
+    def test_encode_with_other_formats(self):
+        s = '{"a": {"b": 1}, "c": [1, 2]}'
+        r = { 'a': { 'b': 1 }, 'c': [1, 2] }
+        d = benedict(LazyJSONDict.decode(s))
+        self.assertEqual(d.to_yaml(), 'a:\n  b: 1\nc:\n- 1\n- 2\n')
+        self.assertEqual(benedict.from_yaml(d.to_yaml()), r)
+        d = benedict(LazyJSONDict.decode(s))
+        self.assertEqual(benedict.from_toml(d.to_toml()), r)
+        import yaml
+        self.assertEqual(yaml.safe_dump(LazyJSONDict.decode(s)), 'a:\n  b: 1\nc:\n- 1\n- 2\n')
+
+    def test_encode_writes_untouched_values_verbatim(self):
+        s = '{"a": [ 1,2 ], "b": {"c":1}, "d": "x"}'
+        d = LazyJSONDict.decode(s)
+        self.assertEqual(d.encode(self._encode), '{"a": [ 1,2 ], "b": {"c":1}, "d": "x"}')
+        d['b']['c'] = 2
+        d['e'] = True
+        d[1] = None
+        self.assertEqual(d.encode(self._encode), '{"a": [ 1,2 ], "b": {"c": 2}, "d": "x", "e": true, "1": null}')
+
+    def test_copy_and_pickle(self):
+        s = '{"a": {"b": 1}}'
+        d = LazyJSONDict.decode(s)
+        c = copy.deepcopy(d)
+        self.assertEqual(type(c), dict)
+        self.assertEqual(c, { 'a': { 'b': 1 } })
+        p = pickle.loads(pickle.dumps(LazyJSONDict.decode(s)))
+        self.assertEqual(type(p), dict)
+        self.assertEqual(p, { 'a': { 'b': 1 } })
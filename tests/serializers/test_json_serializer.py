@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
+from benedict import benedict
 from benedict.serializers import JSONSerializer
 
+import json
 import unittest
 
 
@@ -14,3 +16,48 @@ class json_serializer_test_case(unittest.TestCase):
     def test_encode_json(self):
         # TODO
         pass
+
+    def test_encode_json_with_benedict_pointer(self):
+        r = {}
+        d = benedict(r)
+        d['a'] = 1
+        d['b.c'] = 2
+        s = JSONSerializer().encode(d, sort_keys=True)
+        self.assertEqual(s, '{"a": 1, "b": {"c": 2}}')
+
+    def test_json_c_encoder_not_disabled(self):
+        # importing benedict should not affect json encoding performance
+        # of third-party code, the C encoder must be still available.
+        self.assertTrue(json.encoder.c_make_encoder is not None)
+        r = {}
+        d = benedict(r)
+        d['a'] = 1
+        d.update({'b': 2})
+        d.setdefault('c', 3)
+        self.assertEqual(json.dumps(d, sort_keys=True),
+                         '{"a": 1, "b": 2, "c": 3}')
+        d.pop('a')
+        del d['b']
+        self.assertEqual(json.dumps(d), '{"c": 3}')
+        d.clear()
+        self.assertEqual(json.dumps(d), '{}')
+
+    def test_encode_json_with_nested_benedict(self):
+        def storage_items(d):
+            # read the dict storage directly, as third-party C encoders do.
+            if isinstance(d, dict):
+                return dict((key, storage_items(value), )
+                            for key, value in dict.items(d))
+            return d
+        r = { 'a': { 'b': { 'c': 1 } } }
+        d = benedict(r)
+        view = d['a']
+        self.assertEqual(list(dict.keys(view)), ['b'])
+        self.assertEqual(list(dict.keys(view['b'])), ['c'])
+        data = { 'x': d, 'y': [view] }
+        self.assertEqual(storage_items(data), {
+            'x': r, 'y': [{ 'b': { 'c': 1 } }],
+        })
+        r['a']['b']['c'] = 2
+        s = JSONSerializer().encode(data, sort_keys=True)
+        self.assertEqual(s, '{"x": {"a": {"b": {"c": 2}}}, "y": [{"b": {"c": 2}}]}')
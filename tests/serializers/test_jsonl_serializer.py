@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+from benedict.serializers import JSONLSerializer
+from benedict.serializers.jsonl import _get_chunks
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class jsonl_serializer_test_case(unittest.TestCase):
+
+    def setUp(self):
+        self.dir_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_path, ignore_errors=True)
+
+    def _write_lines(self, lines):
+        filepath = os.path.join(self.dir_path, 'data.jsonl')
+        with open(filepath, 'wb') as f:
+            f.write(b''.join(lines))
+        return filepath
+
+    def test_decode_jsonl(self):
+        s = '{"a": 1}\n\n  \n[1, 2]\n"b"\n'
+        serializer = JSONLSerializer()
+        self.assertEqual(serializer.decode(s), [{ 'a':1, }, [1, 2], 'b'])
+
+    def test_encode_jsonl(self):
+        serializer = JSONLSerializer()
+        s = serializer.encode(iter([{ 'a':'\n', }, [1, 2]]), indent=2)
+        self.assertEqual(s, '{"a": "\\n"}\n[1, 2]\n')
+
+    def test_get_chunks(self):
+        lines = [b'{"id": 1}\n', b'{"id": 10}\n', b'{"id": 100}\n', b'{"id": 1000}']
+        filepath = self._write_lines(lines)
+        size = sum([len(line) for line in lines])
+        for chunk_size in [1, 5, 10, 11, 25, 1024]:
+            chunks = _get_chunks(filepath, chunk_size)
+            # contiguous ranges covering the whole file.
+            self.assertEqual(chunks[0][0], 0)
+            self.assertEqual(chunks[-1][1], size)
+            for chunk, next_chunk in zip(chunks, chunks[1:]):
+                self.assertEqual(chunk[1], next_chunk[0])
+            # each range ends at the end of a line.
+            with open(filepath, 'rb') as f:
+                data = f.read()
+            for start, end in chunks[:-1]:
+                self.assertEqual(data[end - 1:end], b'\n')
+
+    def test_iter_decode_file(self):
+        lines = [u'{{"id": {}, "name": "é"}}\n'.format(i).encode('utf-8') for i in range(50)]
+        filepath = self._write_lines(lines)
+        serializer = JSONLSerializer()
+        items = list(serializer.iter_decode_file(filepath, workers=2, chunk_size=100))
+        self.assertEqual(items, [{ 'id':i, 'name':u'é', } for i in range(50)])
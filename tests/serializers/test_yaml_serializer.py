@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
+from benedict import benedict
 from benedict.serializers import YAMLSerializer
 
+from collections import OrderedDict
+from decimal import Decimal
+
 import unittest
 
 
@@ -14,3 +18,49 @@ class yaml_serializer_test_case(unittest.TestCase):
     def test_encode_yaml(self):
         # TODO
         pass
+
+    def test_safe_dump_with_benedict_after_lazy_import(self):
+        YAMLSerializer().decode('a: 1')
+        import yaml
+        d = benedict({'a': {'b': 1}})
+        self.assertEqual(yaml.safe_dump(d), 'a:\n  b: 1\n')
+
+    def test_safe_dump_with_benedict_and_c_dumper(self):
+        import yaml
+        if not hasattr(yaml, 'CSafeDumper'):
+            self.skipTest('requires pyyaml built with libyaml')
+        YAMLSerializer().decode('a: 1')
+        d = benedict({'a': {'b': 1}})
+        self.assertEqual(
+            yaml.dump(d, Dumper=yaml.CSafeDumper), 'a:\n  b: 1\n')
+
+    def test_encode_yaml_with_custom_representer(self):
+        # representers added to Dumper are used by the libyaml dumper too.
+        import yaml
+        class Point(object):
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+        yaml.add_representer(
+            Point, lambda dumper, p: dumper.represent_list([p.x, p.y]))
+        s = YAMLSerializer().encode({'p': Point(1, 2)})
+        self.assertEqual(s, 'p:\n- 1\n- 2\n')
+
+    def test_encode_yaml_with_benedict(self):
+        self.assertEqual(benedict(x=1).to_yaml(), 'x: 1\n')
+        self.assertEqual(
+            benedict({'a': {'b': [{'c': 1}]}}).to_yaml(),
+            'a:\n  b:\n  - c: 1\n')
+
+    def test_encode_yaml_with_python_types(self):
+        # python types are represented by the full dumper as before,
+        # benedict instances (also nested) are represented as plain dicts.
+        import yaml
+        d = OrderedDict([('a', (1, 2, )), ('b', Decimal('1.5'))])
+        r = { 'x': d, 'y': benedict({ 'z': [benedict(c=1)] }) }
+        s = YAMLSerializer().encode(benedict(r))
+        self.assertFalse('!!python/object/new:benedict' in s)
+        self.assertEqual(s, yaml.dump({ 'x': d, 'y': { 'z': [{ 'c': 1 }] } }))
+        self.assertTrue('!!python/tuple' in s)
+        self.assertTrue('!!python/object/apply:collections.OrderedDict' in s)
+        self.assertTrue('!!python/object/apply:decimal.Decimal' in s)
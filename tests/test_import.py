@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+import unittest
+
+
+class import_test_case(unittest.TestCase):
+
+    @staticmethod
+    def _get_imported_modules(code):
+        # use -X importtime to list all modules imported by code
+        cmd = [sys.executable, '-X', 'importtime', '-c', code]
+        output = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
+        modules = set()
+        for line in output.decode('utf-8').splitlines():
+            if not line.startswith('import time:'):
+                continue
+            module = line.rsplit('|', 1)[-1].strip()
+            modules.add(module)
+        return modules
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires -X importtime')
+    def test_import_does_not_import_heavy_dependencies(self):
+        modules = self._get_imported_modules('import benedict')
+        self.assertTrue('benedict' in modules)
+        heavy_modules = [
+            'cbor2', 'dateutil', 'fsutil', 'ftfy', 'lz4', 'MailChecker',
+            'msgpack', 'orjson', 'phonenumbers', 'requests', 'slugify', 'toml',
+            'ujson', 'xmltodict', 'yaml', 'zstandard',
+        ]
+        for module in heavy_modules:
+            self.assertFalse(
+                module in modules,
+                '{} should be imported lazily.'.format(module))
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires -X importtime')
+    def test_import_yaml_after_benedict(self):
+        modules = self._get_imported_modules(
+            'from benedict import benedict; '
+            'benedict({"a": 1}).to_yaml()')
+        self.assertTrue('yaml' in modules)
+        self.assertFalse('toml' in modules)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires module __getattr__')
+    def test_yaml_safe_dump_with_yaml_imported_from_serializer(self):
+        code = (
+            'from benedict import benedict; '
+            'from benedict.serializers.yaml import yaml; '
+            'print(yaml.safe_dump(benedict(a=1, b=benedict(c=2))))')
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.decode('utf-8').strip(), 'a: 1\nb:\n  c: 2')
@@ -26,6 +26,20 @@ class type_util_test_case(unittest.TestCase):
         self.assertFalse(f('hello world'))
         self.assertFalse(f(lambda a: a))
 
+    def test_is_bytes(self):
+        f = type_util.is_bytes
+        self.assertFalse(f(None))
+        self.assertFalse(f(True))
+        self.assertFalse(f(int(0)))
+        self.assertFalse(f(float(0.5)))
+        self.assertFalse(f(datetime.now()))
+        self.assertFalse(f([0, 1, 2]))
+        self.assertFalse(f({'a':0, 'b':1, 'c':2}))
+        self.assertFalse(f(u'hello world'))
+        self.assertTrue(f(b'hello world'))
+        self.assertTrue(f(bytearray(b'hello world')))
+        self.assertTrue(f(memoryview(b'hello world')))
+
     def test_is_collection(self):
         f = type_util.is_collection
         self.assertFalse(f(None))